@@ -1579,8 +1579,25 @@ elif page == "Sharing of Gains due to T&D Loss Reduction":
 # =============================================================================
 
 elif page == "Repayment of Master Trust Bonds":
-    st.info("⚠️ This is typically handled in the Master Trust Obligations page")
-    st.markdown("Please use the **Master Trust Obligations** page for bond repayment calculations.")
+    def bond_repay_form(sbu):
+        with st.form("bond_repay_form"):
+            col1, col2 = st.columns(2)
+            with col1:
+                annual_repayment = st.number_input("Annual Repayment (All SBUs) [Cr]", value=339.40)
+                sbu_ratio = st.number_input("SBU Allocation Ratio (%)", value=100.0, step=0.01)
+            with col2:
+                claimed_repay = st.number_input("Claimed Repayment (This SBU) [Cr]", value=339.42)
+            submitted = st.form_submit_button("🔍 Calculate Bond Repayment", use_container_width=True)
+            if submitted:
+                return {
+                    'annual_principal_repayment': annual_repayment,
+                    'sbu_allocation_ratio': sbu_ratio,
+                    'claimed_principal_repayment_sbu': claimed_repay,
+                }
+        return None
+
+    render_single_heuristic_page('bond_repayment', 'Repayment of Master Trust Bonds',
+                                 '🏛️', 'bond_repay_form', 'bond_repay', bond_repay_form)
 
 
 # =============================================================================
@@ -0,0 +1,36 @@
+"""
+Batch Math
+==========
+Array helpers shared by the NumPy batch variants of the heuristics
+(heuristic_*_batch, run_om_pipeline). They mirror the scalar guards
+`x / y * 100 if y > 0 else 0` (safe_*) and `... if y != 0 else 0`
+(nonzero_*) without evaluating the division where the guard fails.
+
+Usage:
+    variance_pct = safe_pct_array(claimed - allowable, allowable)
+    avg_rate = safe_ratio_array(cost * 100, energy_mu)
+    variance_pct = nonzero_pct_array(claimed - allowable, allowable)
+"""
+
+import numpy as np
+
+
+def safe_ratio_array(numerator, denominator) -> np.ndarray:
+    """numerator / denominator as one masked divide, zeros where denominator <= 0."""
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+    out = np.zeros(numerator.shape)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def safe_pct_array(numerator, denominator) -> np.ndarray:
+    """numerator / denominator × 100, zeros where denominator <= 0."""
+    return safe_ratio_array(numerator, denominator) * 100
+
+
+def nonzero_pct_array(numerator, denominator) -> np.ndarray:
+    """numerator / denominator × 100, zeros where denominator == 0 (signed denominators allowed)."""
+    numerator, denominator = np.broadcast_arrays(numerator, denominator)
+    out = np.zeros(numerator.shape)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out * 100
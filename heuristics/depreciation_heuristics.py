@@ -3,7 +3,123 @@ Depreciation Heuristics for SBU-G
 Contains: DEP-GEN-01
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from heuristics.batch_math import safe_pct_array
+from heuristics.lazy_steps import LazySteps
+from heuristics.result_fields import STAFF_REVIEW_DEFAULTS, flag_band
+
+# Regulation 48 depreciation rates
+RATE_13_TO_30 = 0.0142  # 1.42% on closing balance
+RATE_BELOW_13 = 0.0514  # 5.14% on average balance
+
+# Constant result fields; each call merges in only the computed ones.
+_DEP_GEN_TEMPLATE = {
+    # Identification
+    'heuristic_id': 'DEP-GEN-01',
+    'heuristic_name': 'Depreciation Calculation',
+    'line_item': 'Depreciation',
+    'regulatory_basis': 'Regulation 48, Tariff Regulations 2021',
+
+    # Metadata
+    'is_primary': True,  # PRIMARY HEURISTIC - determines approved depreciation
+    'output_type': 'approved_amount',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+# Variance flag bands on |variance %|: <=2 GREEN, <=5 YELLOW, else RED.
+# flag_band(_DEP_THRESHOLDS, abs_pct) indexes _DEP_FLAGS and _DEP_RECS.
+_DEP_THRESHOLDS = (2.0, 5.0)
+_DEP_FLAGS = ('GREEN', 'YELLOW', 'RED')
+_DEP_RECS = (
+    'Approve as calculated - within tolerance',
+    'Minor variance - verify calculation methodology',
+    'Significant variance - requires detailed scrutiny',
+)
+
+
+def _dep_gen_core(
+    gfa_13_to_30_years,
+    land_13_to_30_years,
+    grants_13_to_30_years,
+    gfa_below_13_years,
+    land_below_13_years,
+    grants_below_13_years,
+    asset_additions,
+    asset_withdrawals,
+) -> Tuple:
+    """
+    Numeric core of DEP-GEN-01 (no strings, no dicts).
+
+    Pure arithmetic, so it works element-wise on NumPy arrays as well as
+    on floats. Returns (depreciable_13_to_30, depreciation_13_to_30,
+    opening_below_13, closing_below_13, average_below_13,
+    depreciation_below_13).
+    """
+    # BUCKET 1: Assets 13-30 years (excluding land and grants)
+    depreciable_13_to_30 = gfa_13_to_30_years - land_13_to_30_years - grants_13_to_30_years
+    depreciation_13_to_30 = depreciable_13_to_30 * RATE_13_TO_30
+
+    # BUCKET 2: Assets <13 years, on average of opening and closing
+    opening_below_13 = gfa_below_13_years - land_below_13_years - grants_below_13_years
+    closing_below_13 = opening_below_13 + asset_additions - asset_withdrawals
+    average_below_13 = (opening_below_13 + closing_below_13) / 2
+    depreciation_below_13 = average_below_13 * RATE_BELOW_13
+
+    return (depreciable_13_to_30, depreciation_13_to_30,
+            opening_below_13, closing_below_13, average_below_13,
+            depreciation_below_13)
+
+
+def _render_dep_gen_steps(
+    gfa_13_to_30_years, land_13_to_30_years, grants_13_to_30_years,
+    depreciable_13_to_30, depreciation_13_to_30,
+    gfa_below_13_years, land_below_13_years, grants_below_13_years,
+    opening_below_13, asset_additions, asset_withdrawals, closing_below_13,
+    average_below_13, depreciation_below_13, total_allowable,
+    claimed_depreciation, variance_abs, variance_pct,
+) -> List[str]:
+    """Render DEP-GEN-01 calculation steps for display."""
+    return [
+        "DEPRECIATION CALCULATION (Regulation 48, Tariff Regulations 2021)",
+        "",
+        "═══ BUCKET 1: Assets 13-30 Years ═══",
+        f"Total GFA (13-30 years): ₹{gfa_13_to_30_years:.2f} Cr",
+        f"Less: Land value: ₹{land_13_to_30_years:.2f} Cr",
+        f"Less: Grants & contributions: ₹{grants_13_to_30_years:.2f} Cr",
+        f"Depreciable Assets (13-30 years): ₹{depreciable_13_to_30:.2f} Cr",
+        f"Depreciation Rate: 1.42%",
+        f"Depreciation (13-30 years): ₹{depreciation_13_to_30:.2f} Cr",
+        "",
+        "═══ BUCKET 2: Assets <13 Years ═══",
+        f"Opening GFA (<13 years): ₹{gfa_below_13_years:.2f} Cr",
+        f"Less: Land value: ₹{land_below_13_years:.2f} Cr",
+        f"Less: Grants & contributions: ₹{grants_below_13_years:.2f} Cr",
+        f"Opening Depreciable Assets: ₹{opening_below_13:.2f} Cr",
+        "",
+        f"Add: Asset additions (FY): ₹{asset_additions:.2f} Cr",
+        f"Less: Asset withdrawals: ₹{asset_withdrawals:.2f} Cr",
+        f"Closing Depreciable Assets: ₹{closing_below_13:.2f} Cr",
+        "",
+        f"Average = (Opening + Closing) / 2",
+        f"Average Depreciable Assets: ₹{average_below_13:.2f} Cr",
+        f"Depreciation Rate: 5.14%",
+        f"Depreciation (<13 years): ₹{depreciation_below_13:.2f} Cr",
+        "",
+        "═══ TOTAL DEPRECIATION ═══",
+        f"Bucket 1 (13-30 years): ₹{depreciation_13_to_30:.2f} Cr",
+        f"Bucket 2 (<13 years): ₹{depreciation_below_13:.2f} Cr",
+        f"Total Allowable Depreciation: ₹{total_allowable:.2f} Cr",
+        "",
+        f"KSEB Claimed: ₹{claimed_depreciation:.2f} Cr",
+        f"Variance: {variance_abs:+.2f} Cr ({variance_pct:+.2f}%)",
+        "",
+        "Threshold: ±2% = GREEN, ±5% = YELLOW, >5% = RED"
+    ]
+
 
 def heuristic_DEP_GEN_01(
     # Opening balances (from previous year truing-up)
@@ -47,23 +163,13 @@ def heuristic_DEP_GEN_01(
         Heuristic result dictionary with calculated depreciation
     """
     
-    # BUCKET 1: Assets 13-30 years (Depreciation @ 1.42%)
-    # Calculate depreciable assets (excluding land and grants)
-    depreciable_13_to_30 = gfa_13_to_30_years - land_13_to_30_years - grants_13_to_30_years
-    depreciation_13_to_30 = depreciable_13_to_30 * 0.0142  # 1.42%
-    
-    # BUCKET 2: Assets <13 years (Depreciation @ 5.14% on average)
-    # Opening depreciable assets
-    opening_below_13 = gfa_below_13_years - land_below_13_years - grants_below_13_years
-    
-    # Closing depreciable assets (opening + additions - withdrawals)
-    closing_below_13 = opening_below_13 + asset_additions - asset_withdrawals
-    
-    # Average of opening and closing
-    average_below_13 = (opening_below_13 + closing_below_13) / 2
-    
-    # Depreciation @ 5.14%
-    depreciation_below_13 = average_below_13 * 0.0514  # 5.14%
+    (depreciable_13_to_30, depreciation_13_to_30,
+     opening_below_13, closing_below_13, average_below_13,
+     depreciation_below_13) = _dep_gen_core(
+        gfa_13_to_30_years, land_13_to_30_years, grants_13_to_30_years,
+        gfa_below_13_years, land_below_13_years, grants_below_13_years,
+        asset_additions, asset_withdrawals
+    )
     
     # TOTAL ALLOWABLE DEPRECIATION
     total_allowable = depreciation_13_to_30 + depreciation_below_13
@@ -73,59 +179,22 @@ def heuristic_DEP_GEN_01(
     variance_pct = (variance_abs / total_allowable) * 100 if total_allowable > 0 else 0
     
     # Flag determination
-    if abs(variance_pct) <= 2:
-        flag = 'GREEN'
-        recommendation = 'Approve as calculated - within tolerance'
-    elif abs(variance_pct) <= 5:
-        flag = 'YELLOW'
-        recommendation = 'Minor variance - verify calculation methodology'
-    else:
-        flag = 'RED'
-        recommendation = 'Significant variance - requires detailed scrutiny'
+    band = flag_band(_DEP_THRESHOLDS, abs(variance_pct))
+    flag = _DEP_FLAGS[band]
+    recommendation = _DEP_RECS[band]
     
-    # Calculation steps for display
-    calc_steps = [
-        "DEPRECIATION CALCULATION (Regulation 48, Tariff Regulations 2021)",
-        "",
-        "═══ BUCKET 1: Assets 13-30 Years ═══",
-        f"Total GFA (13-30 years): ₹{gfa_13_to_30_years:.2f} Cr",
-        f"Less: Land value: ₹{land_13_to_30_years:.2f} Cr",
-        f"Less: Grants & contributions: ₹{grants_13_to_30_years:.2f} Cr",
-        f"Depreciable Assets (13-30 years): ₹{depreciable_13_to_30:.2f} Cr",
-        f"Depreciation Rate: 1.42%",
-        f"Depreciation (13-30 years): ₹{depreciation_13_to_30:.2f} Cr",
-        "",
-        "═══ BUCKET 2: Assets <13 Years ═══",
-        f"Opening GFA (<13 years): ₹{gfa_below_13_years:.2f} Cr",
-        f"Less: Land value: ₹{land_below_13_years:.2f} Cr",
-        f"Less: Grants & contributions: ₹{grants_below_13_years:.2f} Cr",
-        f"Opening Depreciable Assets: ₹{opening_below_13:.2f} Cr",
-        "",
-        f"Add: Asset additions (FY): ₹{asset_additions:.2f} Cr",
-        f"Less: Asset withdrawals: ₹{asset_withdrawals:.2f} Cr",
-        f"Closing Depreciable Assets: ₹{closing_below_13:.2f} Cr",
-        "",
-        f"Average = (Opening + Closing) / 2",
-        f"Average Depreciable Assets: ₹{average_below_13:.2f} Cr",
-        f"Depreciation Rate: 5.14%",
-        f"Depreciation (<13 years): ₹{depreciation_below_13:.2f} Cr",
-        "",
-        "═══ TOTAL DEPRECIATION ═══",
-        f"Bucket 1 (13-30 years): ₹{depreciation_13_to_30:.2f} Cr",
-        f"Bucket 2 (<13 years): ₹{depreciation_below_13:.2f} Cr",
-        f"Total Allowable Depreciation: ₹{total_allowable:.2f} Cr",
-        "",
-        f"KSEB Claimed: ₹{claimed_depreciation:.2f} Cr",
-        f"Variance: {variance_abs:+.2f} Cr ({variance_pct:+.2f}%)",
-        "",
-        "Threshold: ±2% = GREEN, ±5% = YELLOW, >5% = RED"
-    ]
+    calc_steps = LazySteps(
+        _render_dep_gen_steps,
+        gfa_13_to_30_years, land_13_to_30_years, grants_13_to_30_years,
+        depreciable_13_to_30, depreciation_13_to_30,
+        gfa_below_13_years, land_below_13_years, grants_below_13_years,
+        opening_below_13, asset_additions, asset_withdrawals, closing_below_13,
+        average_below_13, depreciation_below_13, total_allowable,
+        claimed_depreciation, variance_abs, variance_pct,
+    )
     
     return {
-        # Identification
-        'heuristic_id': 'DEP-GEN-01',
-        'heuristic_name': 'Depreciation Calculation',
-        'line_item': 'Depreciation',
+        **_DEP_GEN_TEMPLATE,
         
         # Calculation Results
         'claimed_value': claimed_depreciation,
@@ -137,7 +206,6 @@ def heuristic_DEP_GEN_01(
         'flag': flag,
         'recommended_amount': total_allowable,
         'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation 48, Tariff Regulations 2021',
         
         # Calculation Details
         'calculation_steps': calc_steps,
@@ -149,7 +217,7 @@ def heuristic_DEP_GEN_01(
                 'land': land_13_to_30_years,
                 'grants': grants_13_to_30_years,
                 'depreciable': depreciable_13_to_30,
-                'rate': 0.0142,
+                'rate': RATE_13_TO_30,
                 'depreciation': depreciation_13_to_30
             },
             'bucket_below_13': {
@@ -161,24 +229,56 @@ def heuristic_DEP_GEN_01(
                 'withdrawals': asset_withdrawals,
                 'depreciable_closing': closing_below_13,
                 'depreciable_average': average_below_13,
-                'rate': 0.0514,
+                'rate': RATE_BELOW_13,
                 'depreciation': depreciation_below_13
             },
             'total': total_allowable
         },
         
-        # Staff Review Section
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        
         # Dependencies
         'depends_on': [],  # Independent calculation
-        
-        # Metadata
-        'is_primary': True,  # PRIMARY HEURISTIC - determines approved depreciation
-        'output_type': 'approved_amount'
+    }
+
+
+def heuristic_DEP_GEN_01_batch(
+    gfa_13_to_30_years,
+    land_13_to_30_years,
+    grants_13_to_30_years,
+    gfa_below_13_years,
+    land_below_13_years,
+    grants_below_13_years,
+    asset_additions,
+    claimed_depreciation,
+    asset_withdrawals=0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized DEP-GEN-01 over 1-D arrays (one element per asset book).
+
+    Runs _dep_gen_core on whole arrays and applies the same ±2% / ±5%
+    flag thresholds as heuristic_DEP_GEN_01. Returns a dict of arrays.
+    """
+    args = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            gfa_13_to_30_years, land_13_to_30_years, grants_13_to_30_years,
+            gfa_below_13_years, land_below_13_years, grants_below_13_years,
+            asset_additions, asset_withdrawals, claimed_depreciation))
+    )
+    claimed = args[-1]
+    (depreciable_13_to_30, depreciation_13_to_30,
+     opening_below_13, closing_below_13, average_below_13,
+     depreciation_below_13) = _dep_gen_core(*args[:-1])
+
+    total_allowable = depreciation_13_to_30 + depreciation_below_13
+    variance_abs = claimed - total_allowable
+    variance_pct = safe_pct_array(variance_abs, total_allowable)
+
+    flag = np.take(_DEP_FLAGS, np.searchsorted(_DEP_THRESHOLDS, np.abs(variance_pct), side='left'))
+
+    return {
+        'depreciation_13_to_30': depreciation_13_to_30,
+        'depreciation_below_13': depreciation_below_13,
+        'total_allowable': total_allowable,
+        'variance_absolute': variance_abs,
+        'variance_percentage': variance_pct,
+        'flag': flag,
     }
\ No newline at end of file
@@ -12,9 +12,73 @@ Distribution-specific Heuristics for SBU-D Truing-Up Assessment
 
 Based on FY 2023-24 KSERC Truing-Up Order, Chapter 5.
 OUTPUT SCHEMA: Standardized dict (same as all SBU heuristics).
+
+Summary-only callers (dashboard tiles, aggregation) can pass the
+keyword-only include_steps=False / include_details=False to get an empty
+calculation_steps list and no *_details breakdown.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from heuristics.batch_math import safe_pct_array, safe_ratio_array
+from heuristics.lazy_steps import LazySteps
+from heuristics.result_cache import cached_result
+from heuristics.result_fields import STAFF_REVIEW_DEFAULTS, flag_band
+
+# Three-band flag tables: flag_band(thresholds, x) indexes _FLAGS and
+# the heuristic's recommendation templates (upper edges inclusive).
+_FLAGS = ('GREEN', 'YELLOW', 'RED')
+_PP_COST_THRESHOLDS = (2.0, 5.0)     # |total variance %|
+_DIST_LOSS_THRESHOLDS = (0.0, 0.5)   # variance vs target, percentage points
+
+# Unit conversions, each applied as one (exactly rounded) division.
+# Kept as divisors rather than reciprocals: 0.1 / 0.01 are inexact in
+# binary, and multiplying by them shifts 2-dp results on half-paisa ties.
+_LAKH_PER_CR = 100                   # Rs. Lakh → Rs. Cr
+_LAKH_PER_1000_PER_CR = 1000 * 100   # Rs. Lakh per 1000 units → Rs. Cr per unit
+_RS_PER_UNIT_MU_PER_CR = 10          # Rs/unit × MU (10^6 units) → Rs. Cr (10^7)
+
+
+def _safe_pct(numerator: float, denominator: float) -> float:
+    """numerator / denominator × 100, or 0 when the denominator is not positive."""
+    return (numerator / denominator * 100) if denominator > 0 else 0
+
+
+def _assemble_result(
+    template: Dict,
+    claimed: float,
+    allowable: float,
+    variance_abs: float,
+    variance_pct: Optional[float],
+    flag: str,
+    recommendation: str,
+    calc_steps,
+    depends_on: Tuple[str, ...] = (),
+) -> Dict:
+    """
+    Standard result dict shared by the SBU-D heuristics.
+
+    Merges the heuristic's constant template with its computed figures,
+    rounded to 2 dp. Amount-based heuristics (output_type
+    'approved_amount') recommend the allowable value; assessments
+    recommend no amount.
+    """
+    allowable = round(allowable, 2)
+    return {
+        **template,
+        'claimed_value': round(claimed, 2),
+        'allowable_value': allowable,
+        'variance_absolute': round(variance_abs, 2),
+        'variance_percentage': None if variance_pct is None else round(variance_pct, 2),
+        'flag': flag,
+        'recommended_amount': allowable if template['output_type'] == 'approved_amount' else None,
+        'recommendation_text': recommendation,
+        'calculation_steps': calc_steps,
+        'depends_on': list(depends_on),
+    }
 
 
 # ============================================================================
@@ -155,6 +219,121 @@ FY_2023_24_TD_SHARE_DEFAULTS = {
 # HEURISTIC 1: PP-COST-01 - Power Purchase Cost Validation
 # ============================================================================
 
+# Constant result fields; each call merges in only the computed ones.
+_PP_COST_TEMPLATE = {
+    'heuristic_id': 'PP-COST-01',
+    'heuristic_name': 'Power Purchase Cost Validation',
+    'line_item': 'Power Purchase Cost',
+    'regulatory_basis': 'Regulations 77-78, Tariff Regulations 2021',
+    'is_primary': True,
+    'output_type': 'approved_amount',
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_PP_COST_RECS = (
+    "Approve total power cost at ₹{total_approved:.2f} Cr. Variance within normal range.",
+    "Approve ₹{total_approved:.2f} Cr. Disallowance of ₹{total_variance:.2f} Cr mainly from "
+    "banking/swap (₹{banking_swap_disallowed:.2f} Cr) and SBU transfer cost adjustments.",
+    "Significant disallowance of ₹{total_variance:.2f} Cr. Review external PP components, "
+    "especially exchange purchases (TAM rate ₹8.30/unit vs DAM ₹5.18/unit) and banking.",
+)
+
+
+def _pp_cost_core(
+    cost_of_generation_sbug_claimed,
+    cost_of_generation_sbug_approved,
+    cost_of_transmission_sbut_claimed,
+    cost_of_transmission_sbut_approved,
+    external_pp_claimed,
+    external_pp_approved,
+    myt_approved_total_pp,
+) -> Tuple:
+    """
+    Numeric core of PP-COST-01 (no strings, no dicts, no branches).
+
+    Array-safe. Returns (total_claimed, total_approved, total_variance,
+    ext_variance, myt_deviation); the guarded percentages are left to
+    the caller.
+    """
+    total_claimed = (cost_of_generation_sbug_claimed +
+                     cost_of_transmission_sbut_claimed +
+                     external_pp_claimed)
+    total_approved = (cost_of_generation_sbug_approved +
+                      cost_of_transmission_sbut_approved +
+                      external_pp_approved)
+    total_variance = total_claimed - total_approved
+    ext_variance = external_pp_claimed - external_pp_approved
+    myt_deviation = external_pp_approved - myt_approved_total_pp
+    return total_claimed, total_approved, total_variance, ext_variance, myt_deviation
+
+
+# Step text for PP-COST-01; fields are _render_pp_cost_steps() locals.
+_PP_COST_STEPS_TEMPLATE = "\n".join((
+    "═══ POWER PURCHASE COST VALIDATION (SBU-D) ═══",
+    "",
+    "Component 1: Transfer Cost of SBU-G (Internal Generation)",
+    "  Claimed: ₹{cost_of_generation_sbug_claimed:.2f} Cr",
+    "  Approved (Ch.2): ₹{cost_of_generation_sbug_approved:.2f} Cr",
+    "  Variance: ₹{sbug_variance:+.2f} Cr",
+    "",
+    "Component 2: Transfer Cost of SBU-T (Intra-state Transmission)",
+    "  Claimed: ₹{cost_of_transmission_sbut_claimed:.2f} Cr",
+    "  Approved (Ch.3): ₹{cost_of_transmission_sbut_approved:.2f} Cr",
+    "  Variance: ₹{sbut_variance:+.2f} Cr",
+    "",
+    "Component 3: External Power Purchase",
+    "  Claimed: ₹{external_pp_claimed:.2f} Cr",
+    "  Approved: ₹{external_pp_approved:.2f} Cr",
+    "  Variance: ₹{ext_variance:+.2f} Cr ({ext_variance_pct:+.2f}%)",
+    "",
+    "Key sub-items:",
+    "  CGS: ₹{cgs_cost:.2f} Cr",
+    "  LTA (Maithon/DVC/DBFOO): ₹{lta_total_cost:.2f} Cr",
+    "  Exchanges: ₹{exchange_cost:.2f} Cr",
+    "  Interstate Transmission: ₹{interstate_transmission:.2f} Cr",
+    "  Banking/Swap Disallowed: ₹{banking_swap_disallowed:.2f} Cr",
+    "",
+    "═══ TOTALS ═══",
+    "Total Claimed: ₹{total_claimed:.2f} Cr",
+    "Total Approved: ₹{total_approved:.2f} Cr",
+    "Total Variance: ₹{total_variance:+.2f} Cr ({total_variance_pct:+.2f}%)",
+    "",
+    "MYT Approved PP: ₹{myt_approved_total_pp:.2f} Cr",
+    "Deviation from MYT: ₹{myt_deviation:+.2f} Cr ({myt_deviation_pct:+.2f}%)",
+    "Energy Purchased: {total_energy_purchased_mu:,.2f} MU",
+))
+
+
+def _render_pp_cost_steps(
+    cost_of_generation_sbug_claimed: float,
+    cost_of_generation_sbug_approved: float,
+    cost_of_transmission_sbut_claimed: float,
+    cost_of_transmission_sbut_approved: float,
+    external_pp_claimed: float,
+    external_pp_approved: float,
+    ext_variance: float,
+    ext_variance_pct: float,
+    cgs_cost: float,
+    lta_total_cost: float,
+    exchange_cost: float,
+    interstate_transmission: float,
+    banking_swap_disallowed: float,
+    total_claimed: float,
+    total_approved: float,
+    total_variance: float,
+    total_variance_pct: float,
+    myt_approved_total_pp: float,
+    myt_deviation: float,
+    myt_deviation_pct: float,
+    total_energy_purchased_mu: float,
+) -> List[str]:
+    """Render PP-COST-01 calculation steps."""
+    sbug_variance = cost_of_generation_sbug_claimed - cost_of_generation_sbug_approved
+    sbut_variance = cost_of_transmission_sbut_claimed - cost_of_transmission_sbut_approved
+    return _PP_COST_STEPS_TEMPLATE.format_map(locals()).split("\n")
+
+
+@cached_result(maxsize=512)
 def heuristic_PP_COST_01(
     # SBU transfer costs
     cost_of_generation_sbug_claimed: float = 626.48,
@@ -174,6 +353,9 @@ def heuristic_PP_COST_01(
     total_energy_purchased_mu: float = 25711.29,
     myt_approved_total_pp: float = 10564.23,
     myt_approved_avg_rate: float = 4.66,
+    *,
+    include_steps: bool = True,
+    include_details: bool = True,
 ) -> Dict:
     """
     PP-COST-01: Power Purchase Cost Validation
@@ -188,105 +370,52 @@ def heuristic_PP_COST_01(
     - External PP: source-wise validation, banking swap disallowance
     - Average PP cost comparison with MYT projection
     """
-    # Total claimed and approved
-    total_claimed = (cost_of_generation_sbug_claimed +
-                     cost_of_transmission_sbut_claimed +
-                     external_pp_claimed)
-    total_approved = (cost_of_generation_sbug_approved +
-                      cost_of_transmission_sbut_approved +
-                      external_pp_approved)
-    total_variance = total_claimed - total_approved
-    total_variance_pct = (total_variance / total_approved * 100) if total_approved > 0 else 0
+    # Totals, external PP variance and MYT deviation
+    (total_claimed, total_approved, total_variance,
+     ext_variance, myt_deviation) = _pp_cost_core(
+        cost_of_generation_sbug_claimed, cost_of_generation_sbug_approved,
+        cost_of_transmission_sbut_claimed, cost_of_transmission_sbut_approved,
+        external_pp_claimed, external_pp_approved, myt_approved_total_pp,
+    )
+    total_variance_pct = _safe_pct(total_variance, total_approved)
 
     # Average PP cost
     if total_energy_purchased_mu > 0:
-        actual_avg_rate = external_pp_approved / (total_energy_purchased_mu / 100)  # Rs/kWh approx
+        actual_avg_rate = external_pp_approved * 100 / total_energy_purchased_mu  # Rs/kWh approx
     else:
         actual_avg_rate = 0
 
     # External PP variance
-    ext_variance = external_pp_claimed - external_pp_approved
-    ext_variance_pct = (ext_variance / external_pp_approved * 100) if external_pp_approved > 0 else 0
+    ext_variance_pct = _safe_pct(ext_variance, external_pp_approved)
 
     # MYT deviation
-    myt_deviation = external_pp_approved - myt_approved_total_pp
-    myt_deviation_pct = (myt_deviation / myt_approved_total_pp * 100) if myt_approved_total_pp > 0 else 0
-
-    calc_steps = [
-        "═══ POWER PURCHASE COST VALIDATION (SBU-D) ═══",
-        "",
-        "Component 1: Transfer Cost of SBU-G (Internal Generation)",
-        f"  Claimed: ₹{cost_of_generation_sbug_claimed:.2f} Cr",
-        f"  Approved (Ch.2): ₹{cost_of_generation_sbug_approved:.2f} Cr",
-        f"  Variance: ₹{cost_of_generation_sbug_claimed - cost_of_generation_sbug_approved:+.2f} Cr",
-        "",
-        "Component 2: Transfer Cost of SBU-T (Intra-state Transmission)",
-        f"  Claimed: ₹{cost_of_transmission_sbut_claimed:.2f} Cr",
-        f"  Approved (Ch.3): ₹{cost_of_transmission_sbut_approved:.2f} Cr",
-        f"  Variance: ₹{cost_of_transmission_sbut_claimed - cost_of_transmission_sbut_approved:+.2f} Cr",
-        "",
-        "Component 3: External Power Purchase",
-        f"  Claimed: ₹{external_pp_claimed:.2f} Cr",
-        f"  Approved: ₹{external_pp_approved:.2f} Cr",
-        f"  Variance: ₹{ext_variance:+.2f} Cr ({ext_variance_pct:+.2f}%)",
-        "",
-        "Key sub-items:",
-        f"  CGS: ₹{cgs_cost:.2f} Cr",
-        f"  LTA (Maithon/DVC/DBFOO): ₹{lta_total_cost:.2f} Cr",
-        f"  Exchanges: ₹{exchange_cost:.2f} Cr",
-        f"  Interstate Transmission: ₹{interstate_transmission:.2f} Cr",
-        f"  Banking/Swap Disallowed: ₹{banking_swap_disallowed:.2f} Cr",
-        "",
-        "═══ TOTALS ═══",
-        f"Total Claimed: ₹{total_claimed:.2f} Cr",
-        f"Total Approved: ₹{total_approved:.2f} Cr",
-        f"Total Variance: ₹{total_variance:+.2f} Cr ({total_variance_pct:+.2f}%)",
-        "",
-        f"MYT Approved PP: ₹{myt_approved_total_pp:.2f} Cr",
-        f"Deviation from MYT: ₹{myt_deviation:+.2f} Cr ({myt_deviation_pct:+.2f}%)",
-        f"Energy Purchased: {total_energy_purchased_mu:,.2f} MU",
-    ]
+    myt_deviation_pct = _safe_pct(myt_deviation, myt_approved_total_pp)
+
+    calc_steps = LazySteps(
+        _render_pp_cost_steps,
+        cost_of_generation_sbug_claimed, cost_of_generation_sbug_approved,
+        cost_of_transmission_sbut_claimed, cost_of_transmission_sbut_approved,
+        external_pp_claimed, external_pp_approved, ext_variance, ext_variance_pct,
+        cgs_cost, lta_total_cost, exchange_cost, interstate_transmission,
+        banking_swap_disallowed, total_claimed, total_approved, total_variance,
+        total_variance_pct, myt_approved_total_pp, myt_deviation, myt_deviation_pct,
+        total_energy_purchased_mu,
+    ) if include_steps else []
 
     # Flag determination
-    if abs(total_variance_pct) <= 2:
-        flag = 'GREEN'
-        recommendation = f"Approve total power cost at ₹{total_approved:.2f} Cr. Variance within normal range."
-    elif abs(total_variance_pct) <= 5:
-        flag = 'YELLOW'
-        recommendation = (
-            f"Approve ₹{total_approved:.2f} Cr. Disallowance of ₹{total_variance:.2f} Cr mainly from "
-            f"banking/swap (₹{banking_swap_disallowed:.2f} Cr) and SBU transfer cost adjustments."
-        )
-    else:
-        flag = 'RED'
-        recommendation = (
-            f"Significant disallowance of ₹{total_variance:.2f} Cr. Review external PP components, "
-            f"especially exchange purchases (TAM rate ₹8.30/unit vs DAM ₹5.18/unit) and banking."
-        )
+    band = flag_band(_PP_COST_THRESHOLDS, abs(total_variance_pct))
+    flag = _FLAGS[band]
+    recommendation = _PP_COST_RECS[band].format(
+        total_approved=total_approved, total_variance=total_variance,
+        banking_swap_disallowed=banking_swap_disallowed,
+    )
 
-    return {
-        'heuristic_id': 'PP-COST-01',
-        'heuristic_name': 'Power Purchase Cost Validation',
-        'line_item': 'Power Purchase Cost',
-        'claimed_value': round(total_claimed, 2),
-        'allowable_value': round(total_approved, 2),
-        'variance_absolute': round(total_variance, 2),
-        'variance_percentage': round(total_variance_pct, 2),
-        'flag': flag,
-        'recommended_amount': round(total_approved, 2),
-        'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulations 77-78, Tariff Regulations 2021',
-        'calculation_steps': calc_steps,
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        'depends_on': [],
-        'is_primary': True,
-        'output_type': 'approved_amount',
-        'pp_details': {
+    result = _assemble_result(
+        _PP_COST_TEMPLATE, total_claimed, total_approved,
+        total_variance, total_variance_pct, flag, recommendation, calc_steps,
+    )
+    if include_details:
+        result['pp_details'] = {
             'sbug_approved': cost_of_generation_sbug_approved,
             'sbut_approved': cost_of_transmission_sbut_approved,
             'external_pp_approved': external_pp_approved,
@@ -294,13 +423,154 @@ def heuristic_PP_COST_01(
             'myt_deviation_cr': round(myt_deviation, 2),
             'myt_deviation_pct': round(myt_deviation_pct, 2),
         }
-    }
+    return result
 
 
 # ============================================================================
 # HEURISTIC 2: OM-DIST-NORM-01 - Distribution O&M Norms
 # ============================================================================
 
+_OM_DIST_NORM_TEMPLATE = {
+    'heuristic_id': 'OM-DIST-NORM-01',
+    'heuristic_name': 'Distribution O&M Norms',
+    'line_item': 'O&M Expenses (Distribution)',
+    'regulatory_basis': 'Regulation 80 + Annexure-7, Tariff Regulations 2021',
+    'is_primary': True,
+    'output_type': 'approved_amount',
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_OM_DIST_NORM_REC_WITHIN = "Approve total O&M at ₹{normative:.2f} Cr as per norms."
+_OM_DIST_NORM_REC_ABOVE = (
+    "Cap O&M to normative ₹{normative:.2f} Cr. "
+    "KSEB claimed ₹{claimed:.2f} Cr exceeds norms by ₹{variance:.2f} Cr."
+)
+_OM_DIST_NORM_REC_BELOW = "Claimed ₹{claimed:.2f} Cr is below normative ₹{normative:.2f} Cr."
+
+
+def _om_dist_norm_core(
+    num_consumers,
+    num_dtrs,
+    ht_line_km,
+    lt_line_km,
+    energy_sales_mu,
+    norm_per_1000_consumers,
+    norm_per_dtr,
+    norm_per_ht_km,
+    norm_per_lt_km,
+    norm_per_mu,
+    gfa_sbu_d_opening,
+    gfa_derecognized,
+    gfa_land,
+    rm_rate,
+) -> Tuple:
+    """
+    Numeric core of OM-DIST-NORM-01 (no strings, no dicts).
+
+    Pure arithmetic, so it works element-wise on NumPy arrays as well as
+    on scalars. Returns (cost_consumers, cost_dtrs, cost_ht, cost_lt,
+    cost_energy, total_employee_ag, net_gfa, rm_allowable,
+    total_normative_om).
+    """
+    # A. Employee + A&G calculation (Table 5.76)
+    # Norms are in Rs. Lakh per unit, multiply by quantity, convert to Cr
+    cost_consumers = norm_per_1000_consumers * num_consumers / _LAKH_PER_1000_PER_CR
+    cost_dtrs = norm_per_dtr * num_dtrs / _LAKH_PER_CR
+    cost_ht = norm_per_ht_km * ht_line_km / _LAKH_PER_CR
+    cost_lt = norm_per_lt_km * lt_line_km / _LAKH_PER_CR
+    cost_energy = norm_per_mu * energy_sales_mu / _RS_PER_UNIT_MU_PER_CR
+
+    total_employee_ag = cost_consumers + cost_dtrs + cost_ht + cost_lt + cost_energy
+
+    # B. R&M calculation (Table 5.77)
+    net_gfa = gfa_sbu_d_opening - gfa_derecognized - gfa_land
+    rm_allowable = net_gfa * rm_rate
+
+    # Total normative O&M
+    total_normative_om = total_employee_ag + rm_allowable
+
+    return (cost_consumers, cost_dtrs, cost_ht, cost_lt, cost_energy,
+            total_employee_ag, net_gfa, rm_allowable, total_normative_om)
+
+
+# Step text for OM-DIST-NORM-01; fields are _render_om_dist_norm_steps() locals.
+_OM_DIST_NORM_STEPS_TEMPLATE = "\n".join((
+    "═══ DISTRIBUTION O&M NORMS (Regulation 80, Annexure-7) ═══",
+    "",
+    "A. EMPLOYEE + A&G EXPENSES (5-parameter formula)",
+    "   Ratio: Consumers(20%) : DTRs(25%) : HT(20%) : LT(20%) : Energy(15%)",
+    "   Norms escalated by actual CPI:WPI (70:30) from base year 2021-22",
+    "",
+    "   1. Consumers: {num_consumers:,} × ₹{norm_per_1000_consumers:.3f} L/1000",
+    "      = ₹{cost_consumers:.2f} Cr",
+    "   2. DTRs: {num_dtrs:,} × ₹{norm_per_dtr:.3f} L/DTr",
+    "      = ₹{cost_dtrs:.2f} Cr",
+    "   3. HT Lines: {ht_line_km:,.0f} km × ₹{norm_per_ht_km:.3f} L/km",
+    "      = ₹{cost_ht:.2f} Cr",
+    "   4. LT Lines: {lt_line_km:,.0f} km × ₹{norm_per_lt_km:.3f} L/km",
+    "      = ₹{cost_lt:.2f} Cr",
+    "   5. Energy Sales: {energy_sales_mu:,.0f} MU × ₹{norm_per_mu:.3f}/unit",
+    "      = ₹{cost_energy:.2f} Cr",
+    "   Total Employee + A&G: ₹{total_employee_ag:.2f} Cr",
+    "   Claimed: ₹{claimed_employee_ag:.2f} Cr | Variance: ₹{employee_ag_variance:+.2f} Cr",
+    "",
+    "B. R&M EXPENSES (4% of net opening GFA)",
+    "   Opening GFA SBU-D: ₹{gfa_sbu_d_opening:.2f} Cr",
+    "   Less: Derecognized (natural calamities): ₹{gfa_derecognized:.2f} Cr",
+    "   Less: Land: ₹{gfa_land:.2f} Cr",
+    "   Net GFA: ₹{net_gfa:.2f} Cr",
+    "   R&M @ {rm_rate_pct:.1f}%: ₹{rm_allowable:.2f} Cr",
+    "   Claimed: ₹{claimed_rm:.2f} Cr | Variance: ₹{rm_variance:+.2f} Cr",
+    "",
+    "═══ TOTAL O&M ═══",
+    "   Normative: ₹{total_normative_om:.2f} Cr",
+    "   Claimed: ₹{claimed_total_om:.2f} Cr",
+    "   Variance: ₹{total_variance:+.2f} Cr ({total_variance_pct:+.2f}%)",
+    "   MYT Approved: ₹{myt_approved_om:.2f} Cr",
+    "",
+    "Note: Energy sales adjusted to 25,255 MU (excl surplus sale, incl prosumer return)",
+))
+
+
+def _render_om_dist_norm_steps(
+    num_consumers: int,
+    num_dtrs: int,
+    ht_line_km: float,
+    lt_line_km: float,
+    energy_sales_mu: float,
+    norm_per_1000_consumers: float,
+    norm_per_dtr: float,
+    norm_per_ht_km: float,
+    norm_per_lt_km: float,
+    norm_per_mu: float,
+    cost_consumers: float,
+    cost_dtrs: float,
+    cost_ht: float,
+    cost_lt: float,
+    cost_energy: float,
+    total_employee_ag: float,
+    claimed_employee_ag: float,
+    employee_ag_variance: float,
+    gfa_sbu_d_opening: float,
+    gfa_derecognized: float,
+    gfa_land: float,
+    net_gfa: float,
+    rm_rate: float,
+    rm_allowable: float,
+    claimed_rm: float,
+    rm_variance: float,
+    total_normative_om: float,
+    claimed_total_om: float,
+    total_variance: float,
+    total_variance_pct: float,
+    myt_approved_om: float,
+) -> List[str]:
+    """Render OM-DIST-NORM-01 calculation steps."""
+    rm_rate_pct = rm_rate * 100
+    return _OM_DIST_NORM_STEPS_TEMPLATE.format_map(locals()).split("\n")
+
+
+@cached_result(maxsize=512)
 def heuristic_OM_DIST_NORM_01(
     # Distribution parameters (Table 5.75)
     num_consumers: int = 13648851,
@@ -324,6 +594,9 @@ def heuristic_OM_DIST_NORM_01(
     claimed_rm: float = 631.28,
     claimed_total_om: float = 3783.56,
     myt_approved_om: float = 3605.39,
+    *,
+    include_steps: bool = True,
+    include_details: bool = True,
 ) -> Dict:
     """
     OM-DIST-NORM-01: Normative O&M for Distribution (Regulation 80)
@@ -342,103 +615,49 @@ def heuristic_OM_DIST_NORM_01(
     - GFA: Deducted ₹805.39 Cr for assets damaged in natural calamities
     """
 
-    # A. Employee + A&G calculation (Table 5.76)
-    # Norms are in Rs. Lakh per unit, multiply by quantity, convert to Cr
-    cost_consumers = (norm_per_1000_consumers * num_consumers / 1000) / 100  # Lakh to Cr
-    cost_dtrs = (norm_per_dtr * num_dtrs) / 100
-    cost_ht = (norm_per_ht_km * ht_line_km) / 100
-    cost_lt = (norm_per_lt_km * lt_line_km) / 100
-    cost_energy = norm_per_mu * energy_sales_mu / 10  # Rs/unit × MU(10^6 units) / 10^7(Cr) = Cr
-
-    total_employee_ag = cost_consumers + cost_dtrs + cost_ht + cost_lt + cost_energy
-
-    # B. R&M calculation (Table 5.77)
-    net_gfa = gfa_sbu_d_opening - gfa_derecognized - gfa_land
-    rm_allowable = net_gfa * rm_rate
-
-    # Total normative O&M
-    total_normative_om = total_employee_ag + rm_allowable
+    (cost_consumers, cost_dtrs, cost_ht, cost_lt, cost_energy,
+     total_employee_ag, net_gfa, rm_allowable, total_normative_om) = _om_dist_norm_core(
+        num_consumers, num_dtrs, ht_line_km, lt_line_km, energy_sales_mu,
+        norm_per_1000_consumers, norm_per_dtr, norm_per_ht_km, norm_per_lt_km, norm_per_mu,
+        gfa_sbu_d_opening, gfa_derecognized, gfa_land, rm_rate,
+    )
 
     # Variances
     employee_ag_variance = claimed_employee_ag - total_employee_ag
     rm_variance = claimed_rm - rm_allowable
     total_variance = claimed_total_om - total_normative_om
-    total_variance_pct = (total_variance / total_normative_om * 100) if total_normative_om > 0 else 0
-
-    calc_steps = [
-        "═══ DISTRIBUTION O&M NORMS (Regulation 80, Annexure-7) ═══",
-        "",
-        "A. EMPLOYEE + A&G EXPENSES (5-parameter formula)",
-        "   Ratio: Consumers(20%) : DTRs(25%) : HT(20%) : LT(20%) : Energy(15%)",
-        "   Norms escalated by actual CPI:WPI (70:30) from base year 2021-22",
-        "",
-        f"   1. Consumers: {num_consumers:,} × ₹{norm_per_1000_consumers:.3f} L/1000",
-        f"      = ₹{cost_consumers:.2f} Cr",
-        f"   2. DTRs: {num_dtrs:,} × ₹{norm_per_dtr:.3f} L/DTr",
-        f"      = ₹{cost_dtrs:.2f} Cr",
-        f"   3. HT Lines: {ht_line_km:,.0f} km × ₹{norm_per_ht_km:.3f} L/km",
-        f"      = ₹{cost_ht:.2f} Cr",
-        f"   4. LT Lines: {lt_line_km:,.0f} km × ₹{norm_per_lt_km:.3f} L/km",
-        f"      = ₹{cost_lt:.2f} Cr",
-        f"   5. Energy Sales: {energy_sales_mu:,.0f} MU × ₹{norm_per_mu:.3f}/unit",
-        f"      = ₹{cost_energy:.2f} Cr",
-        f"   Total Employee + A&G: ₹{total_employee_ag:.2f} Cr",
-        f"   Claimed: ₹{claimed_employee_ag:.2f} Cr | Variance: ₹{employee_ag_variance:+.2f} Cr",
-        "",
-        "B. R&M EXPENSES (4% of net opening GFA)",
-        f"   Opening GFA SBU-D: ₹{gfa_sbu_d_opening:.2f} Cr",
-        f"   Less: Derecognized (natural calamities): ₹{gfa_derecognized:.2f} Cr",
-        f"   Less: Land: ₹{gfa_land:.2f} Cr",
-        f"   Net GFA: ₹{net_gfa:.2f} Cr",
-        f"   R&M @ {rm_rate*100:.1f}%: ₹{rm_allowable:.2f} Cr",
-        f"   Claimed: ₹{claimed_rm:.2f} Cr | Variance: ₹{rm_variance:+.2f} Cr",
-        "",
-        "═══ TOTAL O&M ═══",
-        f"   Normative: ₹{total_normative_om:.2f} Cr",
-        f"   Claimed: ₹{claimed_total_om:.2f} Cr",
-        f"   Variance: ₹{total_variance:+.2f} Cr ({total_variance_pct:+.2f}%)",
-        f"   MYT Approved: ₹{myt_approved_om:.2f} Cr",
-        "",
-        "Note: Energy sales adjusted to 25,255 MU (excl surplus sale, incl prosumer return)",
-    ]
+    total_variance_pct = _safe_pct(total_variance, total_normative_om)
+
+    calc_steps = LazySteps(
+        _render_om_dist_norm_steps,
+        num_consumers, num_dtrs, ht_line_km, lt_line_km, energy_sales_mu,
+        norm_per_1000_consumers, norm_per_dtr, norm_per_ht_km, norm_per_lt_km, norm_per_mu,
+        cost_consumers, cost_dtrs, cost_ht, cost_lt, cost_energy,
+        total_employee_ag, claimed_employee_ag, employee_ag_variance,
+        gfa_sbu_d_opening, gfa_derecognized, gfa_land, net_gfa, rm_rate,
+        rm_allowable, claimed_rm, rm_variance,
+        total_normative_om, claimed_total_om, total_variance, total_variance_pct,
+        myt_approved_om,
+    ) if include_steps else []
 
     # Flag
     if abs(total_variance_pct) <= 2:
-        flag = 'GREEN'
-        recommendation = f"Approve total O&M at ₹{total_normative_om:.2f} Cr as per norms."
+        flag, rec_template = 'GREEN', _OM_DIST_NORM_REC_WITHIN
     elif total_variance > 0:
-        flag = 'YELLOW'
-        recommendation = (
-            f"Cap O&M to normative ₹{total_normative_om:.2f} Cr. "
-            f"KSEB claimed ₹{claimed_total_om:.2f} Cr exceeds norms by ₹{total_variance:.2f} Cr."
-        )
+        flag, rec_template = 'YELLOW', _OM_DIST_NORM_REC_ABOVE
     else:
-        flag = 'GREEN'
-        recommendation = f"Claimed ₹{claimed_total_om:.2f} Cr is below normative ₹{total_normative_om:.2f} Cr."
+        flag, rec_template = 'GREEN', _OM_DIST_NORM_REC_BELOW
+    recommendation = rec_template.format(
+        normative=total_normative_om, claimed=claimed_total_om, variance=total_variance,
+    )
 
-    return {
-        'heuristic_id': 'OM-DIST-NORM-01',
-        'heuristic_name': 'Distribution O&M Norms',
-        'line_item': 'O&M Expenses (Distribution)',
-        'claimed_value': round(claimed_total_om, 2),
-        'allowable_value': round(total_normative_om, 2),
-        'variance_absolute': round(total_variance, 2),
-        'variance_percentage': round(total_variance_pct, 2),
-        'flag': flag,
-        'recommended_amount': round(total_normative_om, 2),
-        'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation 80 + Annexure-7, Tariff Regulations 2021',
-        'calculation_steps': calc_steps,
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        'depends_on': ['OM-INFL-01'],
-        'is_primary': True,
-        'output_type': 'approved_amount',
-        'om_details': {
+    result = _assemble_result(
+        _OM_DIST_NORM_TEMPLATE, claimed_total_om, total_normative_om,
+        total_variance, total_variance_pct, flag, recommendation, calc_steps,
+        depends_on=('OM-INFL-01',),
+    )
+    if include_details:
+        result['om_details'] = {
             'employee_ag_normative': round(total_employee_ag, 2),
             'rm_normative': round(rm_allowable, 2),
             'cost_by_parameter': {
@@ -450,13 +669,66 @@ def heuristic_OM_DIST_NORM_01(
             },
             'net_gfa_for_rm': round(net_gfa, 2),
         }
-    }
+    return result
 
 
 # ============================================================================
 # HEURISTIC 3: IFC-SD-01 - Interest on Security Deposits
 # ============================================================================
 
+_IFC_SD_TEMPLATE = {
+    'heuristic_id': 'IFC-SD-01',
+    'heuristic_name': 'Interest on Security Deposits',
+    'line_item': 'Interest on Security Deposits',
+    'regulatory_basis': 'Regulation 29(8), Tariff Regulations 2021',
+    'is_primary': True,
+    'output_type': 'approved_amount',
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_IFC_SD_REC = "Approve ₹{allowable:.2f} Cr (actual disbursement) as per Regulation 29(8)."
+
+
+# Step text for IFC-SD-01; fields are _render_ifc_sd_steps() locals.
+_IFC_SD_STEPS_TEMPLATE = "\n".join((
+    "═══ INTEREST ON SECURITY DEPOSITS (Regulation 29(8)) ═══",
+    "",
+    "Rule: Only actual disbursement to consumers allowed at truing-up.",
+    "",
+    "Average Security Deposit: ₹{avg_security_deposit:.2f} Cr",
+    "Interest Rate (Bank Rate as on 01.04.2023): {interest_rate_applied:.2f}%",
+    "Expected Interest (notional): ₹{expected_interest:.2f} Cr",
+    "",
+    "Provision in Accounts: ₹{provision_in_accounts:.2f} Cr",
+    "Actual Disbursement: ₹{actual_disbursement:.2f} Cr",
+    "Difference: ₹{provision_gap:.2f} Cr",
+    "",
+    "MYT Approved: ₹{myt_approved_sd_interest:.2f} Cr",
+    "Claimed: ₹{claimed_sd_interest:.2f} Cr",
+    "Approved: ₹{allowable:.2f} Cr",
+    "",
+    "Note: Difference between provision and disbursement is because",
+    "provision includes April 2024 payable; actual disbursement for FY claimed in this year only.",
+    "Balance may be claimed in Truing Up of FY 2024-25.",
+))
+
+
+def _render_ifc_sd_steps(
+    avg_security_deposit: float,
+    interest_rate_applied: float,
+    expected_interest: float,
+    provision_in_accounts: float,
+    actual_disbursement: float,
+    myt_approved_sd_interest: float,
+    claimed_sd_interest: float,
+    allowable: float,
+) -> List[str]:
+    """Render IFC-SD-01 calculation steps."""
+    provision_gap = provision_in_accounts - actual_disbursement
+    return _IFC_SD_STEPS_TEMPLATE.format_map(locals()).split("\n")
+
+
+@cached_result(maxsize=512)
 def heuristic_IFC_SD_01(
     myt_approved_sd_interest: float = 156.11,
     actual_disbursement: float = 146.88,
@@ -464,6 +736,8 @@ def heuristic_IFC_SD_01(
     avg_security_deposit: float = 4146.85,
     interest_rate_applied: float = 6.75,
     claimed_sd_interest: float = 146.88,
+    *,
+    include_steps: bool = True,
 ) -> Dict:
     """
     IFC-SD-01: Interest on Security Deposits (SBU-D specific)
@@ -481,66 +755,101 @@ def heuristic_IFC_SD_01(
     allowable = actual_disbursement
 
     variance_abs = claimed_sd_interest - allowable
-    variance_pct = (variance_abs / allowable * 100) if allowable > 0 else 0
+    variance_pct = _safe_pct(variance_abs, allowable)
 
     # Check reasonableness: expected interest
     expected_interest = avg_security_deposit * interest_rate_applied / 100
     reasonableness_ratio = actual_disbursement / expected_interest if expected_interest > 0 else 0
 
-    calc_steps = [
-        "═══ INTEREST ON SECURITY DEPOSITS (Regulation 29(8)) ═══",
-        "",
-        "Rule: Only actual disbursement to consumers allowed at truing-up.",
-        "",
-        f"Average Security Deposit: ₹{avg_security_deposit:.2f} Cr",
-        f"Interest Rate (Bank Rate as on 01.04.2023): {interest_rate_applied:.2f}%",
-        f"Expected Interest (notional): ₹{expected_interest:.2f} Cr",
-        "",
-        f"Provision in Accounts: ₹{provision_in_accounts:.2f} Cr",
-        f"Actual Disbursement: ₹{actual_disbursement:.2f} Cr",
-        f"Difference: ₹{provision_in_accounts - actual_disbursement:.2f} Cr",
-        "",
-        f"MYT Approved: ₹{myt_approved_sd_interest:.2f} Cr",
-        f"Claimed: ₹{claimed_sd_interest:.2f} Cr",
-        f"Approved: ₹{allowable:.2f} Cr",
-        "",
-        "Note: Difference between provision and disbursement is because",
-        "provision includes April 2024 payable; actual disbursement for FY claimed in this year only.",
-        "Balance may be claimed in Truing Up of FY 2024-25.",
-    ]
+    calc_steps = LazySteps(
+        _render_ifc_sd_steps,
+        avg_security_deposit, interest_rate_applied, expected_interest,
+        provision_in_accounts, actual_disbursement, myt_approved_sd_interest,
+        claimed_sd_interest, allowable,
+    ) if include_steps else []
 
     flag = 'GREEN' if abs(variance_pct) <= 2 else 'YELLOW'
-    recommendation = f"Approve ₹{allowable:.2f} Cr (actual disbursement) as per Regulation 29(8)."
+    recommendation = _IFC_SD_REC.format(allowable=allowable)
 
-    return {
-        'heuristic_id': 'IFC-SD-01',
-        'heuristic_name': 'Interest on Security Deposits',
-        'line_item': 'Interest on Security Deposits',
-        'claimed_value': round(claimed_sd_interest, 2),
-        'allowable_value': round(allowable, 2),
-        'variance_absolute': round(variance_abs, 2),
-        'variance_percentage': round(variance_pct, 2),
-        'flag': flag,
-        'recommended_amount': round(allowable, 2),
-        'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation 29(8), Tariff Regulations 2021',
-        'calculation_steps': calc_steps,
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        'depends_on': [],
-        'is_primary': True,
-        'output_type': 'approved_amount',
-    }
+    return _assemble_result(
+        _IFC_SD_TEMPLATE, claimed_sd_interest, allowable,
+        variance_abs, variance_pct, flag, recommendation, calc_steps,
+    )
 
 
 # ============================================================================
 # HEURISTIC 4: IFC-CC-01 - Carrying Cost on Revenue Gap
 # ============================================================================
 
+_IFC_CC_TEMPLATE = {
+    'heuristic_id': 'IFC-CC-01',
+    'heuristic_name': 'Carrying Cost on Revenue Gap',
+    'line_item': 'Carrying Cost on Revenue Gap',
+    'regulatory_basis': 'Regulation 29(9), Tariff Regulations 2021',
+    'is_primary': True,
+    'output_type': 'approved_amount',
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_IFC_CC_REC = (
+    "Approve carrying cost at ₹{allowable:.2f} Cr. "
+    "Disallow ₹{variance:.2f} Cr due to GPF/SD deduction methodology."
+)
+
+
+def _ifc_cc_core(net_gap, avg_interest_rate, claimed_carrying_cost) -> Tuple:
+    """
+    Numeric core of IFC-CC-01 on an already-floored net gap.
+
+    Array-safe; the caller applies the zero floor (max / np.maximum).
+    Returns (allowable_cc, variance_abs).
+    """
+    allowable_cc = net_gap * avg_interest_rate / 100
+    variance_abs = claimed_carrying_cost - allowable_cc
+    return allowable_cc, variance_abs
+
+
+# Step text for IFC-CC-01; fields are _render_ifc_cc_steps() locals.
+_IFC_CC_STEPS_TEMPLATE = "\n".join((
+    "═══ CARRYING COST ON REVENUE GAP (Regulation 29(9)) ═══",
+    "",
+    "Step 1: Determine eligible revenue gap",
+    "  Unbridged gap as on 01.04.2023: ₹{revenue_gap_as_on_01_04:.2f} Cr",
+    "  Less: Avg GPF balance (2023-24): ₹{avg_gpf_balance:.2f} Cr",
+    "    (Deducted as GPF interest already allowed as IFC)",
+    "  Less: Excess SD over WC requirement: ₹{excess_security_deposit:.2f} Cr",
+    "    (Reg 29(9) proviso: no CC on excess SD)",
+    "  Net gap eligible for CC: ₹{net_gap:.2f} Cr",
+    "",
+    "Step 2: Calculate carrying cost",
+    "  Interest rate (weighted avg SBU-D loans): {avg_interest_rate:.2f}%",
+    "  Carrying cost = ₹{net_gap:.2f} × {avg_interest_rate:.2f}% = ₹{allowable_cc:.2f} Cr",
+    "",
+    "  MYT Approved: ₹{myt_approved_carrying_cost:.2f} Cr",
+    "  Claimed: ₹{claimed_carrying_cost:.2f} Cr",
+    "  KSERC Approved: ₹{allowable_cc:.2f} Cr",
+    "  Disallowance: ₹{variance_abs:.2f} Cr",
+    "",
+    "Note: KSEB claimed higher amount due to different methodology for GPF deduction.",
+))
+
+
+def _render_ifc_cc_steps(
+    revenue_gap_as_on_01_04: float,
+    avg_gpf_balance: float,
+    excess_security_deposit: float,
+    net_gap: float,
+    avg_interest_rate: float,
+    allowable_cc: float,
+    myt_approved_carrying_cost: float,
+    claimed_carrying_cost: float,
+    variance_abs: float,
+) -> List[str]:
+    """Render IFC-CC-01 calculation steps."""
+    return _IFC_CC_STEPS_TEMPLATE.format_map(locals()).split("\n")
+
+
+@cached_result(maxsize=512)
 def heuristic_IFC_CC_01(
     revenue_gap_as_on_01_04: float = 6408.37,
     avg_gpf_balance: float = 2926.29,
@@ -548,6 +857,9 @@ def heuristic_IFC_CC_01(
     avg_interest_rate: float = 8.52,
     claimed_carrying_cost: float = 321.24,
     myt_approved_carrying_cost: float = 211.91,
+    *,
+    include_steps: bool = True,
+    include_details: bool = True,
 ) -> Dict:
     """
     IFC-CC-01: Carrying Cost on Revenue Gap (SBU-D specific)
@@ -570,33 +882,15 @@ def heuristic_IFC_CC_01(
     net_gap = max(0, net_gap)  # Cannot be negative
 
     # Carrying cost
-    allowable_cc = net_gap * avg_interest_rate / 100
+    allowable_cc, variance_abs = _ifc_cc_core(net_gap, avg_interest_rate, claimed_carrying_cost)
+    variance_pct = _safe_pct(variance_abs, allowable_cc)
 
-    variance_abs = claimed_carrying_cost - allowable_cc
-    variance_pct = (variance_abs / allowable_cc * 100) if allowable_cc > 0 else 0
-
-    calc_steps = [
-        "═══ CARRYING COST ON REVENUE GAP (Regulation 29(9)) ═══",
-        "",
-        "Step 1: Determine eligible revenue gap",
-        f"  Unbridged gap as on 01.04.2023: ₹{revenue_gap_as_on_01_04:.2f} Cr",
-        f"  Less: Avg GPF balance (2023-24): ₹{avg_gpf_balance:.2f} Cr",
-        f"    (Deducted as GPF interest already allowed as IFC)",
-        f"  Less: Excess SD over WC requirement: ₹{excess_security_deposit:.2f} Cr",
-        f"    (Reg 29(9) proviso: no CC on excess SD)",
-        f"  Net gap eligible for CC: ₹{net_gap:.2f} Cr",
-        "",
-        "Step 2: Calculate carrying cost",
-        f"  Interest rate (weighted avg SBU-D loans): {avg_interest_rate:.2f}%",
-        f"  Carrying cost = ₹{net_gap:.2f} × {avg_interest_rate:.2f}% = ₹{allowable_cc:.2f} Cr",
-        "",
-        f"  MYT Approved: ₹{myt_approved_carrying_cost:.2f} Cr",
-        f"  Claimed: ₹{claimed_carrying_cost:.2f} Cr",
-        f"  KSERC Approved: ₹{allowable_cc:.2f} Cr",
-        f"  Disallowance: ₹{variance_abs:.2f} Cr",
-        "",
-        "Note: KSEB claimed higher amount due to different methodology for GPF deduction.",
-    ]
+    calc_steps = LazySteps(
+        _render_ifc_cc_steps,
+        revenue_gap_as_on_01_04, avg_gpf_balance, excess_security_deposit, net_gap,
+        avg_interest_rate, allowable_cc, myt_approved_carrying_cost,
+        claimed_carrying_cost, variance_abs,
+    ) if include_steps else []
 
     if abs(variance_pct) <= 2:
         flag = 'GREEN'
@@ -605,50 +899,71 @@ def heuristic_IFC_CC_01(
     else:
         flag = 'GREEN'
 
-    recommendation = (
-        f"Approve carrying cost at ₹{allowable_cc:.2f} Cr. "
-        f"Disallow ₹{variance_abs:.2f} Cr due to GPF/SD deduction methodology."
-    )
+    recommendation = _IFC_CC_REC.format(allowable=allowable_cc, variance=variance_abs)
 
-    return {
-        'heuristic_id': 'IFC-CC-01',
-        'heuristic_name': 'Carrying Cost on Revenue Gap',
-        'line_item': 'Carrying Cost on Revenue Gap',
-        'claimed_value': round(claimed_carrying_cost, 2),
-        'allowable_value': round(allowable_cc, 2),
-        'variance_absolute': round(variance_abs, 2),
-        'variance_percentage': round(variance_pct, 2),
-        'flag': flag,
-        'recommended_amount': round(allowable_cc, 2),
-        'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation 29(9), Tariff Regulations 2021',
-        'calculation_steps': calc_steps,
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        'depends_on': ['IFC-WC-01'],  # WC calc determines excess SD
-        'is_primary': True,
-        'output_type': 'approved_amount',
-        'cc_details': {
+    result = _assemble_result(
+        _IFC_CC_TEMPLATE, claimed_carrying_cost, allowable_cc,
+        variance_abs, variance_pct, flag, recommendation, calc_steps,
+        depends_on=('IFC-WC-01',),  # WC calc determines excess SD
+    )
+    if include_details:
+        result['cc_details'] = {
             'gross_gap': round(revenue_gap_as_on_01_04, 2),
             'gpf_deduction': round(avg_gpf_balance, 2),
             'sd_deduction': round(excess_security_deposit, 2),
             'net_gap': round(net_gap, 2),
         }
-    }
+    return result
 
 
 # ============================================================================
 # HEURISTIC 5: IFC-OTH-D-01 - Other Interest Charges (SBU-D)
 # ============================================================================
 
+_IFC_OTH_D_TEMPLATE = {
+    'heuristic_id': 'IFC-OTH-D-01',
+    'heuristic_name': 'Other Interest Charges (SBU-D)',
+    'line_item': 'Other Interest Charges',
+    'regulatory_basis': 'Para 5.191, KSERC Order',
+    'is_primary': True,
+    'output_type': 'approved_amount',
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_IFC_OTH_D_REC = "Approve ₹{total:.2f} Cr as claimed."
+
+
+# Step text for IFC-OTH-D-01; fields are _render_ifc_oth_d_steps() locals.
+_IFC_OTH_D_STEPS_TEMPLATE = "\n".join((
+    "═══ OTHER INTEREST CHARGES - SBU-D (Table 5.88) ═══",
+    "",
+    "1. Other Bank Charges: ₹{other_bank_charges:.2f} Cr",
+    "2. Interest on Power Purchase: ₹{interest_on_power_purchase:.2f} Cr",
+    "   (CERC provisional vs final tariff difference, MYT 2019-24)",
+    "Total: ₹{calculated_total:.2f} Cr",
+    "Claimed: ₹{claimed_other_interest:.2f} Cr",
+    "",
+    "KSERC Decision: Approved as claimed.",
+))
+
+
+def _render_ifc_oth_d_steps(
+    other_bank_charges: float,
+    interest_on_power_purchase: float,
+    calculated_total: float,
+    claimed_other_interest: float,
+) -> List[str]:
+    """Render IFC-OTH-D-01 calculation steps."""
+    return _IFC_OTH_D_STEPS_TEMPLATE.format_map(locals()).split("\n")
+
+
+@cached_result(maxsize=512)
 def heuristic_IFC_OTH_D_01(
     other_bank_charges: float = 0.81,
     interest_on_power_purchase: float = 43.26,
     claimed_other_interest: float = 44.07,
+    *,
+    include_steps: bool = True,
 ) -> Dict:
     """
     IFC-OTH-D-01: Other Interest Charges (SBU-D specific)
@@ -666,47 +981,78 @@ def heuristic_IFC_OTH_D_01(
 
     flag = 'GREEN' if abs(variance_abs) < 0.5 else 'YELLOW'
 
-    calc_steps = [
-        "═══ OTHER INTEREST CHARGES - SBU-D (Table 5.88) ═══",
-        "",
-        f"1. Other Bank Charges: ₹{other_bank_charges:.2f} Cr",
-        f"2. Interest on Power Purchase: ₹{interest_on_power_purchase:.2f} Cr",
-        f"   (CERC provisional vs final tariff difference, MYT 2019-24)",
-        f"Total: ₹{calculated_total:.2f} Cr",
-        f"Claimed: ₹{claimed_other_interest:.2f} Cr",
-        "",
-        "KSERC Decision: Approved as claimed.",
-    ]
+    calc_steps = LazySteps(
+        _render_ifc_oth_d_steps,
+        other_bank_charges, interest_on_power_purchase, calculated_total,
+        claimed_other_interest,
+    ) if include_steps else []
 
-    return {
-        'heuristic_id': 'IFC-OTH-D-01',
-        'heuristic_name': 'Other Interest Charges (SBU-D)',
-        'line_item': 'Other Interest Charges',
-        'claimed_value': round(claimed_other_interest, 2),
-        'allowable_value': round(calculated_total, 2),
-        'variance_absolute': round(variance_abs, 2),
-        'variance_percentage': 0.0,
-        'flag': flag,
-        'recommended_amount': round(calculated_total, 2),
-        'recommendation_text': f"Approve ₹{calculated_total:.2f} Cr as claimed.",
-        'regulatory_basis': 'Para 5.191, KSERC Order',
-        'calculation_steps': calc_steps,
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        'depends_on': [],
-        'is_primary': True,
-        'output_type': 'approved_amount',
-    }
+    return _assemble_result(
+        _IFC_OTH_D_TEMPLATE, claimed_other_interest, calculated_total,
+        variance_abs, 0.0, flag, _IFC_OTH_D_REC.format(total=calculated_total), calc_steps,
+    )
 
 
 # ============================================================================
 # HEURISTIC 6: DIST-LOSS-01 - Distribution Loss Assessment
 # ============================================================================
 
+_DIST_LOSS_TEMPLATE = {
+    'heuristic_id': 'DIST-LOSS-01',
+    'heuristic_name': 'Distribution Loss Assessment',
+    'line_item': 'Distribution Loss',
+    'regulatory_basis': 'Regulation 73, Tariff Regulations 2021',
+    'is_primary': False,  # Informational - feeds into TD-SHARE-01
+    'output_type': 'assessment',
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_DIST_LOSS_RECS = (
+    "Distribution loss {actual:.2f}% is within target {target:.2f}%. "
+    "Saved {saved:.2f}pp. Eligible for gain sharing under Regulation 73.",
+    "Distribution loss {actual:.2f}% marginally exceeds target by {variance:.2f}pp. "
+    "May attract disallowance of excess power purchase.",
+    "Distribution loss {actual:.2f}% exceeds target by {variance:.2f}pp. "
+    "Quantum of excess purchase to be disallowed at avg PP cost.",
+)
+
+
+# Step text for DIST-LOSS-01; fields are _render_dist_loss_steps() locals.
+_DIST_LOSS_STEPS_TEMPLATE = "\n".join((
+    "═══ DISTRIBUTION LOSS ASSESSMENT (Table 4.9) ═══",
+    "",
+    "Energy Input to Distribution: {energy_input_to_dist_mu:,.2f} MU",
+    "  (= Total at Kerala periphery - Transmission loss)",
+    "Energy Output (consumer end): {energy_output_mu:,.2f} MU",
+    "Distribution Loss: {distribution_loss_mu:,.2f} MU",
+    "Distribution Loss %: {actual_dist_loss_pct:.2f}%",
+    "",
+    "MYT Target Distribution Loss: {myt_target_dist_loss_pct:.2f}%",
+    "Variance: {variance_pp:+.2f} percentage points",
+    "{verdict}",
+    "",
+    "Collection Efficiency: {collection_efficiency_pct:.2f}% (target: 99.00%)",
+    "AT&C Loss: {atc_loss_pct:.2f}% (target: {myt_target_atc_loss_pct:.2f}%)",
+))
+
+
+def _render_dist_loss_steps(
+    energy_input_to_dist_mu: float,
+    energy_output_mu: float,
+    distribution_loss_mu: float,
+    actual_dist_loss_pct: float,
+    myt_target_dist_loss_pct: float,
+    variance_pp: float,
+    collection_efficiency_pct: float,
+    atc_loss_pct: float,
+    myt_target_atc_loss_pct: float,
+) -> List[str]:
+    """Render DIST-LOSS-01 calculation steps."""
+    verdict = '✓ BETTER than target' if variance_pp < 0 else '✗ WORSE than target'
+    return _DIST_LOSS_STEPS_TEMPLATE.format_map(locals()).split("\n")
+
+
+@cached_result(maxsize=512)
 def heuristic_DIST_LOSS_01(
     energy_input_to_dist_mu: float = 30587.11,
     energy_output_mu: float = 28360.25,
@@ -714,6 +1060,9 @@ def heuristic_DIST_LOSS_01(
     myt_target_atc_loss_pct: float = 11.71,
     collection_efficiency_pct: float = 99.72,
     claimed_dist_loss_pct: float = 7.28,
+    *,
+    include_steps: bool = True,
+    include_details: bool = True,
 ) -> Dict:
     """
     DIST-LOSS-01: Distribution Loss Assessment
@@ -727,88 +1076,146 @@ def heuristic_DIST_LOSS_01(
     - AT&C loss: 7.55% vs 11.71% (target)
     """
     distribution_loss_mu = energy_input_to_dist_mu - energy_output_mu
-    actual_dist_loss_pct = (distribution_loss_mu / energy_input_to_dist_mu * 100) if energy_input_to_dist_mu > 0 else 0
+    actual_dist_loss_pct = _safe_pct(distribution_loss_mu, energy_input_to_dist_mu)
 
     variance_pp = actual_dist_loss_pct - myt_target_dist_loss_pct
 
     # AT&C loss
     atc_loss_pct = (1 - (energy_output_mu / energy_input_to_dist_mu) * (collection_efficiency_pct / 100)) * 100 if energy_input_to_dist_mu > 0 else 0
 
-    calc_steps = [
-        "═══ DISTRIBUTION LOSS ASSESSMENT (Table 4.9) ═══",
-        "",
-        f"Energy Input to Distribution: {energy_input_to_dist_mu:,.2f} MU",
-        f"  (= Total at Kerala periphery - Transmission loss)",
-        f"Energy Output (consumer end): {energy_output_mu:,.2f} MU",
-        f"Distribution Loss: {distribution_loss_mu:,.2f} MU",
-        f"Distribution Loss %: {actual_dist_loss_pct:.2f}%",
-        "",
-        f"MYT Target Distribution Loss: {myt_target_dist_loss_pct:.2f}%",
-        f"Variance: {variance_pp:+.2f} percentage points",
-        f"{'✓ BETTER than target' if variance_pp < 0 else '✗ WORSE than target'}",
-        "",
-        f"Collection Efficiency: {collection_efficiency_pct:.2f}% (target: 99.00%)",
-        f"AT&C Loss: {atc_loss_pct:.2f}% (target: {myt_target_atc_loss_pct:.2f}%)",
-    ]
+    calc_steps = LazySteps(
+        _render_dist_loss_steps,
+        energy_input_to_dist_mu, energy_output_mu, distribution_loss_mu,
+        actual_dist_loss_pct, myt_target_dist_loss_pct, variance_pp,
+        collection_efficiency_pct, atc_loss_pct, myt_target_atc_loss_pct,
+    ) if include_steps else []
+
+    band = flag_band(_DIST_LOSS_THRESHOLDS, variance_pp)
+    flag = _FLAGS[band]
+    recommendation = _DIST_LOSS_RECS[band].format(
+        actual=actual_dist_loss_pct, target=myt_target_dist_loss_pct,
+        variance=variance_pp, saved=abs(variance_pp),
+    )
 
-    if variance_pp <= 0:
-        flag = 'GREEN'
-        recommendation = (
-            f"Distribution loss {actual_dist_loss_pct:.2f}% is within target {myt_target_dist_loss_pct:.2f}%. "
-            f"Saved {abs(variance_pp):.2f}pp. Eligible for gain sharing under Regulation 73."
-        )
-    elif variance_pp <= 0.5:
-        flag = 'YELLOW'
-        recommendation = (
-            f"Distribution loss {actual_dist_loss_pct:.2f}% marginally exceeds target by {variance_pp:.2f}pp. "
-            f"May attract disallowance of excess power purchase."
-        )
-    else:
-        flag = 'RED'
-        recommendation = (
-            f"Distribution loss {actual_dist_loss_pct:.2f}% exceeds target by {variance_pp:.2f}pp. "
-            f"Quantum of excess purchase to be disallowed at avg PP cost."
-        )
+    r_actual_pct = round(actual_dist_loss_pct, 2)
+    r_variance_pp = round(variance_pp, 2)
 
-    return {
-        'heuristic_id': 'DIST-LOSS-01',
-        'heuristic_name': 'Distribution Loss Assessment',
-        'line_item': 'Distribution Loss',
-        'claimed_value': round(claimed_dist_loss_pct, 2),
-        'allowable_value': round(actual_dist_loss_pct, 2),
-        'variance_absolute': round(variance_pp, 2),
-        'variance_percentage': None,  # This IS a percentage
-        'flag': flag,
-        'recommended_amount': None,  # Not a financial amount
-        'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation 73, Tariff Regulations 2021',
-        'calculation_steps': calc_steps,
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        'depends_on': [],
-        'is_primary': False,  # Informational - feeds into TD-SHARE-01
-        'output_type': 'assessment',
-        'dist_loss_details': {
+    result = _assemble_result(
+        _DIST_LOSS_TEMPLATE, claimed_dist_loss_pct, actual_dist_loss_pct,
+        variance_pp, None, flag, recommendation, calc_steps,
+    )
+    if include_details:
+        result['dist_loss_details'] = {
             'energy_input_mu': round(energy_input_to_dist_mu, 2),
             'energy_output_mu': round(energy_output_mu, 2),
             'loss_mu': round(distribution_loss_mu, 2),
-            'actual_pct': round(actual_dist_loss_pct, 2),
+            'actual_pct': r_actual_pct,
             'target_pct': myt_target_dist_loss_pct,
-            'variance_pp': round(variance_pp, 2),
+            'variance_pp': r_variance_pp,
             'collection_efficiency': collection_efficiency_pct,
             'atc_loss_pct': round(atc_loss_pct, 2),
         }
-    }
+    return result
 
 
 # ============================================================================
 # HEURISTIC 7: TD-SHARE-01 - T&D Loss Gain Sharing
 # ============================================================================
 
+_TD_SHARE_TEMPLATE = {
+    'heuristic_id': 'TD-SHARE-01',
+    'heuristic_name': 'T&D Loss Gain Sharing',
+    'line_item': 'T&D Loss Gain Sharing',
+    'regulatory_basis': 'Regulations 14(1) & 73(3), Tariff Regulations 2021',
+    'is_primary': True,
+    'output_type': 'approved_amount',
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_TD_SHARE_STEPS_TEMPLATE = "\n".join((
+    "═══ T&D LOSS GAIN SHARING (Regulations 14 & 73) ═══",
+    "",
+    "Approved T&D Loss Target: {approved_td_loss_pct:.2f}%",
+    "KSEBL Claimed T&D Loss: {actual_td_loss_ksebl_pct:.2f}%",
+    "KSERC Assessed T&D Loss: {actual_td_loss:.2f}% (Annexure 4.5)",
+    "Loss Reduction Achieved: {loss_reduction_pp:+.2f} percentage points",
+    "",
+    "{gain_block}",
+    "═══ KSERC DECISION: DISALLOWED ═══",
+    "  Claimed: ₹{claimed_gain_sharing:.2f} Cr",
+    "  Approved: ₹0.00 Cr",
+    "",
+    "Reasons for disallowance:",
+    "  1. Unbridged revenue gap of ₹{unbridged_revenue_gap:.2f} Cr as on 31.03.2023",
+    "  2. Actual T&D loss INCREASED from 9.27% (2022-23) to {actual_td_loss:.2f}% (2023-24)",
+    "  3. Loss reduction is relative to target, not absolute improvement",
+    "",
+    "Note: Commission also decided NOT to impose penalty for under-achievement,",
+    "considering force majeure (unprecedented 10.75% demand growth, drought).",
+))
+
+# {gain_block} of the steps template; each ends with a blank line.
+_TD_SHARE_GAIN_TEMPLATE = "\n".join((
+    "GAIN CALCULATION:",
+    "  Energy at target loss: {energy_sales_mu:,.0f} / (1 - {target_fraction:.4f}) = {energy_at_target:,.2f} MU",
+    "  Energy at actual loss: {energy_sales_mu:,.0f} / (1 - {actual_fraction:.4f}) = {energy_at_actual:,.2f} MU",
+    "  Energy Saved: {energy_saved_mu:,.2f} MU",
+    "  Monetary Gain: {energy_saved_mu:,.2f} × ₹{avg_pp_cost_per_unit:.2f} / 100 = ₹{monetary_gain_cr:.2f} Cr",
+    "  Utility Share (2/3): ₹{utility_share_cr:.2f} Cr",
+    "  Consumer Share (1/3): ₹{consumer_share_cr:.2f} Cr",
+    "",
+))
+_TD_SHARE_NO_GAIN = "T&D loss EXCEEDS target - no gain sharing applicable.\n"
+_TD_SHARE_REC = (
+    "DISALLOW gain sharing of ₹{claimed:.2f} Cr. "
+    "While T&D loss ({actual:.2f}%) is below target ({approved:.2f}%), "
+    "the unbridged revenue gap of ₹{gap:.2f} Cr and year-on-year "
+    "increase in T&D loss justifies disallowance. No penalty imposed either (force majeure)."
+)
+
+
+def _td_share_gain(
+    approved_td_loss_pct, actual_td_loss, energy_sales_mu,
+    avg_pp_cost_per_unit, utility_share_ratio,
+) -> Tuple:
+    """
+    Gain from beating the T&D loss target (no strings, no dicts).
+
+    Returns (energy_at_target, energy_at_actual, energy_saved_mu,
+    monetary_gain_cr, utility_share_cr).
+    """
+    energy_at_target = energy_sales_mu / (1 - approved_td_loss_pct/100)
+    energy_at_actual = energy_sales_mu / (1 - actual_td_loss/100)
+    energy_saved_mu = energy_at_target - energy_at_actual
+    monetary_gain_cr = energy_saved_mu * avg_pp_cost_per_unit / 100  # MU × Rs/unit / 100 = Cr
+    utility_share_cr = monetary_gain_cr * utility_share_ratio
+    return (energy_at_target, energy_at_actual, energy_saved_mu,
+            monetary_gain_cr, utility_share_cr)
+
+
+def _render_td_share_steps(
+    approved_td_loss_pct: float, actual_td_loss_ksebl_pct: float,
+    actual_td_loss: float, loss_reduction_pp: float, energy_sales_mu: float,
+    avg_pp_cost_per_unit: float, utility_share_ratio: float,
+    claimed_gain_sharing: float, unbridged_revenue_gap: float,
+) -> List[str]:
+    """Render TD-SHARE-01 calculation steps for display."""
+    if loss_reduction_pp > 0:
+        (energy_at_target, energy_at_actual, energy_saved_mu,
+         monetary_gain_cr, utility_share_cr) = _td_share_gain(
+            approved_td_loss_pct, actual_td_loss, energy_sales_mu,
+            avg_pp_cost_per_unit, utility_share_ratio,
+        )
+        target_fraction = approved_td_loss_pct / 100
+        actual_fraction = actual_td_loss / 100
+        consumer_share_cr = monetary_gain_cr - utility_share_cr
+        gain_block = _TD_SHARE_GAIN_TEMPLATE.format_map(locals())
+    else:
+        gain_block = _TD_SHARE_NO_GAIN
+    return _TD_SHARE_STEPS_TEMPLATE.format_map(locals()).split("\n")
+
+
+@cached_result(maxsize=512)
 def heuristic_TD_SHARE_01(
     approved_td_loss_pct: float = 10.82,
     actual_td_loss_ksebl_pct: float = 9.70,
@@ -818,6 +1225,9 @@ def heuristic_TD_SHARE_01(
     claimed_gain_sharing: float = 131.59,
     unbridged_revenue_gap: float = 6408.37,
     utility_share_ratio: float = 2/3,
+    *,
+    include_steps: bool = True,
+    include_details: bool = True,
 ) -> Dict:
     """
     TD-SHARE-01: T&D Loss Gain Sharing (Regulations 14 & 73)
@@ -839,69 +1249,24 @@ def heuristic_TD_SHARE_01(
     actual_td_loss = actual_td_loss_kserc_pct
     loss_reduction_pp = approved_td_loss_pct - actual_td_loss
 
-    calc_steps = [
-        "═══ T&D LOSS GAIN SHARING (Regulations 14 & 73) ═══",
-        "",
-        f"Approved T&D Loss Target: {approved_td_loss_pct:.2f}%",
-        f"KSEBL Claimed T&D Loss: {actual_td_loss_ksebl_pct:.2f}%",
-        f"KSERC Assessed T&D Loss: {actual_td_loss_kserc_pct:.2f}% (Annexure 4.5)",
-        f"Loss Reduction Achieved: {loss_reduction_pp:+.2f} percentage points",
-        "",
-    ]
-
-    if loss_reduction_pp > 0:
-        # Calculate gain
-        energy_at_target = energy_sales_mu / (1 - approved_td_loss_pct/100)
-        energy_at_actual = energy_sales_mu / (1 - actual_td_loss/100)
-        energy_saved_mu = energy_at_target - energy_at_actual
-        monetary_gain_cr = energy_saved_mu * avg_pp_cost_per_unit / 100  # MU × Rs/unit / 100 = Cr
-        utility_share_cr = monetary_gain_cr * utility_share_ratio
-
-        calc_steps.extend([
-            "GAIN CALCULATION:",
-            f"  Energy at target loss: {energy_sales_mu:,.0f} / (1 - {approved_td_loss_pct/100:.4f}) = {energy_at_target:,.2f} MU",
-            f"  Energy at actual loss: {energy_sales_mu:,.0f} / (1 - {actual_td_loss/100:.4f}) = {energy_at_actual:,.2f} MU",
-            f"  Energy Saved: {energy_saved_mu:,.2f} MU",
-            f"  Monetary Gain: {energy_saved_mu:,.2f} × ₹{avg_pp_cost_per_unit:.2f} / 100 = ₹{monetary_gain_cr:.2f} Cr",
-            f"  Utility Share (2/3): ₹{utility_share_cr:.2f} Cr",
-            f"  Consumer Share (1/3): ₹{monetary_gain_cr - utility_share_cr:.2f} Cr",
-            "",
-        ])
-    else:
-        energy_saved_mu = 0
-        monetary_gain_cr = 0
-        utility_share_cr = 0
-        calc_steps.append("T&D loss EXCEEDS target - no gain sharing applicable.")
-        calc_steps.append("")
-
-    # KSERC decision: DISALLOWED
-    calc_steps.extend([
-        "═══ KSERC DECISION: DISALLOWED ═══",
-        f"  Claimed: ₹{claimed_gain_sharing:.2f} Cr",
-        f"  Approved: ₹0.00 Cr",
-        "",
-        "Reasons for disallowance:",
-        f"  1. Unbridged revenue gap of ₹{unbridged_revenue_gap:.2f} Cr as on 31.03.2023",
-        f"  2. Actual T&D loss INCREASED from 9.27% (2022-23) to {actual_td_loss:.2f}% (2023-24)",
-        "  3. Loss reduction is relative to target, not absolute improvement",
-        "",
-        "Note: Commission also decided NOT to impose penalty for under-achievement,",
-        "considering force majeure (unprecedented 10.75% demand growth, drought).",
-    ])
+    # The gain only feeds the steps and details; the result is always
+    # disallowed, so summary-only calls skip it entirely.
+    calc_steps = LazySteps(
+        _render_td_share_steps,
+        approved_td_loss_pct, actual_td_loss_ksebl_pct, actual_td_loss,
+        loss_reduction_pp, energy_sales_mu, avg_pp_cost_per_unit,
+        utility_share_ratio, claimed_gain_sharing, unbridged_revenue_gap,
+    ) if include_steps else []
 
     # Always disallowed in FY 2023-24
     flag = 'RED'
-    recommendation = (
-        f"DISALLOW gain sharing of ₹{claimed_gain_sharing:.2f} Cr. "
-        f"While T&D loss ({actual_td_loss:.2f}%) is below target ({approved_td_loss_pct:.2f}%), "
-        f"the unbridged revenue gap of ₹{unbridged_revenue_gap:.2f} Cr and year-on-year "
-        f"increase in T&D loss justifies disallowance. No penalty imposed either (force majeure)."
+    recommendation = _TD_SHARE_REC.format(
+        claimed=claimed_gain_sharing, actual=actual_td_loss,
+        approved=approved_td_loss_pct, gap=unbridged_revenue_gap,
     )
 
-    return {
-        'heuristic_id': 'TD-SHARE-01',
-        'heuristic_name': 'T&D Loss Gain Sharing',
-        'line_item': 'T&D Loss Gain Sharing',
+    result = {
+        **_TD_SHARE_TEMPLATE,
         'claimed_value': round(claimed_gain_sharing, 2),
         'allowable_value': 0.0,
         'variance_absolute': round(claimed_gain_sharing, 2),
@@ -909,28 +1274,320 @@ def heuristic_TD_SHARE_01(
         'flag': flag,
         'recommended_amount': 0.0,
         'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulations 14(1) & 73(3), Tariff Regulations 2021',
         'calculation_steps': calc_steps,
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
         'depends_on': ['DIST-LOSS-01', 'TRANS-LOSS-01'],
-        'is_primary': True,
-        'output_type': 'approved_amount',
-        'td_share_details': {
+    }
+    if include_details:
+        if loss_reduction_pp > 0:
+            _, _, energy_saved_mu, monetary_gain_cr, utility_share_cr = _td_share_gain(
+                approved_td_loss_pct, actual_td_loss, energy_sales_mu,
+                avg_pp_cost_per_unit, utility_share_ratio,
+            )
+            r_energy_saved = round(energy_saved_mu, 2)
+            r_monetary_gain = round(monetary_gain_cr, 2)
+            r_utility_share = round(utility_share_cr, 2)
+        else:
+            r_energy_saved = r_monetary_gain = r_utility_share = 0
+        result['td_share_details'] = {
             'approved_td_loss_pct': approved_td_loss_pct,
             'actual_td_loss_ksebl_pct': actual_td_loss_ksebl_pct,
             'actual_td_loss_kserc_pct': actual_td_loss_kserc_pct,
             'loss_reduction_pp': round(loss_reduction_pp, 2),
-            'energy_saved_mu': round(energy_saved_mu, 2) if loss_reduction_pp > 0 else 0,
-            'monetary_gain_cr': round(monetary_gain_cr, 2) if loss_reduction_pp > 0 else 0,
-            'utility_share_cr': round(utility_share_cr, 2) if loss_reduction_pp > 0 else 0,
+            'energy_saved_mu': r_energy_saved,
+            'monetary_gain_cr': r_monetary_gain,
+            'utility_share_cr': r_utility_share,
             'unbridged_revenue_gap': unbridged_revenue_gap,
             'disallowance_reason': 'Unbridged revenue gap + YoY loss increase',
         }
+    return result
+
+
+# ============================================================================
+# BATCH EVALUATION: many filings / years in one NumPy pass
+# ============================================================================
+
+def heuristic_PP_COST_01_batch(
+    cost_of_generation_sbug_claimed,
+    cost_of_generation_sbug_approved,
+    cost_of_transmission_sbut_claimed,
+    cost_of_transmission_sbut_approved,
+    external_pp_claimed,
+    external_pp_approved,
+    total_energy_purchased_mu,
+    myt_approved_total_pp,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized PP-COST-01 over 1-D arrays (one element per filing).
+
+    Same totals, variances and ±2% / ±5% flags as heuristic_PP_COST_01.
+    Scalars broadcast against arrays. Returns a dict of arrays (no
+    calculation steps or recommendation text).
+    """
+    (sbug_c, sbug_a, sbut_c, sbut_a, ext_c, ext_a,
+     energy_mu, myt_pp) = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            cost_of_generation_sbug_claimed, cost_of_generation_sbug_approved,
+            cost_of_transmission_sbut_claimed, cost_of_transmission_sbut_approved,
+            external_pp_claimed, external_pp_approved,
+            total_energy_purchased_mu, myt_approved_total_pp))
+    )
+
+    (total_claimed, total_approved, total_variance,
+     ext_variance, myt_deviation) = _pp_cost_core(sbug_c, sbug_a, sbut_c, sbut_a, ext_c, ext_a, myt_pp)
+    total_variance_pct = safe_pct_array(total_variance, total_approved)
+
+    actual_avg_rate = safe_ratio_array(ext_a * 100, energy_mu)
+
+    ext_variance_pct = safe_pct_array(ext_variance, ext_a)
+
+    myt_deviation_pct = safe_pct_array(myt_deviation, myt_pp)
+
+    flag = np.take(_FLAGS, np.searchsorted(_PP_COST_THRESHOLDS, np.abs(total_variance_pct), side='left'))
+
+    return {
+        'total_claimed': total_claimed,
+        'total_approved': total_approved,
+        'total_variance': total_variance,
+        'total_variance_pct': total_variance_pct,
+        'actual_avg_rate': actual_avg_rate,
+        'ext_variance_pct': ext_variance_pct,
+        'myt_deviation': myt_deviation,
+        'myt_deviation_pct': myt_deviation_pct,
+        'flag': flag,
+    }
+
+
+# Input columns for score_pp_cost_01_frame (scalar parameter names)
+_PP_COST_FRAME_COLUMNS = (
+    'cost_of_generation_sbug_claimed',
+    'cost_of_generation_sbug_approved',
+    'cost_of_transmission_sbut_claimed',
+    'cost_of_transmission_sbut_approved',
+    'external_pp_claimed',
+    'external_pp_approved',
+    'total_energy_purchased_mu',
+    'myt_approved_total_pp',
+)
+
+
+def score_pp_cost_01_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Score every row of a filings DataFrame with PP-COST-01.
+
+    df needs the _PP_COST_FRAME_COLUMNS plus 'banking_swap_disallowed'
+    (used in the YELLOW recommendation). Returns a new DataFrame on the
+    same index with the batch outputs rounded to 2 dp, the flag and
+    'recommendation_text'. Replaces
+    df.apply(lambda row: heuristic_PP_COST_01(**row), axis=1).
+    """
+    batch = heuristic_PP_COST_01_batch(*(df[col].to_numpy(dtype=float) for col in _PP_COST_FRAME_COLUMNS))
+    bands = np.searchsorted(_PP_COST_THRESHOLDS, np.abs(batch['total_variance_pct']), side='left')
+
+    recommendations = [
+        _PP_COST_RECS[band].format(
+            total_approved=approved, total_variance=variance, banking_swap_disallowed=swap,
+        )
+        for band, approved, variance, swap in zip(
+            bands.tolist(), batch['total_approved'].tolist(),
+            batch['total_variance'].tolist(), df['banking_swap_disallowed'].tolist(),
+        )
+    ]
+
+    scored = pd.DataFrame(
+        {key: values for key, values in batch.items() if key != 'flag'}, index=df.index
+    ).round(2)
+    scored['flag'] = batch['flag']
+    scored['recommendation_text'] = recommendations
+    return scored
+
+
+def heuristic_OM_DIST_NORM_01_batch(
+    num_consumers,
+    num_dtrs,
+    ht_line_km,
+    lt_line_km,
+    energy_sales_mu,
+    norm_per_1000_consumers,
+    norm_per_dtr,
+    norm_per_ht_km,
+    norm_per_lt_km,
+    norm_per_mu,
+    gfa_sbu_d_opening,
+    gfa_derecognized,
+    gfa_land,
+    claimed_total_om,
+    rm_rate=0.04,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized OM-DIST-NORM-01 over 1-D arrays (one element per filing).
+
+    Same 5-parameter Employee + A&G formula, R&M on net GFA and flags as
+    heuristic_OM_DIST_NORM_01. Returns a dict of arrays.
+    """
+    (consumers, dtrs, ht_km, lt_km, sales_mu,
+     n_cons, n_dtr, n_ht, n_lt, n_mu,
+     gfa, derecognized, land, claimed, rate) = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            num_consumers, num_dtrs, ht_line_km, lt_line_km, energy_sales_mu,
+            norm_per_1000_consumers, norm_per_dtr, norm_per_ht_km,
+            norm_per_lt_km, norm_per_mu,
+            gfa_sbu_d_opening, gfa_derecognized, gfa_land,
+            claimed_total_om, rm_rate))
+    )
+
+    (_, _, _, _, _, total_employee_ag,
+     net_gfa, rm_allowable, total_normative_om) = _om_dist_norm_core(
+        consumers, dtrs, ht_km, lt_km, sales_mu,
+        n_cons, n_dtr, n_ht, n_lt, n_mu, gfa, derecognized, land, rate,
+    )
+
+    total_variance = claimed - total_normative_om
+    total_variance_pct = safe_pct_array(total_variance, total_normative_om)
+
+    # Within ±2% or below norms → GREEN; above norms beyond 2% → YELLOW
+    flag = np.where((np.abs(total_variance_pct) > 2) & (total_variance > 0), 'YELLOW', 'GREEN')
+
+    return {
+        'total_employee_ag': total_employee_ag,
+        'rm_allowable': rm_allowable,
+        'net_gfa': net_gfa,
+        'total_normative_om': total_normative_om,
+        'total_variance': total_variance,
+        'total_variance_pct': total_variance_pct,
+        'flag': flag,
+    }
+
+
+def heuristic_IFC_SD_01_batch(
+    actual_disbursement,
+    avg_security_deposit,
+    interest_rate_applied,
+    claimed_sd_interest,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized IFC-SD-01 over 1-D arrays (one element per filing).
+
+    Allowable is the actual disbursement, as in heuristic_IFC_SD_01.
+    Returns a dict of arrays.
+    """
+    allowable, avg_sd, rate, claimed = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            actual_disbursement, avg_security_deposit,
+            interest_rate_applied, claimed_sd_interest))
+    )
+
+    variance_abs = claimed - allowable
+    variance_pct = safe_pct_array(variance_abs, allowable)
+
+    expected_interest = avg_sd * rate / 100
+    reasonableness_ratio = safe_ratio_array(allowable, expected_interest)
+
+    flag = np.where(np.abs(variance_pct) <= 2, 'GREEN', 'YELLOW')
+
+    return {
+        'allowable': allowable,
+        'variance_absolute': variance_abs,
+        'variance_percentage': variance_pct,
+        'expected_interest': expected_interest,
+        'reasonableness_ratio': reasonableness_ratio,
+        'flag': flag,
+    }
+
+
+def heuristic_IFC_CC_01_batch(
+    revenue_gap_as_on_01_04,
+    avg_gpf_balance,
+    excess_security_deposit,
+    avg_interest_rate,
+    claimed_carrying_cost,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized IFC-CC-01 over 1-D arrays (one element per filing).
+
+    Same net-gap floor at zero and flags as heuristic_IFC_CC_01.
+    Returns a dict of arrays.
+    """
+    gap, gpf, excess_sd, rate, claimed = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            revenue_gap_as_on_01_04, avg_gpf_balance, excess_security_deposit,
+            avg_interest_rate, claimed_carrying_cost))
+    )
+
+    net_gap = np.maximum(0.0, gap - gpf - excess_sd)
+    allowable_cc, variance_abs = _ifc_cc_core(net_gap, rate, claimed)
+    variance_pct = safe_pct_array(variance_abs, allowable_cc)
+
+    flag = np.where((np.abs(variance_pct) > 2) & (variance_abs > 0), 'YELLOW', 'GREEN')
+
+    return {
+        'net_gap': net_gap,
+        'allowable_cc': allowable_cc,
+        'variance_absolute': variance_abs,
+        'variance_percentage': variance_pct,
+        'flag': flag,
+    }
+
+
+def heuristic_IFC_OTH_D_01_batch(
+    other_bank_charges,
+    interest_on_power_purchase,
+    claimed_other_interest,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized IFC-OTH-D-01 over 1-D arrays (one element per filing).
+
+    Same ₹0.5 Cr tolerance as heuristic_IFC_OTH_D_01. Returns a dict of arrays.
+    """
+    bank, pp_interest, claimed = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            other_bank_charges, interest_on_power_purchase, claimed_other_interest))
+    )
+
+    calculated_total = bank + pp_interest
+    variance_abs = claimed - calculated_total
+    flag = np.where(np.abs(variance_abs) < 0.5, 'GREEN', 'YELLOW')
+
+    return {
+        'calculated_total': calculated_total,
+        'variance_absolute': variance_abs,
+        'flag': flag,
+    }
+
+
+def heuristic_DIST_LOSS_01_batch(
+    energy_input_to_dist_mu,
+    energy_output_mu,
+    myt_target_dist_loss_pct,
+    collection_efficiency_pct=100.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized DIST-LOSS-01 over 1-D arrays (one element per filing).
+
+    Same distribution loss %, AT&C loss % and flag bands as
+    heuristic_DIST_LOSS_01. Returns a dict of arrays.
+    """
+    input_mu, output_mu, target_pct, ce_pct = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            energy_input_to_dist_mu, energy_output_mu,
+            myt_target_dist_loss_pct, collection_efficiency_pct))
+    )
+
+    distribution_loss_mu = input_mu - output_mu
+    actual_dist_loss_pct = safe_pct_array(distribution_loss_mu, input_mu)
+    variance_pp = actual_dist_loss_pct - target_pct
+
+    atc_loss_pct = np.where(
+        input_mu > 0, (1 - safe_ratio_array(output_mu, input_mu) * (ce_pct / 100)) * 100, 0.0
+    )
+
+    flag = np.take(_FLAGS, np.searchsorted(_DIST_LOSS_THRESHOLDS, variance_pp, side='left'))
+
+    return {
+        'distribution_loss_mu': distribution_loss_mu,
+        'actual_dist_loss_pct': actual_dist_loss_pct,
+        'variance_pp': variance_pp,
+        'atc_loss_pct': atc_loss_pct,
+        'flag': flag,
     }
 
 
@@ -938,6 +1595,18 @@ def heuristic_TD_SHARE_01(
 # CONVENIENCE: Run all distribution heuristics
 # ============================================================================
 
+# Run order of run_all_distribution_heuristics: (heuristic, params argument)
+_DIST_HEURISTICS = (
+    (heuristic_PP_COST_01, 'pp_params'),            # 1. Power Purchase Cost
+    (heuristic_OM_DIST_NORM_01, 'om_params'),       # 2. Distribution O&M
+    (heuristic_IFC_SD_01, 'sd_params'),             # 3. Interest on Security Deposits
+    (heuristic_IFC_CC_01, 'cc_params'),             # 4. Carrying Cost on Revenue Gap
+    (heuristic_IFC_OTH_D_01, 'oth_params'),         # 5. Other Interest
+    (heuristic_DIST_LOSS_01, 'dist_loss_params'),   # 6. Distribution Loss
+    (heuristic_TD_SHARE_01, 'td_share_params'),     # 7. T&D Gain Sharing
+)
+
+
 def run_all_distribution_heuristics(
     pp_params: Optional[Dict] = None,
     om_params: Optional[Dict] = None,
@@ -946,36 +1615,26 @@ def run_all_distribution_heuristics(
     oth_params: Optional[Dict] = None,
     dist_loss_params: Optional[Dict] = None,
     td_share_params: Optional[Dict] = None,
+    *,
+    include_steps: bool = True,
 ) -> List[Dict]:
-    """Run all 7 distribution-specific heuristics and return results."""
-    results = []
-
-    # 1. Power Purchase Cost
-    pp = pp_params or {}
-    results.append(heuristic_PP_COST_01(**pp))
-
-    # 2. Distribution O&M
-    om = om_params or {}
-    results.append(heuristic_OM_DIST_NORM_01(**om))
-
-    # 3. Interest on Security Deposits
-    sd = sd_params or {}
-    results.append(heuristic_IFC_SD_01(**sd))
-
-    # 4. Carrying Cost on Revenue Gap
-    cc = cc_params or {}
-    results.append(heuristic_IFC_CC_01(**cc))
-
-    # 5. Other Interest
-    oth = oth_params or {}
-    results.append(heuristic_IFC_OTH_D_01(**oth))
-
-    # 6. Distribution Loss
-    dl = dist_loss_params or {}
-    results.append(heuristic_DIST_LOSS_01(**dl))
-
-    # 7. T&D Gain Sharing
-    td = td_share_params or {}
-    results.append(heuristic_TD_SHARE_01(**td))
+    """
+    Run all 7 distribution-specific heuristics and return results.
 
-    return results
+    include_steps is passed to every heuristic (False for summary-only
+    runs) unless its params dict sets include_steps itself;
+    include_details can still be set per heuristic in its params dict.
+    """
+    params = {
+        'pp_params': pp_params,
+        'om_params': om_params,
+        'sd_params': sd_params,
+        'cc_params': cc_params,
+        'oth_params': oth_params,
+        'dist_loss_params': dist_loss_params,
+        'td_share_params': td_share_params,
+    }
+    return [
+        fn(**{'include_steps': include_steps, **(params[key] or {})})
+        for fn, key in _DIST_HEURISTICS
+    ]
@@ -3,8 +3,54 @@ Fuel Costs Heuristics for SBU-G
 Contains: FUEL-01
 """
 
+from math import fsum
 from typing import Dict, List, Optional
 
+from heuristics.result_cache import cached_result
+from heuristics.result_fields import STAFF_REVIEW_DEFAULTS
+
+# Constant result fields; each call merges in only the computed ones.
+_FUEL_TEMPLATE = {
+    # Identification
+    'heuristic_id': 'FUEL-01',
+    'heuristic_name': 'Fuel Costs Validation',
+    'line_item': 'Fuel Costs',
+    'regulatory_basis': 'Regulation 51, Tariff Regulations 2021 (Operational Consumables)',
+
+    # Metadata
+    'is_primary': True,  # PRIMARY HEURISTIC - determines approved fuel cost
+    'output_type': 'approved_amount',
+    'note': 'Pass-through item - no MYT baseline, approved as actual from audited accounts',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+# Station breakdown keys shown in the calculation steps, in display order
+_STATION_FUEL_TYPES = (
+    ('heavy_fuel_oil', "Heavy Fuel Oil"),
+    ('hsd_oil', "HSD Oil"),
+    ('lube_oil', "Lube Oil"),
+    ('lubricants', "Lubricants"),
+)
+
+# Calculation-step blocks, filled from the heuristic's locals
+_FUEL_TOTALS_TEMPLATE = "\n".join((
+    "",
+    "Total Calculated: ₹{calculated_total:.2f} Cr",
+    "KSEB Claimed: ₹{total_claimed_fuel_cost:.2f} Cr",
+    "Variance: {variance_abs:+.4f} Cr ({variance_pct:+.2f}%)",
+    "",
+))
+_FUEL_YOY_TEMPLATE = "\n".join((
+    "═══ YEAR-OVER-YEAR TREND ═══",
+    "Previous Year (2022-23): ₹{previous_year_fuel_cost:.2f} Cr",
+    "Current Year (2023-24): ₹{total_claimed_fuel_cost:.2f} Cr",
+    "Change: {yoy_change:+.2f} Cr ({yoy_change_pct:+.1f}%)",
+    "",
+))
+
+
+@cached_result(maxsize=512)
 def heuristic_FUEL_01(
     # Fuel type totals
     heavy_fuel_oil: float = 0.0,
@@ -45,13 +91,8 @@ def heuristic_FUEL_01(
         Heuristic result dictionary with fuel cost validation
     """
     
-    # Calculate total from components
-    calculated_total = (
-        heavy_fuel_oil +
-        hsd_oil +
-        lube_oil +
-        lubricants_consumables
-    )
+    # Calculate total from components (exactly rounded sum of the ledger figures)
+    calculated_total = fsum((heavy_fuel_oil, hsd_oil, lube_oil, lubricants_consumables))
     
     # Variance between claimed and calculated
     variance_abs = total_claimed_fuel_cost - calculated_total
@@ -94,35 +135,24 @@ def heuristic_FUEL_01(
         "Note: Fuel costs are pass-through items based on actual consumption.",
         "No MYT baseline exists - costs depend on generation & maintenance needs.",
         "",
-        "═══ FUEL TYPE BREAKDOWN ═══"
+        "═══ FUEL TYPE BREAKDOWN ═══",
+        # Only the fuel types actually consumed
+        *[
+            f"{label}: ₹{amount:.2f} Cr"
+            for label, amount in (
+                ("Heavy Fuel Oil (Diesel Stations)", heavy_fuel_oil),
+                ("HSD Oil", hsd_oil),
+                ("Lube Oil (Hydel Stations)", lube_oil),
+                ("Lubricants & Consumables", lubricants_consumables),
+            )
+            if amount > 0
+        ],
+        *_FUEL_TOTALS_TEMPLATE.format_map(locals()).split("\n"),
     ]
     
-    if heavy_fuel_oil > 0:
-        calc_steps.append(f"Heavy Fuel Oil (Diesel Stations): ₹{heavy_fuel_oil:.2f} Cr")
-    if hsd_oil > 0:
-        calc_steps.append(f"HSD Oil: ₹{hsd_oil:.2f} Cr")
-    if lube_oil > 0:
-        calc_steps.append(f"Lube Oil (Hydel Stations): ₹{lube_oil:.2f} Cr")
-    if lubricants_consumables > 0:
-        calc_steps.append(f"Lubricants & Consumables: ₹{lubricants_consumables:.2f} Cr")
-    
-    calc_steps.extend([
-        "",
-        f"Total Calculated: ₹{calculated_total:.2f} Cr",
-        f"KSEB Claimed: ₹{total_claimed_fuel_cost:.2f} Cr",
-        f"Variance: {variance_abs:+.4f} Cr ({variance_pct:+.2f}%)",
-        ""
-    ])
-    
     # Add year-over-year comparison if available
     if previous_year_fuel_cost > 0:
-        calc_steps.extend([
-            "═══ YEAR-OVER-YEAR TREND ═══",
-            f"Previous Year (2022-23): ₹{previous_year_fuel_cost:.2f} Cr",
-            f"Current Year (2023-24): ₹{total_claimed_fuel_cost:.2f} Cr",
-            f"Change: {yoy_change:+.2f} Cr ({yoy_change_pct:+.1f}%)",
-            ""
-        ])
+        calc_steps += _FUEL_YOY_TEMPLATE.format_map(locals()).split("\n")
         
         if trend_note:
             calc_steps.append(trend_note)
@@ -130,22 +160,19 @@ def heuristic_FUEL_01(
     
     # Add station-wise breakdown if provided
     if station_breakdown:
-        calc_steps.append("═══ STATION-WISE BREAKDOWN ═══")
+        station_steps = ["═══ STATION-WISE BREAKDOWN ═══"]
         for station in station_breakdown:
-            station_name = station.get('name', 'Unknown')
-            station_total = station.get('total', 0.0)
-            calc_steps.append(f"{station_name}: ₹{station_total:.2f} Cr")
-            
+            station_steps.append(
+                f"{station.get('name', 'Unknown')}: ₹{station.get('total', 0.0):.2f} Cr"
+            )
             # Show fuel types for this station if available
-            if station.get('heavy_fuel_oil', 0) > 0:
-                calc_steps.append(f"  - Heavy Fuel Oil: ₹{station['heavy_fuel_oil']:.2f} Cr")
-            if station.get('hsd_oil', 0) > 0:
-                calc_steps.append(f"  - HSD Oil: ₹{station['hsd_oil']:.2f} Cr")
-            if station.get('lube_oil', 0) > 0:
-                calc_steps.append(f"  - Lube Oil: ₹{station['lube_oil']:.2f} Cr")
-            if station.get('lubricants', 0) > 0:
-                calc_steps.append(f"  - Lubricants: ₹{station['lubricants']:.2f} Cr")
-        calc_steps.append("")
+            station_steps += [
+                f"  - {label}: ₹{station[key]:.2f} Cr"
+                for key, label in _STATION_FUEL_TYPES
+                if station.get(key, 0) > 0
+            ]
+        station_steps.append("")
+        calc_steps.extend(station_steps)
     
     calc_steps.extend([
         "Regulatory Basis:",
@@ -168,43 +195,26 @@ def heuristic_FUEL_01(
     }
     
     return {
-        # Identification
-        'heuristic_id': 'FUEL-01',
-        'heuristic_name': 'Fuel Costs Validation',
-        'line_item': 'Fuel Costs',
-        
+        **_FUEL_TEMPLATE,
+
         # Calculation Results
         'claimed_value': total_claimed_fuel_cost,
         'allowable_value': calculated_total,
         'variance_absolute': variance_abs,
         'variance_percentage': variance_pct,
-        
+
         # Tool's Assessment
         'flag': flag,
         'recommended_amount': calculated_total,
         'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation 51, Tariff Regulations 2021 (Operational Consumables)',
-        
+
         # Calculation Details
         'calculation_steps': calc_steps,
-        
+
         # Detailed breakdown
         'fuel_breakdown': fuel_breakdown,
         'station_breakdown': station_breakdown if station_breakdown else [],
-        
-        # Staff Review Section
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        
+
         # Dependencies
         'depends_on': [],  # Independent calculation
-        
-        # Metadata
-        'is_primary': True,  # PRIMARY HEURISTIC - determines approved fuel cost
-        'output_type': 'approved_amount',
-        'note': 'Pass-through item - no MYT baseline, approved as actual from audited accounts'
     }
\ No newline at end of file
@@ -4,8 +4,101 @@ Interest & Finance Charges Heuristics for KSERC Truing-Up Tool
 Contains 4 heuristics: IFC-LTL-01, IFC-WC-01, IFC-GPF-01, IFC-OTH-02
 """
 
-from datetime import datetime
-from typing import Dict, Optional
+from enum import IntEnum
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from heuristics.batch_math import nonzero_pct_array
+from heuristics.lazy_steps import LazySteps
+from heuristics.result_fields import apply_staff_review, flag_band
+
+_FLAGS = ('GREEN', 'YELLOW', 'RED')
+
+
+class Flag(IntEnum):
+    """Flag severity, ordered so max() picks the worse flag; indexes _FLAGS."""
+    GREEN = 0
+    YELLOW = 1
+    RED = 2
+
+
+# Three-band flag tables: flag_band / searchsorted(side='left') on the
+# thresholds indexes _FLAGS (x <= t0 GREEN, x <= t1 YELLOW, else RED).
+_WC_THRESHOLDS = (5.0, 15.0)     # |variance %|
+_GPF_THRESHOLDS = (2.0, 5.0)     # |variance %|
+_BANK_THRESHOLDS = (0.5, 1.0)    # bank charges, ₹ Cr
+
+# IFC-LTL-01 variance bands on |variance %|: <=5, (5, 15], >15.
+# A 5-15% gap is RED (wrong methodology); above 15% the usual cause is a
+# wrong interest rate, flagged YELLOW. _LTL_BAND_FLAGS gives each band's
+# index into _FLAGS; disputed claims / high-cost loans raise it to YELLOW.
+_LTL_THRESHOLDS = (5.0, 15.0)
+_LTL_BAND_FLAGS = (Flag.GREEN, Flag.RED, Flag.YELLOW)
+
+
+def _variance_and_band(claimed: float, allowable: float, thresholds: Tuple[float, float]) -> Tuple:
+    """
+    Variance of claimed over allowable and its flag band on |variance %|.
+
+    Returns (variance_absolute, variance_percentage, band); the percentage
+    is 0 when allowable is 0, and band indexes _FLAGS via thresholds.
+    """
+    variance_absolute = claimed - allowable
+    variance_percentage = (variance_absolute / allowable * 100) if allowable != 0 else 0
+    return variance_absolute, variance_percentage, flag_band(thresholds, abs(variance_percentage))
+
+
+def _ifc_ltl_core(opening_normative_loan, gfa_additions, depreciation, opening_interest_rate) -> Tuple:
+    """
+    Numeric core of IFC-LTL-01; works element-wise on NumPy arrays too.
+
+    Returns (closing_normative_loan, average_normative_loan, allowable_interest).
+    """
+    closing_normative_loan = opening_normative_loan + gfa_additions - depreciation
+    average_normative_loan = (opening_normative_loan + closing_normative_loan) / 2
+    allowable_interest = (average_normative_loan * opening_interest_rate) / 100
+    return closing_normative_loan, average_normative_loan, allowable_interest
+
+
+def _render_ifc_ltl_steps(
+    opening_normative_loan, disputed_claims, gfa_additions, depreciation,
+    closing_normative_loan, average_normative_loan, opening_interest_rate,
+    allowable_interest, claimed_interest, variance_absolute, variance_percentage,
+) -> List[str]:
+    """Render IFC-LTL-01 calculation steps for display."""
+    steps = [
+        f"Opening Normative Loan (01.04.YYYY): ₹{opening_normative_loan:.2f} Cr",
+        f"Add: GFA Additions (FY): ₹{gfa_additions:.2f} Cr",
+        f"Less: Depreciation (FY): ₹{depreciation:.2f} Cr",
+        f"Closing Normative Loan (31.03.YYYY): ₹{closing_normative_loan:.2f} Cr",
+        f"Average Normative Loan: ₹{average_normative_loan:.2f} Cr",
+        f"Opening Interest Rate: {opening_interest_rate:.2f}%",
+        f"Allowable Interest: ₹{allowable_interest:.2f} Cr",
+        f"KSEB Claimed: ₹{claimed_interest:.2f} Cr",
+        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
+    ]
+    if disputed_claims > 0:
+        steps.insert(1, f"Note: Disputed claims of ₹{disputed_claims:.2f} Cr detected")
+    return steps
+
+
+# Constant result fields; each call merges in only the computed ones.
+_IFC_LTL_TEMPLATE = {
+    'heuristic_id': 'IFC-LTL-01',
+    'heuristic_name': 'Interest on Long-Term Loans',
+    'line_item': 'Interest & Finance Charges',
+    'regulatory_basis': 'Regulation 29, Tariff Regulations 2021; Normative loan methodology per MYT framework',
+    'is_primary': True,
+    'output_type': 'normative',
+}
+
+# Recommendation notes, filled with str.format at the flag decision
+_LTL_NOTE_DISPUTED = "KSEB included ₹{disputed:.2f} Cr disputed claims in opening loan. Verify APTEL status before allowing."
+_LTL_NOTE_WRONG_RATE = "Large variance ({variance_pct:.2f}%) suggests KSEB may have used incorrect interest rate (e.g., previous year average instead of opening rate)."
+_LTL_NOTE_VARIANCE = "Significant variance ({variance_pct:.2f}%). Verify interest rate and loan calculation methodology."
+_LTL_NOTE_HIGH_RATE = "High-cost loan detected ({rate:.2f}%). Verify refinancing efforts as per Commission directives."
+_LTL_BAND_NOTES = (None, _LTL_NOTE_VARIANCE, _LTL_NOTE_WRONG_RATE)  # indexed by variance band
 
 
 def heuristic_IFC_LTL_01(
@@ -18,7 +111,9 @@ def heuristic_IFC_LTL_01(
     highest_loan_rate: Optional[float] = None,
     staff_name: str = "",
     staff_approved_amount: Optional[float] = None,
-    staff_justification: str = ""
+    staff_justification: str = "",
+    *,
+    include_steps: bool = True,
 ) -> Dict:
     """
     IFC-LTL-01: Interest on Long-Term Loans
@@ -40,6 +135,10 @@ def heuristic_IFC_LTL_01(
         staff_name: Name of staff reviewing this heuristic
         staff_approved_amount: Amount approved by staff (overrides recommended)
         staff_justification: Staff justification for override
+        include_steps: False skips the calculation steps and the
+            recommendation notes (calculation_steps is [] and
+            recommendation_text is '') for callers that only need the
+            numbers and flag, e.g. re-scoring after a staff override
     
     Returns:
         Heuristic result dictionary with normative interest calculation
@@ -50,105 +149,65 @@ def heuristic_IFC_LTL_01(
         RED: Large variance (>15%)
     """
     
-    heuristic_id = "IFC-LTL-01"
-    heuristic_name = "Interest on Long-Term Loans"
-    line_item = "Interest & Finance Charges"
-    
-    # Step 1: Calculate closing normative loan
-    closing_normative_loan = opening_normative_loan + gfa_additions - depreciation
-    
-    # Step 2: Calculate average normative loan
-    average_normative_loan = (opening_normative_loan + closing_normative_loan) / 2
-    
-    # Step 3: Calculate allowable interest
-    allowable_interest = (average_normative_loan * opening_interest_rate) / 100
-    
-    # Step 4: Calculate variance
-    variance_absolute = claimed_interest - allowable_interest
-    variance_percentage = (variance_absolute / allowable_interest * 100) if allowable_interest != 0 else 0
-    
-    # Step 5: Determine flag and recommendation
-    flag = 'GREEN'
-    notes = []
-    
-    # Check 1: Disputed claims
-    if disputed_claims > 0:
-        flag = 'YELLOW'
-        notes.append(f"KSEB included ₹{disputed_claims:.2f} Cr disputed claims in opening loan. Verify APTEL status before allowing.")
-    
-    # Check 2: Variance analysis (interest rate validation)
-    abs_variance_pct = abs(variance_percentage)
-    if abs_variance_pct > 15:
-        if flag != 'YELLOW':
-            flag = 'YELLOW'
-        notes.append(f"Large variance ({variance_percentage:.2f}%) suggests KSEB may have used incorrect interest rate (e.g., previous year average instead of opening rate).")
-    elif abs_variance_pct > 5:
-        flag = 'RED'
-        notes.append(f"Significant variance ({variance_percentage:.2f}%). Verify interest rate and loan calculation methodology.")
-    elif abs_variance_pct <= 2:
-        if flag != 'YELLOW':
-            flag = 'GREEN'
-    
-    # Check 3: High-cost loan alert
-    if highest_loan_rate is not None and highest_loan_rate > 9.0:
-        if flag == 'GREEN':
-            flag = 'YELLOW'
-        notes.append(f"High-cost loan detected ({highest_loan_rate:.2f}%). Verify refinancing efforts as per Commission directives.")
-    
-    # Build recommendation text
-    if flag == 'GREEN':
-        recommendation_text = f"Approve normative interest of ₹{allowable_interest:.2f} Cr. Calculation verified."
+    # Steps 1-3: Closing and average normative loan, allowable interest
+    closing_normative_loan, average_normative_loan, allowable_interest = _ifc_ltl_core(
+        opening_normative_loan, gfa_additions, depreciation, opening_interest_rate
+    )
+    
+    # Steps 4-5: Variance and flag band
+    variance_absolute, variance_percentage, band = _variance_and_band(
+        claimed_interest, allowable_interest, _LTL_THRESHOLDS
+    )
+    high_cost_loan = highest_loan_rate is not None and highest_loan_rate > 9.0
+    flag_code = _LTL_BAND_FLAGS[band]
+    if disputed_claims > 0 or high_cost_loan:
+        flag_code = max(flag_code, Flag.YELLOW)
+    
+    if include_steps:
+        notes = []
+        
+        # Check 1: Disputed claims
+        if disputed_claims > 0:
+            notes.append(_LTL_NOTE_DISPUTED.format(disputed=disputed_claims))
+        
+        # Check 2: Variance analysis (interest rate validation)
+        if band:
+            notes.append(_LTL_BAND_NOTES[band].format(variance_pct=variance_percentage))
+        
+        # Check 3: High-cost loan alert
+        if high_cost_loan:
+            notes.append(_LTL_NOTE_HIGH_RATE.format(rate=highest_loan_rate))
+        
+        # Build recommendation text
+        if flag_code == Flag.GREEN:
+            recommendation_text = f"Approve normative interest of ₹{allowable_interest:.2f} Cr. Calculation verified."
+        else:
+            recommendation_text = " ".join((f"Approve normative interest of ₹{allowable_interest:.2f} Cr.", *notes))
+        
+        # Calculation steps for transparency (rendered on first access)
+        calculation_steps = LazySteps(
+            _render_ifc_ltl_steps,
+            opening_normative_loan, disputed_claims, gfa_additions, depreciation,
+            closing_normative_loan, average_normative_loan, opening_interest_rate,
+            allowable_interest, claimed_interest, variance_absolute, variance_percentage,
+        )
     else:
-        recommendation_text = f"Approve normative interest of ₹{allowable_interest:.2f} Cr. " + " ".join(notes)
-    
-    # Calculation steps for transparency
-    calculation_steps = [
-        f"Opening Normative Loan (01.04.YYYY): ₹{opening_normative_loan:.2f} Cr",
-        f"Add: GFA Additions (FY): ₹{gfa_additions:.2f} Cr",
-        f"Less: Depreciation (FY): ₹{depreciation:.2f} Cr",
-        f"Closing Normative Loan (31.03.YYYY): ₹{closing_normative_loan:.2f} Cr",
-        f"Average Normative Loan: ₹{average_normative_loan:.2f} Cr",
-        f"Opening Interest Rate: {opening_interest_rate:.2f}%",
-        f"Allowable Interest: ₹{allowable_interest:.2f} Cr",
-        f"KSEB Claimed: ₹{claimed_interest:.2f} Cr",
-        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
-    ]
-    
-    if disputed_claims > 0:
-        calculation_steps.insert(1, f"Note: Disputed claims of ₹{disputed_claims:.2f} Cr detected")
-    
-    # Regulatory basis
-    regulatory_basis = "Regulation 29, Tariff Regulations 2021; Normative loan methodology per MYT framework"
+        recommendation_text = ""
+        calculation_steps = []
     
     # Staff review handling
-    staff_override_flag = None
-    staff_review_status = "Pending"
-    reviewed_by = None
-    reviewed_at = None
-    
-    if staff_approved_amount is not None:
-        if abs(staff_approved_amount - allowable_interest) < 0.01:
-            staff_review_status = "Accepted"
-        else:
-            staff_review_status = "Overridden"
-            staff_override_flag = "STAFF_OVERRIDE"
-        reviewed_by = staff_name if staff_name else None
-        reviewed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    final_approved_amount = staff_approved_amount if staff_approved_amount is not None else allowable_interest
+    (staff_review_status, staff_override_flag, reviewed_by, reviewed_at,
+     final_approved_amount) = apply_staff_review(allowable_interest, staff_approved_amount, staff_name)
     
     return {
-        'heuristic_id': heuristic_id,
-        'heuristic_name': heuristic_name,
-        'line_item': line_item,
+        **_IFC_LTL_TEMPLATE,
         'claimed_value': claimed_interest,
         'allowable_value': allowable_interest,
         'variance_absolute': variance_absolute,
         'variance_percentage': variance_percentage,
-        'flag': flag,
+        'flag': _FLAGS[flag_code],
         'recommended_amount': allowable_interest,
         'recommendation_text': recommendation_text,
-        'regulatory_basis': regulatory_basis,
         'calculation_steps': calculation_steps,
         'staff_override_flag': staff_override_flag,
         'staff_approved_amount': final_approved_amount,
@@ -157,11 +216,61 @@ def heuristic_IFC_LTL_01(
         'reviewed_by': reviewed_by,
         'reviewed_at': reviewed_at,
         'depends_on': ['DEP-GEN-01'],
-        'is_primary': True,
-        'output_type': 'normative'
     }
 
 
+def _ifc_wc_core(approved_om_expenses, opening_gfa_excl_land, sbi_eblr_rate) -> Tuple:
+    """
+    Numeric core of IFC-WC-01; works element-wise on NumPy arrays too.
+
+    Returns (one_month_om, one_percent_spares, working_capital,
+    wc_interest_rate, allowable_wc_interest).
+    """
+    one_month_om = approved_om_expenses / 12
+    one_percent_spares = opening_gfa_excl_land * 0.01
+    working_capital = one_month_om + one_percent_spares
+    wc_interest_rate = sbi_eblr_rate + 2.0
+    allowable_wc_interest = (working_capital * wc_interest_rate) / 100
+    return (one_month_om, one_percent_spares, working_capital,
+            wc_interest_rate, allowable_wc_interest)
+
+
+def _render_ifc_wc_steps(
+    approved_om_expenses, one_month_om, opening_gfa_excl_land,
+    one_percent_spares, working_capital, sbi_eblr_rate, wc_interest_rate,
+    allowable_wc_interest, claimed_wc_interest, variance_absolute, variance_percentage,
+) -> List[str]:
+    """Render IFC-WC-01 calculation steps for display."""
+    return [
+        f"Approved O&M Expenses (from OM-NORM-01): ₹{approved_om_expenses:.2f} Cr",
+        f"One Month O&M (÷12): ₹{one_month_om:.2f} Cr",
+        f"Opening GFA (excl. land): ₹{opening_gfa_excl_land:.2f} Cr",
+        f"1% Spares: ₹{one_percent_spares:.2f} Cr",
+        f"Total Working Capital: ₹{working_capital:.2f} Cr",
+        f"SBI EBLR Rate (01.04.YYYY): {sbi_eblr_rate:.2f}%",
+        f"WC Interest Rate (EBLR + 2%): {wc_interest_rate:.2f}%",
+        f"Allowable WC Interest: ₹{allowable_wc_interest:.2f} Cr",
+        f"KSEB Claimed: ₹{claimed_wc_interest:.2f} Cr",
+        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
+    ]
+
+
+# Constant result fields; each call merges in only the computed ones.
+_IFC_WC_TEMPLATE = {
+    'heuristic_id': 'IFC-WC-01',
+    'heuristic_name': 'Interest on Working Capital',
+    'line_item': 'Interest & Finance Charges',
+    'regulatory_basis': 'Regulation 32, Tariff Regulations 2021; Regulation 3(12) (Base rate = SBI EBLR)',
+    'is_primary': True,
+    'output_type': 'normative',
+}
+
+_WC_NOTE_VARIANCE = "Variance of {variance_pct:+.2f}% detected. Verify that KSEB used KSERC-approved O&M (not MYT baseline)."
+_WC_NOTE_NON_OM = "Large variance ({variance_pct:+.2f}%) suggests KSEB included non-O&M items (e.g., Master Trust Bond repayment, Additional Master Trust contribution)."
+_WC_NOTE_REG_32 = "Per Regulation 32, WC comprises ONLY: (1) O&M for 1 month, (2) 1% spares. No receivables for internal generation."
+_WC_BAND_NOTES = ((), (_WC_NOTE_VARIANCE,), (_WC_NOTE_NON_OM, _WC_NOTE_REG_32))  # indexed by flag band
+
+
 def heuristic_IFC_WC_01(
     approved_om_expenses: float,
     opening_gfa_excl_land: float,
@@ -169,7 +278,9 @@ def heuristic_IFC_WC_01(
     claimed_wc_interest: float,
     staff_name: str = "",
     staff_approved_amount: Optional[float] = None,
-    staff_justification: str = ""
+    staff_justification: str = "",
+    *,
+    include_steps: bool = True,
 ) -> Dict:
     """
     IFC-WC-01: Interest on Working Capital
@@ -187,6 +298,10 @@ def heuristic_IFC_WC_01(
         staff_name: Name of staff reviewing this heuristic
         staff_approved_amount: Amount approved by staff (overrides recommended)
         staff_justification: Staff justification for override
+        include_steps: False skips the calculation steps and the
+            recommendation notes (calculation_steps is [] and
+            recommendation_text is '') for callers that only need the
+            numbers and flag, e.g. re-scoring after a staff override
     
     Returns:
         Heuristic result dictionary with normative WC interest
@@ -197,79 +312,40 @@ def heuristic_IFC_WC_01(
         RED: Variance >15% (likely included Master Trust or other non-O&M items)
     """
     
-    heuristic_id = "IFC-WC-01"
-    heuristic_name = "Interest on Working Capital"
-    line_item = "Interest & Finance Charges"
+    # Steps 1-3: WC components, interest rate (SBI EBLR + 2%), allowable interest
+    (one_month_om, one_percent_spares, working_capital,
+     wc_interest_rate, allowable_wc_interest) = _ifc_wc_core(
+        approved_om_expenses, opening_gfa_excl_land, sbi_eblr_rate
+    )
     
-    # Step 1: Calculate working capital components
-    one_month_om = approved_om_expenses / 12
-    one_percent_spares = opening_gfa_excl_land * 0.01
-    working_capital = one_month_om + one_percent_spares
-    
-    # Step 2: Calculate interest rate (SBI EBLR + 2%)
-    wc_interest_rate = sbi_eblr_rate + 2.0
+    # Steps 4-5: Variance and flag band
+    variance_absolute, variance_percentage, band = _variance_and_band(
+        claimed_wc_interest, allowable_wc_interest, _WC_THRESHOLDS
+    )
+    flag = _FLAGS[band]
     
-    # Step 3: Calculate allowable WC interest
-    allowable_wc_interest = (working_capital * wc_interest_rate) / 100
-    
-    # Step 4: Calculate variance
-    variance_absolute = claimed_wc_interest - allowable_wc_interest
-    variance_percentage = (variance_absolute / allowable_wc_interest * 100) if allowable_wc_interest != 0 else 0
-    
-    # Step 5: Determine flag
-    abs_variance_pct = abs(variance_percentage)
-    notes = []
-    
-    if abs_variance_pct <= 5:
-        flag = 'GREEN'
-        recommendation_text = f"Approve normative WC interest of ₹{allowable_wc_interest:.2f} Cr."
-    elif abs_variance_pct <= 15:
-        flag = 'YELLOW'
-        notes.append(f"Variance of {variance_percentage:+.2f}% detected. Verify that KSEB used KSERC-approved O&M (not MYT baseline).")
-        recommendation_text = f"Approve normative WC interest of ₹{allowable_wc_interest:.2f} Cr. " + " ".join(notes)
+    if include_steps:
+        notes = [note.format(variance_pct=variance_percentage) for note in _WC_BAND_NOTES[band]]
+        
+        recommendation_text = " ".join((f"Approve normative WC interest of ₹{allowable_wc_interest:.2f} Cr.", *notes))
+        
+        # Calculation steps (rendered on first access)
+        calculation_steps = LazySteps(
+            _render_ifc_wc_steps,
+            approved_om_expenses, one_month_om, opening_gfa_excl_land,
+            one_percent_spares, working_capital, sbi_eblr_rate, wc_interest_rate,
+            allowable_wc_interest, claimed_wc_interest, variance_absolute, variance_percentage,
+        )
     else:
-        flag = 'RED'
-        notes.append(f"Large variance ({variance_percentage:+.2f}%) suggests KSEB included non-O&M items (e.g., Master Trust Bond repayment, Additional Master Trust contribution).")
-        notes.append("Per Regulation 32, WC comprises ONLY: (1) O&M for 1 month, (2) 1% spares. No receivables for internal generation.")
-        recommendation_text = f"Approve normative WC interest of ₹{allowable_wc_interest:.2f} Cr. " + " ".join(notes)
+        recommendation_text = ""
+        calculation_steps = []
     
-    # Calculation steps
-    calculation_steps = [
-        f"Approved O&M Expenses (from OM-NORM-01): ₹{approved_om_expenses:.2f} Cr",
-        f"One Month O&M (÷12): ₹{one_month_om:.2f} Cr",
-        f"Opening GFA (excl. land): ₹{opening_gfa_excl_land:.2f} Cr",
-        f"1% Spares: ₹{one_percent_spares:.2f} Cr",
-        f"Total Working Capital: ₹{working_capital:.2f} Cr",
-        f"SBI EBLR Rate (01.04.YYYY): {sbi_eblr_rate:.2f}%",
-        f"WC Interest Rate (EBLR + 2%): {wc_interest_rate:.2f}%",
-        f"Allowable WC Interest: ₹{allowable_wc_interest:.2f} Cr",
-        f"KSEB Claimed: ₹{claimed_wc_interest:.2f} Cr",
-        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
-    ]
-    
-    regulatory_basis = "Regulation 32, Tariff Regulations 2021; Regulation 3(12) (Base rate = SBI EBLR)"
-    
-    # Staff review
-    staff_override_flag = None
-    staff_review_status = "Pending"
-    reviewed_by = None
-    reviewed_at = None
-    
-    if staff_approved_amount is not None:
-        if abs(staff_approved_amount - allowable_wc_interest) < 0.01:
-            staff_review_status = "Accepted"
-        else:
-            staff_review_status = "Overridden"
-            staff_override_flag = "STAFF_OVERRIDE"
-        reviewed_by = staff_name if staff_name else None
-        reviewed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    final_approved_amount = staff_approved_amount if staff_approved_amount is not None else allowable_wc_interest
+    # Staff review handling
+    (staff_review_status, staff_override_flag, reviewed_by, reviewed_at,
+     final_approved_amount) = apply_staff_review(allowable_wc_interest, staff_approved_amount, staff_name)
     
     return {
-        'heuristic_id': heuristic_id,
-        'heuristic_name': heuristic_name,
-        'line_item': line_item,
+        **_IFC_WC_TEMPLATE,
         'claimed_value': claimed_wc_interest,
         'allowable_value': allowable_wc_interest,
         'variance_absolute': variance_absolute,
@@ -277,7 +353,6 @@ def heuristic_IFC_WC_01(
         'flag': flag,
         'recommended_amount': allowable_wc_interest,
         'recommendation_text': recommendation_text,
-        'regulatory_basis': regulatory_basis,
         'calculation_steps': calculation_steps,
         'staff_override_flag': staff_override_flag,
         'staff_approved_amount': final_approved_amount,
@@ -286,11 +361,60 @@ def heuristic_IFC_WC_01(
         'reviewed_by': reviewed_by,
         'reviewed_at': reviewed_at,
         'depends_on': ['OM-NORM-01'],
-        'is_primary': True,
-        'output_type': 'normative'
     }
 
 
+def _ifc_gpf_core(opening_gpf_balance_company, closing_gpf_balance_company,
+                  gpf_interest_rate, sbu_allocation_ratio) -> Tuple:
+    """
+    Numeric core of IFC-GPF-01; works element-wise on NumPy arrays too.
+
+    Returns (average_gpf_balance, total_gpf_interest, allowable_gpf_interest_sbu).
+    """
+    average_gpf_balance = (opening_gpf_balance_company + closing_gpf_balance_company) / 2
+    total_gpf_interest = (average_gpf_balance * gpf_interest_rate) / 100
+    allowable_gpf_interest_sbu = total_gpf_interest * sbu_allocation_ratio / 100
+    return average_gpf_balance, total_gpf_interest, allowable_gpf_interest_sbu
+
+
+def _render_ifc_gpf_steps(
+    opening_gpf_balance_company, closing_gpf_balance_company,
+    average_gpf_balance, gpf_interest_rate, total_gpf_interest,
+    sbu_allocation_ratio, allowable_gpf_interest_sbu,
+    claimed_gpf_interest_sbu, variance_absolute, variance_percentage,
+) -> List[str]:
+    """Render IFC-GPF-01 calculation steps for display."""
+    return [
+        "=== Company-wide Calculation ===",
+        f"Opening GPF Balance (01.04.YYYY): ₹{opening_gpf_balance_company:.2f} Cr",
+        f"Closing GPF Balance (31.03.YYYY): ₹{closing_gpf_balance_company:.2f} Cr",
+        f"Average GPF Balance: ₹{average_gpf_balance:.2f} Cr",
+        f"GPF Interest Rate: {gpf_interest_rate:.2f}%",
+        f"Total GPF Interest (Company): ₹{total_gpf_interest:.2f} Cr",
+        "",
+        "=== SBU Allocation ===",
+        f"SBU Allocation Ratio (employee strength): {sbu_allocation_ratio:.2f}%",
+        f"Allowable SBU GPF Interest: ₹{allowable_gpf_interest_sbu:.2f} Cr",
+        f"KSEB Claimed (SBU): ₹{claimed_gpf_interest_sbu:.2f} Cr",
+        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
+    ]
+
+
+# Constant result fields; each call merges in only the computed ones.
+_IFC_GPF_TEMPLATE = {
+    'heuristic_id': 'IFC-GPF-01',
+    'heuristic_name': 'Interest on GPF/Pension Funds',
+    'line_item': 'Interest & Finance Charges',
+    'regulatory_basis': 'Established practice for low-cost internal funding; GPF interest allowed as actuals per audited accounts; SBU allocation per employee strength ratio',
+    'is_primary': True,
+    'output_type': 'pass_through',
+}
+
+_GPF_NOTE_MINOR = "Minor variance of {variance_pct:+.2f}% detected. Verify SBU allocation ratio or GPF balances from audited accounts."
+_GPF_NOTE_SIGNIFICANT = "Significant variance of {variance_pct:+.2f}%. Verify: (1) Opening/closing GPF balances from Note 23 of audited accounts, (2) SBU allocation ratio based on employee strength."
+_GPF_BAND_NOTES = (None, _GPF_NOTE_MINOR, _GPF_NOTE_SIGNIFICANT)  # indexed by flag band
+
+
 def heuristic_IFC_GPF_01(
     opening_gpf_balance_company: float,
     closing_gpf_balance_company: float,
@@ -299,7 +423,9 @@ def heuristic_IFC_GPF_01(
     claimed_gpf_interest_sbu: float,
     staff_name: str = "",
     staff_approved_amount: Optional[float] = None,
-    staff_justification: str = ""
+    staff_justification: str = "",
+    *,
+    include_steps: bool = True,
 ) -> Dict:
     """
     IFC-GPF-01: Interest on GPF/Pension Funds
@@ -318,6 +444,10 @@ def heuristic_IFC_GPF_01(
         staff_name: Name of staff reviewing this heuristic
         staff_approved_amount: Amount approved by staff (overrides recommended)
         staff_justification: Staff justification for override
+        include_steps: False skips the calculation steps and the
+            recommendation notes (calculation_steps is [] and
+            recommendation_text is '') for callers that only need the
+            numbers and flag, e.g. re-scoring after a staff override
     
     Returns:
         Heuristic result dictionary with GPF interest calculation
@@ -328,78 +458,43 @@ def heuristic_IFC_GPF_01(
         RED: Variance >5% - verify GPF balances and allocation methodology
     """
     
-    heuristic_id = "IFC-GPF-01"
-    heuristic_name = "Interest on GPF/Pension Funds"
-    line_item = "Interest & Finance Charges"
-    
-    # Step 1: Calculate average GPF balance (company-wide)
-    average_gpf_balance = (opening_gpf_balance_company + closing_gpf_balance_company) / 2
-    
-    # Step 2: Calculate total GPF interest (company-wide)
-    total_gpf_interest = (average_gpf_balance * gpf_interest_rate) / 100
-    
-    # Step 3: Calculate SBU share
-    allowable_gpf_interest_sbu = total_gpf_interest * sbu_allocation_ratio / 100
-    
-    # Step 4: Calculate variance
-    variance_absolute = claimed_gpf_interest_sbu - allowable_gpf_interest_sbu
-    variance_percentage = (variance_absolute / allowable_gpf_interest_sbu * 100) if allowable_gpf_interest_sbu != 0 else 0
-    
-    # Step 5: Determine flag
-    abs_variance_pct = abs(variance_percentage)
-    notes = []
-    
-    if abs_variance_pct <= 2:
-        flag = 'GREEN'
-        recommendation_text = f"Approve GPF interest of ₹{allowable_gpf_interest_sbu:.2f} Cr."
-    elif abs_variance_pct <= 5:
-        flag = 'YELLOW'
-        notes.append(f"Minor variance of {variance_percentage:+.2f}% detected. Verify SBU allocation ratio or GPF balances from audited accounts.")
-        recommendation_text = f"Approve ₹{allowable_gpf_interest_sbu:.2f} Cr. " + " ".join(notes)
-    else:
-        flag = 'RED'
-        notes.append(f"Significant variance of {variance_percentage:+.2f}%. Verify: (1) Opening/closing GPF balances from Note 23 of audited accounts, (2) SBU allocation ratio based on employee strength.")
-        recommendation_text = f"Approve ₹{allowable_gpf_interest_sbu:.2f} Cr. " + " ".join(notes)
-    
-    # Calculation steps
-    calculation_steps = [
-        "=== Company-wide Calculation ===",
-        f"Opening GPF Balance (01.04.YYYY): ₹{opening_gpf_balance_company:.2f} Cr",
-        f"Closing GPF Balance (31.03.YYYY): ₹{closing_gpf_balance_company:.2f} Cr",
-        f"Average GPF Balance: ₹{average_gpf_balance:.2f} Cr",
-        f"GPF Interest Rate: {gpf_interest_rate:.2f}%",
-        f"Total GPF Interest (Company): ₹{total_gpf_interest:.2f} Cr",
-        "",
-        "=== SBU Allocation ===",
-        f"SBU Allocation Ratio (employee strength): {sbu_allocation_ratio:.2f}%",
-        f"Allowable SBU GPF Interest: ₹{allowable_gpf_interest_sbu:.2f} Cr",
-        f"KSEB Claimed (SBU): ₹{claimed_gpf_interest_sbu:.2f} Cr",
-        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
-    ]
-    
-    regulatory_basis = "Established practice for low-cost internal funding; GPF interest allowed as actuals per audited accounts; SBU allocation per employee strength ratio"
-    
-    # Staff review
-    staff_override_flag = None
-    staff_review_status = "Pending"
-    reviewed_by = None
-    reviewed_at = None
-    
-    if staff_approved_amount is not None:
-        if abs(staff_approved_amount - allowable_gpf_interest_sbu) < 0.01:
-            staff_review_status = "Accepted"
+    # Steps 1-3: Average GPF balance and interest (company-wide), SBU share
+    average_gpf_balance, total_gpf_interest, allowable_gpf_interest_sbu = _ifc_gpf_core(
+        opening_gpf_balance_company, closing_gpf_balance_company,
+        gpf_interest_rate, sbu_allocation_ratio
+    )
+    
+    # Steps 4-5: Variance and flag band
+    variance_absolute, variance_percentage, band = _variance_and_band(
+        claimed_gpf_interest_sbu, allowable_gpf_interest_sbu, _GPF_THRESHOLDS
+    )
+    flag = _FLAGS[band]
+    
+    if include_steps:
+        if band:
+            note = _GPF_BAND_NOTES[band].format(variance_pct=variance_percentage)
+            recommendation_text = f"Approve ₹{allowable_gpf_interest_sbu:.2f} Cr. " + note
         else:
-            staff_review_status = "Overridden"
-            staff_override_flag = "STAFF_OVERRIDE"
-        reviewed_by = staff_name if staff_name else None
-        reviewed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            recommendation_text = f"Approve GPF interest of ₹{allowable_gpf_interest_sbu:.2f} Cr."
+        
+        # Calculation steps (rendered on first access)
+        calculation_steps = LazySteps(
+            _render_ifc_gpf_steps,
+            opening_gpf_balance_company, closing_gpf_balance_company,
+            average_gpf_balance, gpf_interest_rate, total_gpf_interest,
+            sbu_allocation_ratio, allowable_gpf_interest_sbu,
+            claimed_gpf_interest_sbu, variance_absolute, variance_percentage,
+        )
+    else:
+        recommendation_text = ""
+        calculation_steps = []
     
-    final_approved_amount = staff_approved_amount if staff_approved_amount is not None else allowable_gpf_interest_sbu
+    # Staff review handling
+    (staff_review_status, staff_override_flag, reviewed_by, reviewed_at,
+     final_approved_amount) = apply_staff_review(allowable_gpf_interest_sbu, staff_approved_amount, staff_name)
     
     return {
-        'heuristic_id': heuristic_id,
-        'heuristic_name': heuristic_name,
-        'line_item': line_item,
+        **_IFC_GPF_TEMPLATE,
         'claimed_value': claimed_gpf_interest_sbu,
         'allowable_value': allowable_gpf_interest_sbu,
         'variance_absolute': variance_absolute,
@@ -407,7 +502,6 @@ def heuristic_IFC_GPF_01(
         'flag': flag,
         'recommended_amount': allowable_gpf_interest_sbu,
         'recommendation_text': recommendation_text,
-        'regulatory_basis': regulatory_basis,
         'calculation_steps': calculation_steps,
         'staff_override_flag': staff_override_flag,
         'staff_approved_amount': final_approved_amount,
@@ -416,17 +510,56 @@ def heuristic_IFC_GPF_01(
         'reviewed_by': reviewed_by,
         'reviewed_at': reviewed_at,
         'depends_on': [],
-        'is_primary': True,
-        'output_type': 'pass_through'
     }
 
 
+def _render_ifc_oth_steps(
+    claimed_gbi, allowable_gbi, claimed_bank_charges, allowable_bank_charges,
+    total_claimed, total_allowable, variance_absolute, variance_percentage,
+) -> List[str]:
+    """Render IFC-OTH-02 calculation steps for display."""
+    return [
+        "=== Component 1: Generation-Based Incentive (GBI) ===",
+        f"KSEB Claimed GBI: ₹{claimed_gbi:.2f} Cr",
+        "GBI Scheme Status: No scheme in force for FY 2023-24",
+        f"Allowable GBI: ₹{allowable_gbi:.2f} Cr (Disallowed)",
+        "",
+        "=== Component 2: Other Bank Charges ===",
+        f"KSEB Claimed Bank Charges: ₹{claimed_bank_charges:.2f} Cr",
+        f"Allowable Bank Charges: ₹{allowable_bank_charges:.2f} Cr",
+        "",
+        "=== Total Other Charges ===",
+        f"Total Claimed: ₹{total_claimed:.2f} Cr",
+        f"Total Allowable: ₹{total_allowable:.2f} Cr",
+        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
+    ]
+
+
+# Constant result fields; each call merges in only the computed ones.
+_IFC_OTH_TEMPLATE = {
+    'heuristic_id': 'IFC-OTH-02',
+    'heuristic_name': 'Other Interest & Charges (GBI + Bank Charges)',
+    'line_item': 'Interest & Finance Charges',
+    'regulatory_basis': 'No applicable GBI scheme for the year; Bank charges allowed as legitimate operational expenses subject to prudence check',
+    'is_primary': True,
+    'output_type': 'mixed',
+}
+
+_OTH_NOTE_GBI = "GBI of ₹{gbi:.2f} Cr disallowed (no GBI scheme in force for FY 2023-24)."
+_OTH_NOTE_BANK_APPROVED = "Bank charges of ₹{bank:.2f} Cr approved as legitimate operational expense."
+_OTH_NOTE_BANK_ELEVATED = "Bank charges of ₹{bank:.2f} Cr flagged for staff review (elevated but may be justified)."
+_OTH_NOTE_BANK_EXCESSIVE = "Bank charges of ₹{bank:.2f} Cr appear excessive. Require detailed justification and supporting documents."
+_OTH_BANK_BAND_NOTES = (None, _OTH_NOTE_BANK_ELEVATED, _OTH_NOTE_BANK_EXCESSIVE)  # indexed by flag band
+
+
 def heuristic_IFC_OTH_02(
     claimed_gbi: float,
     claimed_bank_charges: float,
     staff_name: str = "",
     staff_approved_amount: Optional[float] = None,
-    staff_justification: str = ""
+    staff_justification: str = "",
+    *,
+    include_steps: bool = True,
 ) -> Dict:
     """
     IFC-OTH-02: Other Interest & Charges
@@ -441,6 +574,10 @@ def heuristic_IFC_OTH_02(
         staff_name: Name of staff reviewing this heuristic
         staff_approved_amount: Amount approved by staff (overrides recommended)
         staff_justification: Staff justification for override
+        include_steps: False skips the calculation steps and the
+            recommendation notes (calculation_steps is [] and
+            recommendation_text is '') for callers that only need the
+            numbers and flag, e.g. re-scoring after a staff override
     
     Returns:
         Heuristic result dictionary with other charges breakdown
@@ -451,105 +588,66 @@ def heuristic_IFC_OTH_02(
         RED: GBI claimed OR excessive bank charges (>₹1.0 Cr)
     """
     
-    heuristic_id = "IFC-OTH-02"
-    heuristic_name = "Other Interest & Charges (GBI + Bank Charges)"
-    line_item = "Interest & Finance Charges"
-    
     # Component 1: GBI (always disallowed)
     allowable_gbi = 0.0
     
-    # Component 2: Bank Charges (approve if reasonable)
-    if claimed_bank_charges <= 0.5:
-        allowable_bank_charges = claimed_bank_charges
-        flag_bank = 'GREEN'
-        note_bank = ""
-    elif claimed_bank_charges <= 1.0:
-        allowable_bank_charges = claimed_bank_charges
-        flag_bank = 'YELLOW'
-        note_bank = f"Bank charges of ₹{claimed_bank_charges:.2f} Cr flagged for staff review (elevated but may be justified)."
-    else:
-        allowable_bank_charges = 0.0
-        flag_bank = 'RED'
-        note_bank = f"Bank charges of ₹{claimed_bank_charges:.2f} Cr appear excessive. Require detailed justification and supporting documents."
+    # Component 2: Bank Charges (approve if reasonable; excessive charges disallowed)
+    band = flag_band(_BANK_THRESHOLDS, claimed_bank_charges)
+    allowable_bank_charges = claimed_bank_charges if band < Flag.RED else 0.0
+    note_bank = _OTH_BANK_BAND_NOTES[band]
     
     # Total allowable
     total_allowable = allowable_gbi + allowable_bank_charges
     total_claimed = claimed_gbi + claimed_bank_charges
     
     # Overall flag
-    if claimed_gbi > 0:
-        overall_flag = 'RED'
-    else:
-        overall_flag = flag_bank
+    overall_flag = Flag.RED if claimed_gbi > 0 else Flag(band)
     
     # Variance
     variance_absolute = total_claimed - total_allowable
     variance_percentage = (variance_absolute / total_allowable * 100) if total_allowable != 0 else (-100.0 if total_claimed > 0 else 0.0)
     
-    # Build recommendation
-    notes = []
-    if claimed_gbi > 0:
-        notes.append(f"GBI of ₹{claimed_gbi:.2f} Cr disallowed (no GBI scheme in force for FY 2023-24).")
-    
-    if claimed_bank_charges > 0:
-        if allowable_bank_charges > 0:
-            notes.append(f"Bank charges of ₹{claimed_bank_charges:.2f} Cr approved as legitimate operational expense.")
-        if note_bank:
-            notes.append(note_bank)
-    
-    if overall_flag == 'GREEN':
-        recommendation_text = f"Approve ₹{total_allowable:.2f} Cr. " + " ".join(notes)
-    else:
-        recommendation_text = f"Approve ₹{total_allowable:.2f} Cr (out of ₹{total_claimed:.2f} Cr claimed). " + " ".join(notes)
-    
-    # Calculation steps
-    calculation_steps = [
-        "=== Component 1: Generation-Based Incentive (GBI) ===",
-        f"KSEB Claimed GBI: ₹{claimed_gbi:.2f} Cr",
-        "GBI Scheme Status: No scheme in force for FY 2023-24",
-        f"Allowable GBI: ₹{allowable_gbi:.2f} Cr (Disallowed)",
-        "",
-        "=== Component 2: Other Bank Charges ===",
-        f"KSEB Claimed Bank Charges: ₹{claimed_bank_charges:.2f} Cr",
-        f"Allowable Bank Charges: ₹{allowable_bank_charges:.2f} Cr",
-        "",
-        "=== Total Other Charges ===",
-        f"Total Claimed: ₹{total_claimed:.2f} Cr",
-        f"Total Allowable: ₹{total_allowable:.2f} Cr",
-        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
-    ]
-    
-    regulatory_basis = "No applicable GBI scheme for the year; Bank charges allowed as legitimate operational expenses subject to prudence check"
-    
-    # Staff review
-    staff_override_flag = None
-    staff_review_status = "Pending"
-    reviewed_by = None
-    reviewed_at = None
-    
-    if staff_approved_amount is not None:
-        if abs(staff_approved_amount - total_allowable) < 0.01:
-            staff_review_status = "Accepted"
+    if include_steps:
+        # Build recommendation
+        notes = []
+        if claimed_gbi > 0:
+            notes.append(_OTH_NOTE_GBI.format(gbi=claimed_gbi))
+        
+        if claimed_bank_charges > 0:
+            if allowable_bank_charges > 0:
+                notes.append(_OTH_NOTE_BANK_APPROVED.format(bank=claimed_bank_charges))
+            if note_bank:
+                notes.append(note_bank.format(bank=claimed_bank_charges))
+        
+        if overall_flag == Flag.GREEN:
+            prefix = f"Approve ₹{total_allowable:.2f} Cr."
         else:
-            staff_review_status = "Overridden"
-            staff_override_flag = "STAFF_OVERRIDE"
-        reviewed_by = staff_name if staff_name else None
-        reviewed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            prefix = f"Approve ₹{total_allowable:.2f} Cr (out of ₹{total_claimed:.2f} Cr claimed)."
+        recommendation_text = " ".join((prefix, *notes))
+        
+        # Calculation steps (rendered on first access)
+        calculation_steps = LazySteps(
+            _render_ifc_oth_steps,
+            claimed_gbi, allowable_gbi, claimed_bank_charges, allowable_bank_charges,
+            total_claimed, total_allowable, variance_absolute, variance_percentage,
+        )
+    else:
+        recommendation_text = ""
+        calculation_steps = []
     
-    final_approved_amount = staff_approved_amount if staff_approved_amount is not None else total_allowable
+    # Staff review handling
+    (staff_review_status, staff_override_flag, reviewed_by, reviewed_at,
+     final_approved_amount) = apply_staff_review(total_allowable, staff_approved_amount, staff_name)
     
     return {
-        'heuristic_id': heuristic_id,
-        'heuristic_name': heuristic_name,
-        'line_item': line_item,
+        **_IFC_OTH_TEMPLATE,
         'claimed_value': total_claimed,
         'allowable_value': total_allowable,
         'variance_absolute': variance_absolute,
         'variance_percentage': variance_percentage,
-        'flag': overall_flag,
+        'flag': _FLAGS[overall_flag],
         'recommended_amount': total_allowable,
         'recommendation_text': recommendation_text,
-        'regulatory_basis': regulatory_basis,
         'calculation_steps': calculation_steps,
         'staff_override_flag': staff_override_flag,
         'staff_approved_amount': final_approved_amount,
@@ -558,6 +656,191 @@ def heuristic_IFC_OTH_02(
         'reviewed_by': reviewed_by,
         'reviewed_at': reviewed_at,
         'depends_on': [],
-        'is_primary': True,
-        'output_type': 'mixed'
+    }
+
+
+# =============================================================================
+# CONVENIENCE: Run all IFC heuristics
+# =============================================================================
+
+# Run order of run_all_ifc_heuristics: (heuristic, params argument)
+_IFC_HEURISTICS = (
+    (heuristic_IFC_LTL_01, 'ltl_params'),   # 1. Interest on Long-Term Loans
+    (heuristic_IFC_WC_01, 'wc_params'),     # 2. Interest on Working Capital
+    (heuristic_IFC_GPF_01, 'gpf_params'),   # 3. Interest on GPF
+    (heuristic_IFC_OTH_02, 'oth_params'),   # 4. Other Charges (GBI + Bank Charges)
+)
+
+
+def run_all_ifc_heuristics(
+    ltl_params: Dict,
+    wc_params: Dict,
+    gpf_params: Dict,
+    oth_params: Dict,
+    *,
+    include_steps: bool = True,
+) -> List[Dict]:
+    """
+    Run all 4 IFC heuristics and return results (Total IFC = sum of
+    their allowable values).
+
+    include_steps is passed to every heuristic unless its params dict
+    sets include_steps itself.
+    """
+    params = {
+        'ltl_params': ltl_params,
+        'wc_params': wc_params,
+        'gpf_params': gpf_params,
+        'oth_params': oth_params,
+    }
+    return [
+        fn(**{'include_steps': include_steps, **params[key]})
+        for fn, key in _IFC_HEURISTICS
+    ]
+
+# =============================================================================
+# BATCH EVALUATION: many SBUs / years / scenarios in one NumPy pass
+# =============================================================================
+
+def heuristic_IFC_LTL_01_batch(
+    opening_normative_loan,
+    gfa_additions,
+    depreciation,
+    opening_interest_rate,
+    claimed_interest,
+    disputed_claims=0.0,
+    highest_loan_rate=np.nan,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized IFC-LTL-01 over 1-D arrays (one element per scenario).
+
+    Same flag rules as heuristic_IFC_LTL_01; pass NaN for a missing
+    highest_loan_rate. Returns a dict of arrays.
+    """
+    opening, gfa, dep, rate, claimed, disputed, high_rate = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            opening_normative_loan, gfa_additions, depreciation,
+            opening_interest_rate, claimed_interest, disputed_claims,
+            highest_loan_rate))
+    )
+
+    closing, average, allowable = _ifc_ltl_core(opening, gfa, dep, rate)
+    variance_abs = claimed - allowable
+    variance_pct = nonzero_pct_array(variance_abs, allowable)
+
+    # Same band table as the scalar path; a missing (NaN) highest loan
+    # rate compares False.
+    band = np.searchsorted(_LTL_THRESHOLDS, np.abs(variance_pct), side='left')
+    promoted = (disputed > 0) | (high_rate > 9.0)
+    flag = np.take(_FLAGS, np.maximum(np.take(_LTL_BAND_FLAGS, band), promoted))
+
+    return {
+        'closing_normative_loan': closing,
+        'average_normative_loan': average,
+        'allowable_interest': allowable,
+        'variance_absolute': variance_abs,
+        'variance_percentage': variance_pct,
+        'flag': flag,
+    }
+
+
+def heuristic_IFC_WC_01_batch(
+    approved_om_expenses,
+    opening_gfa_excl_land,
+    sbi_eblr_rate,
+    claimed_wc_interest,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized IFC-WC-01 over 1-D arrays (one element per scenario).
+
+    Same ±5% / ±15% flag thresholds as heuristic_IFC_WC_01.
+    Returns a dict of arrays.
+    """
+    om, gfa, eblr, claimed = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            approved_om_expenses, opening_gfa_excl_land, sbi_eblr_rate,
+            claimed_wc_interest))
+    )
+
+    _, _, working_capital, _, allowable = _ifc_wc_core(om, gfa, eblr)
+    variance_abs = claimed - allowable
+    variance_pct = nonzero_pct_array(variance_abs, allowable)
+
+    flag = np.take(_FLAGS, np.searchsorted(_WC_THRESHOLDS, np.abs(variance_pct), side='left'))
+
+    return {
+        'working_capital': working_capital,
+        'allowable_wc_interest': allowable,
+        'variance_absolute': variance_abs,
+        'variance_percentage': variance_pct,
+        'flag': flag,
+    }
+
+
+def heuristic_IFC_GPF_01_batch(
+    opening_gpf_balance_company,
+    closing_gpf_balance_company,
+    gpf_interest_rate,
+    sbu_allocation_ratio,
+    claimed_gpf_interest_sbu,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized IFC-GPF-01 over 1-D arrays (one element per scenario).
+
+    Same ±2% / ±5% flag thresholds as heuristic_IFC_GPF_01.
+    Returns a dict of arrays.
+    """
+    opening, closing, rate, ratio, claimed = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            opening_gpf_balance_company, closing_gpf_balance_company,
+            gpf_interest_rate, sbu_allocation_ratio, claimed_gpf_interest_sbu))
+    )
+
+    _, total_gpf_interest, allowable = _ifc_gpf_core(opening, closing, rate, ratio)
+    variance_abs = claimed - allowable
+    variance_pct = nonzero_pct_array(variance_abs, allowable)
+
+    flag = np.take(_FLAGS, np.searchsorted(_GPF_THRESHOLDS, np.abs(variance_pct), side='left'))
+
+    return {
+        'total_gpf_interest': total_gpf_interest,
+        'allowable_gpf_interest_sbu': allowable,
+        'variance_absolute': variance_abs,
+        'variance_percentage': variance_pct,
+        'flag': flag,
+    }
+
+
+def heuristic_IFC_OTH_02_batch(
+    claimed_gbi,
+    claimed_bank_charges,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized IFC-OTH-02 over 1-D arrays (one element per scenario).
+
+    GBI is always disallowed; bank charges use the same ₹0.5 / ₹1.0 Cr
+    tiers as heuristic_IFC_OTH_02. Returns a dict of arrays.
+    """
+    gbi, bank = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (claimed_gbi, claimed_bank_charges))
+    )
+
+    band = np.searchsorted(_BANK_THRESHOLDS, bank, side='left')
+    total_allowable = np.where(band < 2, bank, 0.0)   # Excessive charges disallowed
+    total_claimed = gbi + bank
+    variance_abs = total_claimed - total_allowable
+    variance_pct = np.where(
+        total_allowable != 0,
+        nonzero_pct_array(variance_abs, total_allowable),
+        np.where(total_claimed > 0, -100.0, 0.0),
+    )
+
+    flag = np.where(gbi > 0, 'RED', np.take(_FLAGS, band))
+
+    return {
+        'total_claimed': total_claimed,
+        'total_allowable': total_allowable,
+        'variance_absolute': variance_abs,
+        'variance_percentage': variance_pct,
+        'flag': flag,
     }
\ No newline at end of file
@@ -3,8 +3,142 @@ Intangible Assets Amortization Heuristics for SBU-G
 Contains: INTANG-01
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
+from heuristics.lazy_steps import LazySteps
+from heuristics.result_cache import cached_result
+from heuristics.result_fields import STAFF_REVIEW_DEFAULTS
+
+# Constant result fields; each call merges in only the computed ones.
+_INTANG_TEMPLATE = {
+    # Identification
+    'heuristic_id': 'INTANG-01',
+    'heuristic_name': 'Intangible Assets Amortization',
+    'line_item': 'Intangible Assets Amortization',
+    'regulatory_basis': 'Regulation 49, Tariff Regulations 2021; Truing-Up Order 2023-24 (Rejection Precedent)',
+
+    # Metadata
+    'is_primary': True,  # PRIMARY HEURISTIC
+    'output_type': 'approved_amount',
+    'note': 'High scrutiny required - risk of double-counting with O&M employee costs',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_YES_NO = ("No", "Yes")  # indexed by bool
+
+# Static calculation-step blocks, spliced into every rendering
+_INTANG_INTRO_STEPS = (
+    "INTANGIBLE ASSETS AMORTIZATION (Regulation 49, Tariff Regulations 2021)",
+    "",
+    "CRITICAL ISSUE: Software development employee costs may already be",
+    "included in normative O&M expenses approved by Commission.",
+    "Double-counting must be avoided.",
+    "",
+    "═══ SOFTWARE DEVELOPMENT (In-house) ═══",
+)
+_INTANG_PRECEDENT_STEPS = (
+    "═══ REGULATORY PRECEDENT (FY 2023-24) ═══",
+    "Commission rejected software amortization claim because:",
+    "1. Employee costs already included in normative O&M",
+    "2. Insufficient evidence that employees were additional to norms",
+    "3. Risk of double-counting expenses",
+    "",
+    "KSEBL must provide:",
+    "- List of employees engaged in software development",
+    "- Proof that these employees are NOT in approved O&M headcount",
+    "- Development timeline and cost breakdown",
+    "- Methodology for capitalization and amortization",
+    "",
+    "Evidence Requirements:",
+    "- Employee deployment records",
+    "- Comparison with approved O&M headcount (30,321 as of 2022)",
+    "- Project-wise cost allocation",
+    "- Auditor's certificate on capitalization methodology",
+)
+
+
+def _render_intang_steps(
+    software_employee_costs_capitalized, software_amortization_claimed,
+    software_supporting_docs_provided, software_employees_additional_to_norms,
+    software_flag, software_recommendation, software_allowable,
+    purchased_software_licenses, patents_ip, other_intangibles,
+    other_intangibles_amortization, other_supporting_docs_provided,
+    other_flag, other_recommendation, other_allowable,
+    allowable_total, total_claimed_amortization, previous_year_amortization,
+) -> List[str]:
+    """Render INTANG-01 calculation steps for display."""
+    calc_steps = list(_INTANG_INTRO_STEPS)
+    
+    if software_amortization_claimed > 0:
+        calc_steps.extend([
+            f"Employee Costs Capitalized: ₹{software_employee_costs_capitalized:.2f} Cr",
+            f"Amortization Claimed: ₹{software_amortization_claimed:.2f} Cr",
+            f"Supporting Documents Provided: {_YES_NO[bool(software_supporting_docs_provided)]}",
+            f"Employees Additional to O&M Norms: {_YES_NO[bool(software_employees_additional_to_norms)]}",
+            "",
+            f"Assessment: {software_flag}",
+            f"Recommendation: {software_recommendation}",
+            f"Allowable: ₹{software_allowable:.2f} Cr",
+            ""
+        ])
+    else:
+        calc_steps.append("No software development amortization claimed")
+        calc_steps.append("")
+    
+    calc_steps.append("═══ OTHER INTANGIBLE ASSETS ═══")
+    
+    if other_intangibles_amortization > 0:
+        if purchased_software_licenses > 0:
+            calc_steps.append(f"Purchased Software Licenses: ₹{purchased_software_licenses:.2f} Cr")
+        if patents_ip > 0:
+            calc_steps.append(f"Patents/IP: ₹{patents_ip:.2f} Cr")
+        if other_intangibles > 0:
+            calc_steps.append(f"Other Intangibles: ₹{other_intangibles:.2f} Cr")
+        
+        calc_steps.extend([
+            f"Total Other Amortization: ₹{other_intangibles_amortization:.2f} Cr",
+            f"Supporting Documents Provided: {_YES_NO[bool(other_supporting_docs_provided)]}",
+            "",
+            f"Assessment: {other_flag}",
+            f"Recommendation: {other_recommendation}",
+            f"Allowable: ₹{other_allowable:.2f} Cr",
+            ""
+        ])
+    else:
+        calc_steps.append("No other intangible assets claimed")
+        calc_steps.append("")
+    
+    calc_steps.extend([
+        "═══ TOTAL AMORTIZATION ═══",
+        f"Software Development: ₹{software_allowable:.2f} Cr",
+        f"Other Intangibles: ₹{other_allowable:.2f} Cr",
+        f"Total Allowable: ₹{allowable_total:.2f} Cr",
+        "",
+        f"KSEB Claimed: ₹{total_claimed_amortization:.2f} Cr",
+        f"Variance: {total_claimed_amortization - allowable_total:+.2f} Cr",
+        ""
+    ])
+    
+    # Add regulatory precedent note
+    calc_steps.extend(_INTANG_PRECEDENT_STEPS)
+    
+    # Year-over-year if available
+    if previous_year_amortization > 0:
+        yoy_change = total_claimed_amortization - previous_year_amortization
+        yoy_pct = (yoy_change / previous_year_amortization) * 100
+        calc_steps.extend([
+            "",
+            "═══ YEAR-OVER-YEAR ═══",
+            f"Previous Year: ₹{previous_year_amortization:.2f} Cr",
+            f"Current Year: ₹{total_claimed_amortization:.2f} Cr",
+            f"Change: {yoy_change:+.2f} Cr ({yoy_pct:+.1f}%)"
+        ])
+    
+    return calc_steps
+
+
+@cached_result(maxsize=512)
 def heuristic_INTANG_01(
     # Software development costs (employee-related)
     software_employee_costs_capitalized: float = 0.0,
@@ -23,7 +157,10 @@ def heuristic_INTANG_01(
     total_claimed_amortization: float = 0.0,
     
     # Optional: Previous year amortization
-    previous_year_amortization: float = 0.0
+    previous_year_amortization: float = 0.0,
+    *,
+    include_steps: bool = True,
+    include_details: bool = True,
 ) -> Dict:
     """
     INTANG-01: Intangible Assets Amortization Validation
@@ -48,6 +185,8 @@ def heuristic_INTANG_01(
         other_supporting_docs_provided: Supporting docs for other intangibles
         total_claimed_amortization: Total amortization claimed
         previous_year_amortization: Previous year amortization (for trend)
+        include_steps: Build calculation_steps (False gives an empty list)
+        include_details: Add the amortization_breakdown dict
     
     Returns:
         Heuristic result dictionary with validation
@@ -115,159 +254,60 @@ def heuristic_INTANG_01(
     else:
         overall_recommendation = 'Approve as claimed'
     
-    # Calculation steps
-    calc_steps = [
-        "INTANGIBLE ASSETS AMORTIZATION (Regulation 49, Tariff Regulations 2021)",
-        "",
-        "CRITICAL ISSUE: Software development employee costs may already be",
-        "included in normative O&M expenses approved by Commission.",
-        "Double-counting must be avoided.",
-        "",
-        "═══ SOFTWARE DEVELOPMENT (In-house) ═══"
-    ]
-    
-    if software_amortization_claimed > 0:
-        calc_steps.extend([
-            f"Employee Costs Capitalized: ₹{software_employee_costs_capitalized:.2f} Cr",
-            f"Amortization Claimed: ₹{software_amortization_claimed:.2f} Cr",
-            f"Supporting Documents Provided: {'Yes' if software_supporting_docs_provided else 'No'}",
-            f"Employees Additional to O&M Norms: {'Yes' if software_employees_additional_to_norms else 'No'}",
-            "",
-            f"Assessment: {software_flag}",
-            f"Recommendation: {software_recommendation}",
-            f"Allowable: ₹{software_allowable:.2f} Cr",
-            ""
-        ])
-    else:
-        calc_steps.append("No software development amortization claimed")
-        calc_steps.append("")
-    
-    calc_steps.append("═══ OTHER INTANGIBLE ASSETS ═══")
-    
-    if other_intangibles_amortization > 0:
-        if purchased_software_licenses > 0:
-            calc_steps.append(f"Purchased Software Licenses: ₹{purchased_software_licenses:.2f} Cr")
-        if patents_ip > 0:
-            calc_steps.append(f"Patents/IP: ₹{patents_ip:.2f} Cr")
-        if other_intangibles > 0:
-            calc_steps.append(f"Other Intangibles: ₹{other_intangibles:.2f} Cr")
-        
-        calc_steps.extend([
-            f"Total Other Amortization: ₹{other_intangibles_amortization:.2f} Cr",
-            f"Supporting Documents Provided: {'Yes' if other_supporting_docs_provided else 'No'}",
-            "",
-            f"Assessment: {other_flag}",
-            f"Recommendation: {other_recommendation}",
-            f"Allowable: ₹{other_allowable:.2f} Cr",
-            ""
-        ])
-    else:
-        calc_steps.append("No other intangible assets claimed")
-        calc_steps.append("")
-    
-    calc_steps.extend([
-        "═══ TOTAL AMORTIZATION ═══",
-        f"Software Development: ₹{software_allowable:.2f} Cr",
-        f"Other Intangibles: ₹{other_allowable:.2f} Cr",
-        f"Total Allowable: ₹{allowable_total:.2f} Cr",
-        "",
-        f"KSEB Claimed: ₹{total_claimed_amortization:.2f} Cr",
-        f"Variance: {total_claimed_amortization - allowable_total:+.2f} Cr",
-        ""
-    ])
-    
-    # Add regulatory precedent note
-    calc_steps.extend([
-        "═══ REGULATORY PRECEDENT (FY 2023-24) ═══",
-        "Commission rejected software amortization claim because:",
-        "1. Employee costs already included in normative O&M",
-        "2. Insufficient evidence that employees were additional to norms",
-        "3. Risk of double-counting expenses",
-        "",
-        "KSEBL must provide:",
-        "- List of employees engaged in software development",
-        "- Proof that these employees are NOT in approved O&M headcount",
-        "- Development timeline and cost breakdown",
-        "- Methodology for capitalization and amortization",
-        "",
-        "Evidence Requirements:",
-        "- Employee deployment records",
-        "- Comparison with approved O&M headcount (30,321 as of 2022)",
-        "- Project-wise cost allocation",
-        "- Auditor's certificate on capitalization methodology"
-    ])
+    # Calculation steps (rendered on first access)
+    calc_steps = LazySteps(
+        _render_intang_steps,
+        software_employee_costs_capitalized, software_amortization_claimed,
+        software_supporting_docs_provided, software_employees_additional_to_norms,
+        software_flag, software_recommendation, software_allowable,
+        purchased_software_licenses, patents_ip, other_intangibles,
+        other_intangibles_amortization, other_supporting_docs_provided,
+        other_flag, other_recommendation, other_allowable,
+        allowable_total, total_claimed_amortization, previous_year_amortization,
+    ) if include_steps else []
     
-    # Year-over-year if available
-    if previous_year_amortization > 0:
-        yoy_change = total_claimed_amortization - previous_year_amortization
-        yoy_pct = (yoy_change / previous_year_amortization) * 100
-        calc_steps.extend([
-            "",
-            "═══ YEAR-OVER-YEAR ═══",
-            f"Previous Year: ₹{previous_year_amortization:.2f} Cr",
-            f"Current Year: ₹{total_claimed_amortization:.2f} Cr",
-            f"Change: {yoy_change:+.2f} Cr ({yoy_pct:+.1f}%)"
-        ])
-    
-    # Breakdown for reference
-    amortization_breakdown = {
-        'software_development': {
-            'employee_costs_capitalized': software_employee_costs_capitalized,
-            'amortization_claimed': software_amortization_claimed,
-            'supporting_docs': software_supporting_docs_provided,
-            'employees_additional': software_employees_additional_to_norms,
-            'flag': software_flag,
-            'allowable': software_allowable
-        },
-        'other_intangibles': {
-            'purchased_software': purchased_software_licenses,
-            'patents_ip': patents_ip,
-            'other': other_intangibles,
-            'amortization_claimed': other_intangibles_amortization,
-            'supporting_docs': other_supporting_docs_provided,
-            'flag': other_flag,
-            'allowable': other_allowable
-        },
-        'total_allowable': allowable_total
-    }
-    
-    return {
-        # Identification
-        'heuristic_id': 'INTANG-01',
-        'heuristic_name': 'Intangible Assets Amortization',
-        'line_item': 'Intangible Assets Amortization',
-        
+    result = {
+        **_INTANG_TEMPLATE,
+
         # Calculation Results
         'claimed_value': total_claimed_amortization,
         'allowable_value': allowable_total,
         'variance_absolute': total_claimed_amortization - allowable_total,
         'variance_percentage': ((total_claimed_amortization - allowable_total) / allowable_total * 100) if allowable_total > 0 else 0,
-        
+
         # Tool's Assessment
         'flag': overall_flag,
         'recommended_amount': allowable_total,
         'recommendation_text': overall_recommendation,
-        'regulatory_basis': 'Regulation 49, Tariff Regulations 2021; Truing-Up Order 2023-24 (Rejection Precedent)',
-        
+
         # Calculation Details
         'calculation_steps': calc_steps,
-        
-        # Detailed breakdown
-        'amortization_breakdown': amortization_breakdown,
-        
-        # Staff Review Section
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        
+
         # Dependencies
         'depends_on': [],  # Independent, but note relationship with O&M norms
-        
-        # Metadata
-        'is_primary': True,  # PRIMARY HEURISTIC
-        'output_type': 'approved_amount',
-        'note': 'High scrutiny required - risk of double-counting with O&M employee costs'
-    }
\ No newline at end of file
+    }
+    
+    # Breakdown for reference
+    if include_details:
+        result['amortization_breakdown'] = {
+            'software_development': {
+                'employee_costs_capitalized': software_employee_costs_capitalized,
+                'amortization_claimed': software_amortization_claimed,
+                'supporting_docs': software_supporting_docs_provided,
+                'employees_additional': software_employees_additional_to_norms,
+                'flag': software_flag,
+                'allowable': software_allowable
+            },
+            'other_intangibles': {
+                'purchased_software': purchased_software_licenses,
+                'patents_ip': patents_ip,
+                'other': other_intangibles,
+                'amortization_claimed': other_intangibles_amortization,
+                'supporting_docs': other_supporting_docs_provided,
+                'flag': other_flag,
+                'allowable': other_allowable
+            },
+            'total_allowable': allowable_total
+        }
+    
+    return result
\ No newline at end of file
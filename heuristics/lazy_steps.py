@@ -0,0 +1,74 @@
+"""
+Lazy Calculation Steps
+======================
+List-like container for the 'calculation_steps' field of a heuristic
+result. The step strings are rendered on first access, so callers that
+only read flags/amounts (batch runs, aggregation) never pay for the
+f-string formatting.
+
+Usage:
+    def _render_roe_steps(equity, rate):
+        return [f"Equity: ₹{equity:.2f} Cr", f"Rate: {rate:.2f}%"]
+
+    result['calculation_steps'] = LazySteps(_render_roe_steps, equity, rate)
+
+    for step in result['calculation_steps']:   # rendered here, once
+        print(step)
+"""
+
+from collections.abc import Sequence
+from typing import Callable, List
+
+
+class LazySteps(Sequence):
+    """
+    Read-only sequence of calculation step strings, rendered on demand.
+
+    Behaves like the list it replaces for iteration, indexing, len() and
+    == comparison with a list. Use to_list() where a real list is needed
+    (e.g. JSON serialisation) and to_text() for a single joined string.
+    """
+
+    __slots__ = ('_render', '_args', '_steps')
+
+    def __init__(self, render: Callable[..., List[str]], *args):
+        self._render = render
+        self._args = args
+        self._steps = None
+
+    def _materialize(self) -> List[str]:
+        if self._steps is None:
+            self._steps = list(self._render(*self._args))
+            self._render = self._args = None  # Drop captured inputs
+        return self._steps
+
+    def to_list(self) -> List[str]:
+        """Return the rendered steps as a new plain list."""
+        return list(self._materialize())
+
+    def to_text(self, sep: str = "\n") -> str:
+        """Return the rendered steps joined into one string (reports, logs)."""
+        return sep.join(self._materialize())
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __eq__(self, other):
+        if isinstance(other, LazySteps):
+            other = other._materialize()
+        if isinstance(other, (list, tuple)):
+            return self._materialize() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        if self._steps is None:
+            return f"LazySteps(<unrendered {getattr(self._render, '__name__', 'render')}>)"
+        return f"LazySteps({self._steps!r})"
@@ -4,8 +4,127 @@ Master Trust Heuristics for KSERC Truing-Up Tool
 Contains 3 heuristics: MT-BOND-01, MT-REPAY-01, MT-ADD-01
 """
 
-from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from heuristics.batch_math import nonzero_pct_array
+from heuristics.lazy_steps import LazySteps
+from heuristics.result_fields import apply_staff_review, flag_band
+
+_FLAGS = ('GREEN', 'YELLOW', 'RED')
+
+# MT-BOND-01 / MT-REPAY-01 flag bands on |variance %|: flag_band /
+# searchsorted(side='left') indexes _FLAGS (<=1 GREEN, <=3 YELLOW, else RED).
+_MT_THRESHOLDS = (1.0, 3.0)
+
+_YES_NO = ("NO", "YES")  # indexed by bool
+
+# Static calculation-step blocks, spliced into every rendering
+_MT_BOND_SCHEDULE_STEPS = (
+    "=== 20-Year Bond Details (Issued 01.04.2017) ===",
+    "Original Principal: ₹8144.00 Cr",
+    "Coupon Rate: 10% p.a.",
+    "Annual Principal Repayment: ₹407.20 Cr",
+    "",
+    "=== FY 2023-24 (Year 7 of 20) ===",
+)
+_MT_REPAY_SCHEDULE_STEPS = (
+    "=== Bond Repayment Schedule ===",
+    "Annual Principal Repayment (Fixed): ₹407.20 Cr",
+    "Repayment Period: 20 years (2017-18 to 2036-37)",
+    "",
+    "=== SBU Allocation ===",
+)
+_MT_REPAY_LEGAL_STEPS = (
+    "",
+    "=== Legal Status ===",
+    "Regulation 34(iv) challenged in Kerala HC WP(C) 19205/2023 (judgment dated 07.09.2023)",
+    "Reinstated via KSERC Second Amendment Regulations 2024 (notified 27.02.2024)",
+)
+_MT_ADD_REQUIREMENT_STEPS = (
+    "",
+    "=== Regulatory Requirement ===",
+    "Per Regulation 30(3): Submit actuarial liability + funding proposal + Govt approval",
+    "Per Order Para 6.82: Deadline is 2 months from Order date",
+    "Warning: Non-compliance may result in revocation of provisional approval",
+)
+
+
+def _render_mt_bond_steps(
+    total_bond_interest, sbu_allocation_ratio, allowable_bond_interest_sbu,
+    claimed_bond_interest_sbu, variance_absolute, variance_percentage,
+) -> List[str]:
+    """Render MT-BOND-01 calculation steps for display."""
+    return [
+        *_MT_BOND_SCHEDULE_STEPS,
+        f"Total Bond Interest (Company): ₹{total_bond_interest:.2f} Cr",
+        f"SBU Allocation Ratio (employee strength): {sbu_allocation_ratio:.2f}%",
+        f"Allowable SBU Bond Interest: ₹{allowable_bond_interest_sbu:.2f} Cr",
+        f"KSEB Claimed (SBU): ₹{claimed_bond_interest_sbu:.2f} Cr",
+        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
+    ]
+
+
+def _render_mt_repay_steps(
+    annual_principal_repayment, sbu_allocation_ratio,
+    allowable_principal_repayment_sbu, claimed_principal_repayment_sbu,
+    variance_absolute, variance_percentage,
+) -> List[str]:
+    """Render MT-REPAY-01 calculation steps for display."""
+    return [
+        *_MT_REPAY_SCHEDULE_STEPS,
+        f"Total Principal Repayment (Company): ₹{annual_principal_repayment:.2f} Cr",
+        f"SBU Allocation Ratio (employee strength): {sbu_allocation_ratio:.2f}%",
+        f"Allowable SBU Principal Repayment: ₹{allowable_principal_repayment_sbu:.2f} Cr",
+        f"KSEB Claimed (SBU): ₹{claimed_principal_repayment_sbu:.2f} Cr",
+        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)",
+        *_MT_REPAY_LEGAL_STEPS,
+    ]
+
+
+def _render_mt_add_steps(
+    actuarial_liability_current_year, provisional_cap, actuarial_report_submitted,
+    govt_approval_obtained, allowable_total, sbu_allocation_ratio, allowable_sbu,
+    claimed_additional_contribution_sbu, variance_absolute, variance_percentage,
+) -> List[str]:
+    """Render MT-ADD-01 calculation steps for display."""
+    return [
+        "=== Actuarial Liability Context ===",
+        f"Actuarial Liability Addition (FY): ₹{actuarial_liability_current_year:.2f} Cr",
+        f"KSERC Provisional Cap: ₹{provisional_cap:.2f} Cr",
+        f"Unfunded Liability (31.03.YYYY): ₹30,177.31 Cr (CRITICAL CRISIS)",
+        "",
+        "=== Compliance Status ===",
+        f"Actuarial Report Submitted: {_YES_NO[bool(actuarial_report_submitted)]}",
+        f"State Government Approval: {_YES_NO[bool(govt_approval_obtained)]}",
+        "",
+        "=== Approved Amount ===",
+        f"Total Allowable (Company): ₹{allowable_total:.2f} Cr",
+        f"SBU Allocation Ratio: {sbu_allocation_ratio:.2f}%",
+        f"Allowable SBU Contribution: ₹{allowable_sbu:.2f} Cr",
+        f"KSEB Claimed (SBU): ₹{claimed_additional_contribution_sbu:.2f} Cr",
+        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)",
+        *_MT_ADD_REQUIREMENT_STEPS,
+    ]
+
+
+# Recommendation text per flag band, filled with str.format
+_MT_BOND_RECS = (
+    "Approve Master Trust bond interest of ₹{allowable:.2f} Cr.",
+    "Approve ₹{allowable:.2f} Cr. Minor variance of {variance_pct:+.2f}%. Verify SBU allocation ratio (employee strength vs employee cost basis).",
+    "Approve ₹{allowable:.2f} Cr. Variance of {variance_pct:+.2f}% detected. Recalculate SBU allocation based on actual employee strength ratio from audited accounts.",
+)
+
+# Constant result fields; each call merges in only the computed ones.
+_MT_BOND_TEMPLATE = {
+    'heuristic_id': 'MT-BOND-01',
+    'heuristic_name': 'Interest on Master Trust Bonds',
+    'line_item': 'Master Trust Obligations',
+    'regulatory_basis': 'Regulation 30, Regulation 34; Transfer Scheme notified vide GO(P) 46/2013/PD dated 31.10.2013 and GO(P) 3/2015/PD dated 28.01.2015',
+    'is_primary': True,
+    'output_type': 'pass_through',
+}
 
 
 def heuristic_MT_BOND_01(
@@ -14,7 +133,9 @@ def heuristic_MT_BOND_01(
     claimed_bond_interest_sbu: float,
     staff_name: str = "",
     staff_approved_amount: Optional[float] = None,
-    staff_justification: str = ""
+    staff_justification: str = "",
+    *,
+    include_steps: bool = True,
 ) -> Dict:
     """
     MT-BOND-01: Interest on Master Trust Bonds
@@ -34,6 +155,7 @@ def heuristic_MT_BOND_01(
         staff_name: Name of staff reviewing this heuristic
         staff_approved_amount: Amount approved by staff (overrides recommended)
         staff_justification: Staff justification for override
+        include_steps: Build calculation_steps (False gives an empty list)
     
     Returns:
         Heuristic result dictionary with bond interest allocation
@@ -44,10 +166,6 @@ def heuristic_MT_BOND_01(
         RED: Variance >3% - recalculate allocation
     """
     
-    heuristic_id = "MT-BOND-01"
-    heuristic_name = "Interest on Master Trust Bonds"
-    line_item = "Master Trust Obligations"
-    
     # Calculate SBU share
     allowable_bond_interest_sbu = total_bond_interest * sbu_allocation_ratio / 100
     
@@ -55,60 +173,28 @@ def heuristic_MT_BOND_01(
     variance_absolute = claimed_bond_interest_sbu - allowable_bond_interest_sbu
     variance_percentage = (variance_absolute / allowable_bond_interest_sbu * 100) if allowable_bond_interest_sbu != 0 else 0
     
-    # Determine flag
-    abs_variance_pct = abs(variance_percentage)
-    notes = []
-    
-    if abs_variance_pct <= 1:
-        flag = 'GREEN'
-        recommendation_text = f"Approve Master Trust bond interest of ₹{allowable_bond_interest_sbu:.2f} Cr."
-    elif abs_variance_pct <= 3:
-        flag = 'YELLOW'
-        notes.append(f"Minor variance of {variance_percentage:+.2f}%. Verify SBU allocation ratio (employee strength vs employee cost basis).")
-        recommendation_text = f"Approve ₹{allowable_bond_interest_sbu:.2f} Cr. " + " ".join(notes)
-    else:
-        flag = 'RED'
-        notes.append(f"Variance of {variance_percentage:+.2f}% detected. Recalculate SBU allocation based on actual employee strength ratio from audited accounts.")
-        recommendation_text = f"Approve ₹{allowable_bond_interest_sbu:.2f} Cr. " + " ".join(notes)
-    
-    # Calculation steps
-    calculation_steps = [
-        "=== 20-Year Bond Details (Issued 01.04.2017) ===",
-        "Original Principal: ₹8144.00 Cr",
-        "Coupon Rate: 10% p.a.",
-        "Annual Principal Repayment: ₹407.20 Cr",
-        "",
-        "=== FY 2023-24 (Year 7 of 20) ===",
-        f"Total Bond Interest (Company): ₹{total_bond_interest:.2f} Cr",
-        f"SBU Allocation Ratio (employee strength): {sbu_allocation_ratio:.2f}%",
-        f"Allowable SBU Bond Interest: ₹{allowable_bond_interest_sbu:.2f} Cr",
-        f"KSEB Claimed (SBU): ₹{claimed_bond_interest_sbu:.2f} Cr",
-        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)"
-    ]
+    # Determine flag and recommendation
+    band = flag_band(_MT_THRESHOLDS, abs(variance_percentage))
+    flag = _FLAGS[band]
+    recommendation_text = _MT_BOND_RECS[band].format(
+        allowable=allowable_bond_interest_sbu, variance_pct=variance_percentage
+    )
     
-    regulatory_basis = "Regulation 30, Regulation 34; Transfer Scheme notified vide GO(P) 46/2013/PD dated 31.10.2013 and GO(P) 3/2015/PD dated 28.01.2015"
+    # Calculation steps (rendered on first access)
+    calculation_steps = LazySteps(
+        _render_mt_bond_steps,
+        total_bond_interest, sbu_allocation_ratio, allowable_bond_interest_sbu,
+        claimed_bond_interest_sbu, variance_absolute, variance_percentage,
+    ) if include_steps else []
     
     # Staff review
-    staff_override_flag = None
-    staff_review_status = "Pending"
-    reviewed_by = None
-    reviewed_at = None
-    
-    if staff_approved_amount is not None:
-        if abs(staff_approved_amount - allowable_bond_interest_sbu) < 0.5:
-            staff_review_status = "Accepted"
-        else:
-            staff_review_status = "Overridden"
-            staff_override_flag = "STAFF_OVERRIDE"
-        reviewed_by = staff_name if staff_name else None
-        reviewed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    final_approved_amount = staff_approved_amount if staff_approved_amount is not None else allowable_bond_interest_sbu
+    (staff_review_status, staff_override_flag, reviewed_by, reviewed_at,
+     final_approved_amount) = apply_staff_review(
+        allowable_bond_interest_sbu, staff_approved_amount, staff_name, tolerance=0.5
+    )
     
     return {
-        'heuristic_id': heuristic_id,
-        'heuristic_name': heuristic_name,
-        'line_item': line_item,
+        **_MT_BOND_TEMPLATE,
         'claimed_value': claimed_bond_interest_sbu,
         'allowable_value': allowable_bond_interest_sbu,
         'variance_absolute': variance_absolute,
@@ -116,7 +202,6 @@ def heuristic_MT_BOND_01(
         'flag': flag,
         'recommended_amount': allowable_bond_interest_sbu,
         'recommendation_text': recommendation_text,
-        'regulatory_basis': regulatory_basis,
         'calculation_steps': calculation_steps,
         'staff_override_flag': staff_override_flag,
         'staff_approved_amount': final_approved_amount,
@@ -125,18 +210,36 @@ def heuristic_MT_BOND_01(
         'reviewed_by': reviewed_by,
         'reviewed_at': reviewed_at,
         'depends_on': [],
-        'is_primary': True,
-        'output_type': 'pass_through'
     }
 
 
+# Recommendation text per flag band, filled with str.format
+_MT_REPAY_RECS = (
+    "Approve Master Trust bond principal repayment of ₹{allowable:.2f} Cr.",
+    "Approve ₹{allowable:.2f} Cr. Minor variance of {variance_pct:+.2f}%. Verify SBU allocation methodology.",
+    "Approve ₹{allowable:.2f} Cr. Variance of {variance_pct:+.2f}%. Recalculate allocation using employee strength ratio from audited accounts.",
+)
+
+# Constant result fields; each call merges in only the computed ones.
+_MT_REPAY_TEMPLATE = {
+    'heuristic_id': 'MT-REPAY-01',
+    'heuristic_name': 'Repayment of Master Trust Bond Principal',
+    'line_item': 'Master Trust Obligations',
+    'regulatory_basis': 'Regulation 34(iv) as amended by KSERC (Terms and Conditions for Determination of Tariff) (Second Amendment) Regulations, 2024; Transfer Scheme provisions',
+    'is_primary': True,
+    'output_type': 'pass_through',
+}
+
+
 def heuristic_MT_REPAY_01(
     annual_principal_repayment: float,
     sbu_allocation_ratio: float,
     claimed_principal_repayment_sbu: float,
     staff_name: str = "",
     staff_approved_amount: Optional[float] = None,
-    staff_justification: str = ""
+    staff_justification: str = "",
+    *,
+    include_steps: bool = True,
 ) -> Dict:
     """
     MT-REPAY-01: Repayment of Master Trust Bond Principal
@@ -154,6 +257,7 @@ def heuristic_MT_REPAY_01(
         staff_name: Name of staff reviewing this heuristic
         staff_approved_amount: Amount approved by staff (overrides recommended)
         staff_justification: Staff justification for override
+        include_steps: Build calculation_steps (False gives an empty list)
     
     Returns:
         Heuristic result dictionary with principal repayment allocation
@@ -164,10 +268,6 @@ def heuristic_MT_REPAY_01(
         RED: Variance >3%
     """
     
-    heuristic_id = "MT-REPAY-01"
-    heuristic_name = "Repayment of Master Trust Bond Principal"
-    line_item = "Master Trust Obligations"
-    
     # Calculate SBU share
     allowable_principal_repayment_sbu = annual_principal_repayment * sbu_allocation_ratio / 100
     
@@ -175,63 +275,29 @@ def heuristic_MT_REPAY_01(
     variance_absolute = claimed_principal_repayment_sbu - allowable_principal_repayment_sbu
     variance_percentage = (variance_absolute / allowable_principal_repayment_sbu * 100) if allowable_principal_repayment_sbu != 0 else 0
     
-    # Determine flag
-    abs_variance_pct = abs(variance_percentage)
-    notes = []
-    
-    if abs_variance_pct <= 1:
-        flag = 'GREEN'
-        recommendation_text = f"Approve Master Trust bond principal repayment of ₹{allowable_principal_repayment_sbu:.2f} Cr."
-    elif abs_variance_pct <= 3:
-        flag = 'YELLOW'
-        notes.append(f"Minor variance of {variance_percentage:+.2f}%. Verify SBU allocation methodology.")
-        recommendation_text = f"Approve ₹{allowable_principal_repayment_sbu:.2f} Cr. " + " ".join(notes)
-    else:
-        flag = 'RED'
-        notes.append(f"Variance of {variance_percentage:+.2f}%. Recalculate allocation using employee strength ratio from audited accounts.")
-        recommendation_text = f"Approve ₹{allowable_principal_repayment_sbu:.2f} Cr. " + " ".join(notes)
-    
-    # Calculation steps
-    calculation_steps = [
-        "=== Bond Repayment Schedule ===",
-        "Annual Principal Repayment (Fixed): ₹407.20 Cr",
-        "Repayment Period: 20 years (2017-18 to 2036-37)",
-        "",
-        "=== SBU Allocation ===",
-        f"Total Principal Repayment (Company): ₹{annual_principal_repayment:.2f} Cr",
-        f"SBU Allocation Ratio (employee strength): {sbu_allocation_ratio:.2f}%",
-        f"Allowable SBU Principal Repayment: ₹{allowable_principal_repayment_sbu:.2f} Cr",
-        f"KSEB Claimed (SBU): ₹{claimed_principal_repayment_sbu:.2f} Cr",
-        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)",
-        "",
-        "=== Legal Status ===",
-        "Regulation 34(iv) challenged in Kerala HC WP(C) 19205/2023 (judgment dated 07.09.2023)",
-        "Reinstated via KSERC Second Amendment Regulations 2024 (notified 27.02.2024)"
-    ]
-    
-    regulatory_basis = "Regulation 34(iv) as amended by KSERC (Terms and Conditions for Determination of Tariff) (Second Amendment) Regulations, 2024; Transfer Scheme provisions"
+    # Determine flag and recommendation
+    band = flag_band(_MT_THRESHOLDS, abs(variance_percentage))
+    flag = _FLAGS[band]
+    recommendation_text = _MT_REPAY_RECS[band].format(
+        allowable=allowable_principal_repayment_sbu, variance_pct=variance_percentage
+    )
+    
+    # Calculation steps (rendered on first access)
+    calculation_steps = LazySteps(
+        _render_mt_repay_steps,
+        annual_principal_repayment, sbu_allocation_ratio,
+        allowable_principal_repayment_sbu, claimed_principal_repayment_sbu,
+        variance_absolute, variance_percentage,
+    ) if include_steps else []
     
     # Staff review
-    staff_override_flag = None
-    staff_review_status = "Pending"
-    reviewed_by = None
-    reviewed_at = None
-    
-    if staff_approved_amount is not None:
-        if abs(staff_approved_amount - allowable_principal_repayment_sbu) < 0.5:
-            staff_review_status = "Accepted"
-        else:
-            staff_review_status = "Overridden"
-            staff_override_flag = "STAFF_OVERRIDE"
-        reviewed_by = staff_name if staff_name else None
-        reviewed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    final_approved_amount = staff_approved_amount if staff_approved_amount is not None else allowable_principal_repayment_sbu
+    (staff_review_status, staff_override_flag, reviewed_by, reviewed_at,
+     final_approved_amount) = apply_staff_review(
+        allowable_principal_repayment_sbu, staff_approved_amount, staff_name, tolerance=0.5
+    )
     
     return {
-        'heuristic_id': heuristic_id,
-        'heuristic_name': heuristic_name,
-        'line_item': line_item,
+        **_MT_REPAY_TEMPLATE,
         'claimed_value': claimed_principal_repayment_sbu,
         'allowable_value': allowable_principal_repayment_sbu,
         'variance_absolute': variance_absolute,
@@ -239,7 +305,6 @@ def heuristic_MT_REPAY_01(
         'flag': flag,
         'recommended_amount': allowable_principal_repayment_sbu,
         'recommendation_text': recommendation_text,
-        'regulatory_basis': regulatory_basis,
         'calculation_steps': calculation_steps,
         'staff_override_flag': staff_override_flag,
         'staff_approved_amount': final_approved_amount,
@@ -248,11 +313,32 @@ def heuristic_MT_REPAY_01(
         'reviewed_by': reviewed_by,
         'reviewed_at': reviewed_at,
         'depends_on': [],
-        'is_primary': True,
-        'output_type': 'pass_through'
     }
 
 
+# MT-ADD-01 compliance table: (actuarial report submitted, govt approval
+# obtained) → (allowable basis, flag, note). Basis 0 approves the full
+# actuarial liability, 1 caps it at the provisional cap pending Government
+# approval, 2 allows the provisional cap until the report is submitted.
+_MT_ADD_NOTE_NO_REPORT = "Provisionally approved at ₹{cap:.2f} Cr. KSEBL must submit actuarial report as on 31.03.YYYY within 2 months per Regulation 30(3) and Order Para 6.82. Non-compliance may result in revocation."
+_MT_ADD_COMPLIANCE = {
+    (True, True): (0, 'GREEN', "Actuarial report submitted and Government approval obtained. Full actuarial liability approved."),
+    (True, False): (1, 'YELLOW', "Provisionally approved at ₹{cap:.2f} Cr cap. Pending State Government approval."),
+    (False, True): (2, 'YELLOW', _MT_ADD_NOTE_NO_REPORT),
+    (False, False): (2, 'YELLOW', _MT_ADD_NOTE_NO_REPORT),
+}
+
+# Constant result fields; each call merges in only the computed ones.
+_MT_ADD_TEMPLATE = {
+    'heuristic_id': 'MT-ADD-01',
+    'heuristic_name': 'Additional Contribution to Master Trust',
+    'line_item': 'Master Trust Obligations',
+    'regulatory_basis': 'Regulation 30(3), Regulation 45(2), Regulation 58(3), Regulation 80; MYT Order dated 25.06.2022; Truing-Up Order Para 6.81-6.82',
+    'is_primary': True,
+    'output_type': 'conditional',
+}
+
+
 def heuristic_MT_ADD_01(
     actuarial_liability_current_year: float,
     provisional_cap: float,
@@ -262,7 +348,9 @@ def heuristic_MT_ADD_01(
     govt_approval_obtained: bool,
     staff_name: str = "",
     staff_approved_amount: Optional[float] = None,
-    staff_justification: str = ""
+    staff_justification: str = "",
+    *,
+    include_steps: bool = True,
 ) -> Dict:
     """
     MT-ADD-01: Additional Contribution to Master Trust
@@ -291,6 +379,7 @@ def heuristic_MT_ADD_01(
         staff_name: Name of staff reviewing this heuristic
         staff_approved_amount: Amount approved by staff (overrides recommended)
         staff_justification: Staff justification for override
+        include_steps: Build calculation_steps (False gives an empty list)
     
     Returns:
         Heuristic result dictionary with conditional approval status
@@ -301,31 +390,14 @@ def heuristic_MT_ADD_01(
         RED: No actuarial report OR exceeds cap without justification
     """
     
-    heuristic_id = "MT-ADD-01"
-    heuristic_name = "Additional Contribution to Master Trust"
-    line_item = "Master Trust Obligations"
-    
     # Determine allowable amount based on compliance
-    if actuarial_report_submitted and govt_approval_obtained:
-        # Full actuarial liability can be approved
-        allowable_total = actuarial_liability_current_year
-        flag = 'GREEN'
-        note = "Actuarial report submitted and Government approval obtained. Full actuarial liability approved."
-    elif actuarial_report_submitted and not govt_approval_obtained:
-        # Cap at provisional amount pending govt approval
-        allowable_total = min(provisional_cap, actuarial_liability_current_year)
-        flag = 'YELLOW'
-        note = f"Provisionally approved at ₹{provisional_cap:.2f} Cr cap. Pending State Government approval."
-    elif not actuarial_report_submitted:
-        # Cap at provisional amount, flag for compliance
-        allowable_total = provisional_cap
-        flag = 'YELLOW'
-        note = f"Provisionally approved at ₹{provisional_cap:.2f} Cr. KSEBL must submit actuarial report as on 31.03.YYYY within 2 months per Regulation 30(3) and Order Para 6.82. Non-compliance may result in revocation."
-    else:
-        # No documentation - reject
-        allowable_total = 0.0
-        flag = 'RED'
-        note = "Additional contribution disallowed. KSEBL must submit: (1) Actuarial valuation report, (2) Board-approved funding proposal, (3) State Government approval."
+    basis, flag, note = _MT_ADD_COMPLIANCE[bool(actuarial_report_submitted), bool(govt_approval_obtained)]
+    allowable_total = (
+        actuarial_liability_current_year,
+        min(provisional_cap, actuarial_liability_current_year),
+        provisional_cap,
+    )[basis]
+    note = note.format(cap=provisional_cap)
     
     # Calculate SBU share
     allowable_sbu = allowable_total * sbu_allocation_ratio / 100
@@ -337,53 +409,22 @@ def heuristic_MT_ADD_01(
     # Build recommendation
     recommendation_text = f"Approve additional Master Trust contribution of ₹{allowable_sbu:.2f} Cr. {note}"
     
-    # Calculation steps
-    calculation_steps = [
-        "=== Actuarial Liability Context ===",
-        f"Actuarial Liability Addition (FY): ₹{actuarial_liability_current_year:.2f} Cr",
-        f"KSERC Provisional Cap: ₹{provisional_cap:.2f} Cr",
-        f"Unfunded Liability (31.03.YYYY): ₹30,177.31 Cr (CRITICAL CRISIS)",
-        "",
-        "=== Compliance Status ===",
-        f"Actuarial Report Submitted: {'YES' if actuarial_report_submitted else 'NO'}",
-        f"State Government Approval: {'YES' if govt_approval_obtained else 'NO'}",
-        "",
-        "=== Approved Amount ===",
-        f"Total Allowable (Company): ₹{allowable_total:.2f} Cr",
-        f"SBU Allocation Ratio: {sbu_allocation_ratio:.2f}%",
-        f"Allowable SBU Contribution: ₹{allowable_sbu:.2f} Cr",
-        f"KSEB Claimed (SBU): ₹{claimed_additional_contribution_sbu:.2f} Cr",
-        f"Variance: ₹{variance_absolute:.2f} Cr ({variance_percentage:+.2f}%)",
-        "",
-        "=== Regulatory Requirement ===",
-        "Per Regulation 30(3): Submit actuarial liability + funding proposal + Govt approval",
-        "Per Order Para 6.82: Deadline is 2 months from Order date",
-        "Warning: Non-compliance may result in revocation of provisional approval"
-    ]
-    
-    regulatory_basis = "Regulation 30(3), Regulation 45(2), Regulation 58(3), Regulation 80; MYT Order dated 25.06.2022; Truing-Up Order Para 6.81-6.82"
+    # Calculation steps (rendered on first access)
+    calculation_steps = LazySteps(
+        _render_mt_add_steps,
+        actuarial_liability_current_year, provisional_cap, actuarial_report_submitted,
+        govt_approval_obtained, allowable_total, sbu_allocation_ratio, allowable_sbu,
+        claimed_additional_contribution_sbu, variance_absolute, variance_percentage,
+    ) if include_steps else []
     
     # Staff review
-    staff_override_flag = None
-    staff_review_status = "Pending"
-    reviewed_by = None
-    reviewed_at = None
-    
-    if staff_approved_amount is not None:
-        if abs(staff_approved_amount - allowable_sbu) < 1.0:
-            staff_review_status = "Accepted"
-        else:
-            staff_review_status = "Overridden"
-            staff_override_flag = "STAFF_OVERRIDE"
-        reviewed_by = staff_name if staff_name else None
-        reviewed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    final_approved_amount = staff_approved_amount if staff_approved_amount is not None else allowable_sbu
+    (staff_review_status, staff_override_flag, reviewed_by, reviewed_at,
+     final_approved_amount) = apply_staff_review(
+        allowable_sbu, staff_approved_amount, staff_name, tolerance=1.0
+    )
     
     return {
-        'heuristic_id': heuristic_id,
-        'heuristic_name': heuristic_name,
-        'line_item': line_item,
+        **_MT_ADD_TEMPLATE,
         'claimed_value': claimed_additional_contribution_sbu,
         'allowable_value': allowable_sbu,
         'variance_absolute': variance_absolute,
@@ -391,7 +432,6 @@ def heuristic_MT_ADD_01(
         'flag': flag,
         'recommended_amount': allowable_sbu,
         'recommendation_text': recommendation_text,
-        'regulatory_basis': regulatory_basis,
         'calculation_steps': calculation_steps,
         'staff_override_flag': staff_override_flag,
         'staff_approved_amount': final_approved_amount,
@@ -400,6 +440,93 @@ def heuristic_MT_ADD_01(
         'reviewed_by': reviewed_by,
         'reviewed_at': reviewed_at,
         'depends_on': [],
-        'is_primary': True,
-        'output_type': 'conditional'
-    }
\ No newline at end of file
+    }
+
+
+# =============================================================================
+# CONVENIENCE: Run all Master Trust heuristics
+# =============================================================================
+
+# Run order of run_all_master_trust_heuristics: (heuristic, params argument)
+_MT_HEURISTICS = (
+    (heuristic_MT_BOND_01, 'bond_params'),    # 1. Interest on Master Trust Bonds
+    (heuristic_MT_REPAY_01, 'repay_params'),  # 2. Repayment of Bond Principal
+    (heuristic_MT_ADD_01, 'add_params'),      # 3. Additional Contribution
+)
+
+
+def run_all_master_trust_heuristics(
+    bond_params: Dict,
+    repay_params: Dict,
+    add_params: Dict,
+    *,
+    include_steps: bool = True,
+) -> List[Dict]:
+    """
+    Run all 3 Master Trust heuristics and return results (Master Trust
+    Obligations = sum of their allowable values).
+
+    include_steps is passed to every heuristic unless its params dict
+    sets include_steps itself.
+    """
+    params = {
+        'bond_params': bond_params,
+        'repay_params': repay_params,
+        'add_params': add_params,
+    }
+    return [
+        fn(**{'include_steps': include_steps, **params[key]})
+        for fn, key in _MT_HEURISTICS
+    ]
+
+
+# =============================================================================
+# BATCH EVALUATION: many SBUs / years / scenarios in one NumPy pass
+# =============================================================================
+
+def _mt_allocation_batch(company_total, sbu_allocation_ratio, claimed_sbu) -> Dict[str, np.ndarray]:
+    """SBU share of a company-wide Master Trust amount, its variance and flag."""
+    total, ratio, claimed = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (company_total, sbu_allocation_ratio, claimed_sbu))
+    )
+
+    allowable = total * ratio / 100
+    variance_abs = claimed - allowable
+    variance_pct = nonzero_pct_array(variance_abs, allowable)
+
+    flag = np.take(_FLAGS, np.searchsorted(_MT_THRESHOLDS, np.abs(variance_pct), side='left'))
+
+    return {
+        'allowable_value': allowable,
+        'variance_absolute': variance_abs,
+        'variance_percentage': variance_pct,
+        'flag': flag,
+    }
+
+
+def heuristic_MT_BOND_01_batch(
+    total_bond_interest,
+    sbu_allocation_ratio,
+    claimed_bond_interest_sbu,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized MT-BOND-01 over 1-D arrays (one element per SBU / year).
+
+    Same ±1% / ±3% flag thresholds as heuristic_MT_BOND_01.
+    Returns a dict of arrays.
+    """
+    return _mt_allocation_batch(total_bond_interest, sbu_allocation_ratio, claimed_bond_interest_sbu)
+
+
+def heuristic_MT_REPAY_01_batch(
+    annual_principal_repayment,
+    sbu_allocation_ratio,
+    claimed_principal_repayment_sbu,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized MT-REPAY-01 over 1-D arrays (one element per SBU / year).
+
+    Same ±1% / ±3% flag thresholds as heuristic_MT_REPAY_01.
+    Returns a dict of arrays.
+    """
+    return _mt_allocation_batch(annual_principal_repayment, sbu_allocation_ratio, claimed_principal_repayment_sbu)
\ No newline at end of file
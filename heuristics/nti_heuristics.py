@@ -3,7 +3,127 @@ Non-Tariff Income (NTI) Heuristics for SBU-G
 Contains: NTI-01
 """
 
-from typing import Dict, Optional
+from math import fsum
+from typing import Any, Dict, List, Optional
+
+from heuristics.lazy_steps import LazySteps
+from heuristics.result_fields import STAFF_REVIEW_DEFAULTS, HeuristicResult, flag_band
+
+# Constant result fields; each call merges in only the computed ones.
+_NTI_TEMPLATE = {
+    # Identification
+    'heuristic_id': 'NTI-01',
+    'heuristic_name': 'Non-Tariff Income Validation',
+    'line_item': 'Non-Tariff Income',
+    'regulatory_basis': 'Regulation 52, Tariff Regulations 2021',
+
+    # Metadata
+    'is_primary': True,  # PRIMARY HEURISTIC - determines approved NTI
+    'output_type': 'approved_amount',
+    'note': 'NTI is revenue - higher values reduce consumer tariff burden',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_FLAGS = ('GREEN', 'YELLOW', 'RED')
+
+
+class NTIResult(HeuristicResult, total=False):
+    nti_breakdown: Dict[str, Any]  # only with include_details=True
+
+
+# Flag bands on |claimed vs calculated variance %|: <=2 GREEN, <=5 YELLOW,
+# else RED (flag_band into _FLAGS)
+_NTI_THRESHOLDS = (2.0, 5.0)
+# Recommendation per flag band
+_NTI_RECS = (
+    'Approve as calculated - matches KSEB calculation',
+    'Minor variance in calculation - verify components',
+    'Significant calculation variance - scrutinize adjustments',
+)
+
+# MYT baseline notes: NTI more than 50% above / 20% below the baseline
+_MYT_NOTE_HIGH = "Note: NTI is {:.1f}% higher than MYT baseline. Verify actual income from audited accounts."
+_MYT_NOTE_LOW = "Note: NTI is {:.1f}% lower than MYT baseline. Verify for revenue shortfall."
+
+# Calculation-step labels, in the order of the exclusion / addition arguments
+_NTI_EXCLUSION_LABELS = (
+    "Grant claw-back (depreciation-related)",
+    "LED bulb costs (A&G expense)",
+    "Nilaavu scheme income",
+    "Provision reversals (unrealized)",
+    "KWA unrealized interest",
+    "Other exclusions",
+)
+_NTI_ADDITION_LABELS = (
+    "KWA arrears released by Govt",
+    "Other additions",
+)
+
+# Static calculation-step blocks
+_NTI_HEADER_STEPS = (
+    "NON-TARIFF INCOME CALCULATION (Regulation 52, Tariff Regulations 2021)",
+    "",
+    "═══ INCOME FROM ACCOUNTS ═══",
+)
+_NTI_FOOTER_STEPS = (
+    "",
+    "Note: Higher NTI reduces tariff burden on consumers.",
+)
+
+
+def _render_nti_steps(
+    base_income_from_accounts, exclusions, additions, total_exclusions, total_additions,
+    allowable_nti, myt_baseline_nti, claimed_nti,
+    variance_vs_calculated, variance_vs_calculated_pct, variance_vs_myt, variance_vs_myt_pct,
+    myt_note,
+) -> List[str]:
+    """Render NTI-01 calculation steps for display."""
+    # Only the adjustments actually applied are listed
+    if total_additions > 0:
+        addition_steps = [
+            "═══ REGULATORY ADDITIONS ═══",
+            *[
+                f"Add: {label}: ₹{amount:.2f} Cr"
+                for label, amount in zip(_NTI_ADDITION_LABELS, additions)
+                if amount > 0
+            ],
+            f"Total Additions: ₹{total_additions:.2f} Cr",
+            "",
+        ]
+    else:
+        addition_steps = []
+    
+    return [
+        *_NTI_HEADER_STEPS,
+        f"Base Income (from audited accounts): ₹{base_income_from_accounts:.2f} Cr",
+        "",
+        "═══ REGULATORY EXCLUSIONS ═══",
+        *[
+            f"Less: {label}: ₹{amount:.2f} Cr"
+            for label, amount in zip(_NTI_EXCLUSION_LABELS, exclusions)
+            if amount > 0
+        ],
+        f"Total Exclusions: ₹{total_exclusions:.2f} Cr",
+        "",
+        *addition_steps,
+        "═══ ALLOWABLE NTI ═══",
+        f"Base Income: ₹{base_income_from_accounts:.2f} Cr",
+        f"Less: Total Exclusions: ₹{total_exclusions:.2f} Cr",
+        f"Add: Total Additions: ₹{total_additions:.2f} Cr",
+        f"Allowable NTI: ₹{allowable_nti:.2f} Cr",
+        "",
+        "═══ COMPARISON ═══",
+        f"MYT Baseline (2023-24): ₹{myt_baseline_nti:.2f} Cr",
+        f"KSERC Calculated: ₹{allowable_nti:.2f} Cr",
+        f"KSEB Claimed: ₹{claimed_nti:.2f} Cr",
+        f"Variance (Claimed vs Calculated): {variance_vs_calculated:+.2f} Cr ({variance_vs_calculated_pct:+.2f}%)",
+        f"Variance vs MYT: {variance_vs_myt:+.2f} Cr ({variance_vs_myt_pct:+.2f}%)",
+        "",
+        *([myt_note] if myt_note else []),
+        *_NTI_FOOTER_STEPS,
+    ]
+
 
 def heuristic_NTI_01(
     # MYT baseline (from MYT 2022 order)
@@ -27,8 +147,10 @@ def heuristic_NTI_01(
     other_additions: float = 0.0,
     
     # KSEB's claimed NTI
-    claimed_nti: float = 0.0
-) -> Dict:
+    claimed_nti: float = 0.0,
+    *,
+    include_details: bool = True,
+) -> NTIResult:
     """
     NTI-01: Non-Tariff Income Validation
     
@@ -51,26 +173,22 @@ def heuristic_NTI_01(
         other_exclusions: Any other exclusions
         other_additions: Any other additions
         claimed_nti: Total NTI claimed by KSEB
+        include_details: Add the nti_breakdown dict
     
     Returns:
         Heuristic result dictionary with NTI validation
     """
     
-    # Calculate total exclusions
-    total_exclusions = (
-        exclusion_grant_clawback +
-        exclusion_led_bulbs +
-        exclusion_nilaavu_scheme +
-        exclusion_provision_reversals +
-        exclusion_kwa_unrealized +
-        other_exclusions
+    # Regulatory adjustments, in _NTI_EXCLUSION_LABELS / _NTI_ADDITION_LABELS order
+    exclusions = (
+        exclusion_grant_clawback, exclusion_led_bulbs, exclusion_nilaavu_scheme,
+        exclusion_provision_reversals, exclusion_kwa_unrealized, other_exclusions,
     )
+    additions = (addition_kwa_arrears_released, other_additions)
     
-    # Calculate total additions
-    total_additions = (
-        addition_kwa_arrears_released +
-        other_additions
-    )
+    # Totals (exactly rounded sums of the ledger figures)
+    total_exclusions = fsum(exclusions)
+    total_additions = fsum(additions)
     
     # Calculate allowable NTI
     allowable_nti = base_income_from_accounts - total_exclusions + total_additions
@@ -85,122 +203,67 @@ def heuristic_NTI_01(
     
     # Flag determination (revenue-favorable logic)
     # For NTI, higher is better (reduces tariff burden)
-    if abs(variance_vs_calculated_pct) <= 2:
-        flag = 'GREEN'
-        recommendation = 'Approve as calculated - matches KSEB calculation'
-    elif abs(variance_vs_calculated_pct) <= 5:
-        flag = 'YELLOW'
-        recommendation = 'Minor variance in calculation - verify components'
-    else:
-        flag = 'RED'
-        recommendation = 'Significant calculation variance - scrutinize adjustments'
+    band = flag_band(_NTI_THRESHOLDS, abs(variance_vs_calculated_pct))
+    flag = _FLAGS[band]
+    recommendation = _NTI_RECS[band]
     
     # Additional note if significantly higher than MYT
-    myt_note = ""
     if variance_vs_myt_pct > 50:
-        myt_note = f"Note: NTI is {variance_vs_myt_pct:.1f}% higher than MYT baseline. Verify actual income from audited accounts."
+        myt_note = _MYT_NOTE_HIGH.format(variance_vs_myt_pct)
     elif variance_vs_myt_pct < -20:
-        myt_note = f"Note: NTI is {abs(variance_vs_myt_pct):.1f}% lower than MYT baseline. Verify for revenue shortfall."
-    
-    # Calculation steps for display
-    calc_steps = [
-        "NON-TARIFF INCOME CALCULATION (Regulation 52, Tariff Regulations 2021)",
-        "",
-        "═══ INCOME FROM ACCOUNTS ═══",
-        f"Base Income (from audited accounts): ₹{base_income_from_accounts:.2f} Cr",
-        "",
-        "═══ REGULATORY EXCLUSIONS ═══"
-    ]
-    
-    # Add exclusion details
-    if exclusion_grant_clawback > 0:
-        calc_steps.append(f"Less: Grant claw-back (depreciation-related): ₹{exclusion_grant_clawback:.2f} Cr")
-    if exclusion_led_bulbs > 0:
-        calc_steps.append(f"Less: LED bulb costs (A&G expense): ₹{exclusion_led_bulbs:.2f} Cr")
-    if exclusion_nilaavu_scheme > 0:
-        calc_steps.append(f"Less: Nilaavu scheme income: ₹{exclusion_nilaavu_scheme:.2f} Cr")
-    if exclusion_provision_reversals > 0:
-        calc_steps.append(f"Less: Provision reversals (unrealized): ₹{exclusion_provision_reversals:.2f} Cr")
-    if exclusion_kwa_unrealized > 0:
-        calc_steps.append(f"Less: KWA unrealized interest: ₹{exclusion_kwa_unrealized:.2f} Cr")
-    if other_exclusions > 0:
-        calc_steps.append(f"Less: Other exclusions: ₹{other_exclusions:.2f} Cr")
-    
-    calc_steps.append(f"Total Exclusions: ₹{total_exclusions:.2f} Cr")
-    calc_steps.append("")
-    
-    # Add addition details
-    if total_additions > 0:
-        calc_steps.append("═══ REGULATORY ADDITIONS ═══")
-        if addition_kwa_arrears_released > 0:
-            calc_steps.append(f"Add: KWA arrears released by Govt: ₹{addition_kwa_arrears_released:.2f} Cr")
-        if other_additions > 0:
-            calc_steps.append(f"Add: Other additions: ₹{other_additions:.2f} Cr")
-        calc_steps.append(f"Total Additions: ₹{total_additions:.2f} Cr")
-        calc_steps.append("")
-    
-    calc_steps.extend([
-        "═══ ALLOWABLE NTI ═══",
-        f"Base Income: ₹{base_income_from_accounts:.2f} Cr",
-        f"Less: Total Exclusions: ₹{total_exclusions:.2f} Cr",
-        f"Add: Total Additions: ₹{total_additions:.2f} Cr",
-        f"Allowable NTI: ₹{allowable_nti:.2f} Cr",
-        "",
-        "═══ COMPARISON ═══",
-        f"MYT Baseline (2023-24): ₹{myt_baseline_nti:.2f} Cr",
-        f"KSERC Calculated: ₹{allowable_nti:.2f} Cr",
-        f"KSEB Claimed: ₹{claimed_nti:.2f} Cr",
-        f"Variance (Claimed vs Calculated): {variance_vs_calculated:+.2f} Cr ({variance_vs_calculated_pct:+.2f}%)",
-        f"Variance vs MYT: {variance_vs_myt:+.2f} Cr ({variance_vs_myt_pct:+.2f}%)",
-        ""
-    ])
-    
-    if myt_note:
-        calc_steps.append(myt_note)
-    
-    calc_steps.append("")
-    calc_steps.append("Note: Higher NTI reduces tariff burden on consumers.")
-    
-    # Create breakdown dictionary for detailed view
-    exclusions_breakdown = {
-        'grant_clawback': exclusion_grant_clawback,
-        'led_bulbs': exclusion_led_bulbs,
-        'nilaavu_scheme': exclusion_nilaavu_scheme,
-        'provision_reversals': exclusion_provision_reversals,
-        'kwa_unrealized': exclusion_kwa_unrealized,
-        'other': other_exclusions,
-        'total': total_exclusions
-    }
+        myt_note = _MYT_NOTE_LOW.format(-variance_vs_myt_pct)
+    else:
+        myt_note = ""
     
-    additions_breakdown = {
-        'kwa_arrears_released': addition_kwa_arrears_released,
-        'other': other_additions,
-        'total': total_additions
-    }
+    # Calculation steps for display (rendered on first access)
+    calc_steps = LazySteps(
+        _render_nti_steps,
+        base_income_from_accounts, exclusions, additions, total_exclusions, total_additions,
+        allowable_nti, myt_baseline_nti, claimed_nti,
+        variance_vs_calculated, variance_vs_calculated_pct, variance_vs_myt, variance_vs_myt_pct,
+        myt_note,
+    )
     
-    return {
-        # Identification
-        'heuristic_id': 'NTI-01',
-        'heuristic_name': 'Non-Tariff Income Validation',
-        'line_item': 'Non-Tariff Income',
-        
+    result = {
+        **_NTI_TEMPLATE,
+
         # Calculation Results
         'claimed_value': claimed_nti,
         'allowable_value': allowable_nti,
         'variance_absolute': variance_vs_calculated,
         'variance_percentage': variance_vs_calculated_pct,
-        
+
         # Tool's Assessment
         'flag': flag,
         'recommended_amount': allowable_nti,
         'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation 52, Tariff Regulations 2021',
-        
+
         # Calculation Details
         'calculation_steps': calc_steps,
+
+        # Dependencies
+        'depends_on': [],  # Independent calculation
+    }
+    
+    # Breakdown for reference
+    if include_details:
+        exclusions_breakdown = {
+            'grant_clawback': exclusion_grant_clawback,
+            'led_bulbs': exclusion_led_bulbs,
+            'nilaavu_scheme': exclusion_nilaavu_scheme,
+            'provision_reversals': exclusion_provision_reversals,
+            'kwa_unrealized': exclusion_kwa_unrealized,
+            'other': other_exclusions,
+            'total': total_exclusions
+        }
+        
+        additions_breakdown = {
+            'kwa_arrears_released': addition_kwa_arrears_released,
+            'other': other_additions,
+            'total': total_additions
+        }
         
-        # Detailed breakdowns
-        'nti_breakdown': {
+        result['nti_breakdown'] = {
             'base_income': base_income_from_accounts,
             'exclusions': exclusions_breakdown,
             'additions': additions_breakdown,
@@ -208,21 +271,6 @@ def heuristic_NTI_01(
             'myt_baseline': myt_baseline_nti,
             'variance_vs_myt': variance_vs_myt,
             'variance_vs_myt_pct': variance_vs_myt_pct
-        },
-        
-        # Staff Review Section
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        
-        # Dependencies
-        'depends_on': [],  # Independent calculation
-        
-        # Metadata
-        'is_primary': True,  # PRIMARY HEURISTIC - determines approved NTI
-        'output_type': 'approved_amount',
-        'note': 'NTI is revenue - higher values reduce consumer tariff burden'
-    }
\ No newline at end of file
+        }
+    
+    return result
\ No newline at end of file
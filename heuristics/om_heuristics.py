@@ -4,10 +4,148 @@ Contains: OM-INFL-01, OM-NORM-01, OM-APPORT-01, EMP-PAYREV-01
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+from heuristics.batch_math import safe_pct_array
+from heuristics.lazy_steps import LazySteps
+from heuristics.result_cache import cached_result
+from heuristics.result_fields import STAFF_REVIEW_DEFAULTS, HeuristicResult, flag_band
+
+_FLAGS = ('GREEN', 'YELLOW', 'RED')
+
+
+class OMApportResult(HeuristicResult, total=False):
+    component_details: List[Dict[str, str]]  # one row per O&M component, for the UI
+
+
+# Constant result fields; each call merges in only the computed ones.
+_OM_INFL_TEMPLATE = {
+    # Identification
+    'heuristic_id': 'OM-INFL-01',
+    'heuristic_name': 'O&M Inflation Calculation',
+    'line_item': 'O&M Expenses',
+    'regulatory_basis': 'Annexure-7, Para 1, Tariff Regulations 2021',
+
+    # Not applicable to a calculation-only heuristic
+    'claimed_value': None,
+    'variance_absolute': None,
+    'variance_percentage': None,
+
+    # Tool's Assessment (always GREEN if calculation succeeds)
+    'flag': 'GREEN',
+    'recommended_amount': None,  # This doesn't determine final amount
+    'recommendation_text': 'Inflation calculated per regulation',
+
+    # Metadata
+    'is_primary': False,  # Supporting heuristic
+    'output_type': 'calculated_value',  # Returns inflation % for use by others
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+_OM_NORM_TEMPLATE = {
+    'heuristic_id': 'OM-NORM-01',
+    'heuristic_name': 'Normative O&M Comparison (Existing Stations)',
+    'line_item': 'O&M Expenses',
+    'regulatory_basis': 'Regulation 45, Annexure-7 Table 3, Tariff Regulations 2021',
+
+    'is_primary': True,  # PRIMARY HEURISTIC - determines approved amount
+    'output_type': 'approved_amount',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+_OM_APPORT_TEMPLATE = {
+    'heuristic_id': 'OM-APPORT-01',
+    'heuristic_name': 'O&M Component Apportionment (Prudence Check)',
+    'line_item': 'O&M Expenses',
+    'regulatory_basis': 'MYT Order 2022, Table 4.23 (Component Ratios)',
+
+    'recommended_amount': None,  # Supporting heuristic - no amount impact
+    'is_primary': False,  # Supporting heuristic
+    'output_type': 'prudence_check',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+_EMP_PAYREV_TEMPLATE = {
+    'heuristic_id': 'EMP-PAYREV-01',
+    'heuristic_name': 'Pay Revision Component Check',
+    'line_item': 'O&M Expenses',
+    'regulatory_basis': 'Regulation 14(3), Tariff Regulations 2021; APTEL Order 10.11.2014',
+
+    'recommended_amount': None,  # Supporting heuristic
+    'is_primary': False,
+    'output_type': 'prudence_check',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+# OM-APPORT-01: component ratios (Employee, A&G, R&M; MYT Order 2022,
+# Table 4.23) and per-component bands on |variance %| (<=5 GREEN,
+# <=15 YELLOW, else RED) for searchsorted(side='left') into _FLAGS.
+_APPORT_COMPONENTS = ('Employee Cost', 'A&G Expenses', 'R&M Expenses')
+_APPORT_RATIOS = (0.7703, 0.0432, 0.1865)
+_APPORT_THRESHOLDS = (5.0, 15.0)
+
+# Flag bands on |variance %| for flag_band into _FLAGS.
+# OM-NORM-01: exactly normative GREEN, <=10 YELLOW, else RED.
+# EMP-PAYREV-01 (no pay revision on record): <=5 GREEN, <=15 YELLOW, else RED.
+_OM_NORM_THRESHOLDS = (0.0, 10.0)
+_EMP_PAYREV_THRESHOLDS = (5.0, 15.0)
+
+# OM-NORM-01 recommendation per flag band
+_OM_NORM_RECS = (
+    'Approve as claimed - within normative',
+    'Conditional approval - minor variance, justify excess',
+    'Reject excess - allow only normative amount',
+)
+# OM-APPORT-01 component comment per flag band
+_APPORT_COMMENTS = (
+    'Within normative limits',
+    'Minor deviation - monitor',
+    'Exceeds normative - requires justification',
+)
+# EMP-PAYREV-01 recommendation per flag band (no pay revision on record)
+_EMP_PAYREV_RECS = (
+    'Employee cost within acceptable limits',
+    'Moderate variance - verify no undisclosed pay revision',
+    'Significant variance with no pay revision on record - requires investigation',
+)
+
+
+def _om_norm_core(base_year_om, inflation_2022_23, inflation_2023_24, inflation_2024_25,
+                  new_stations_allowable) -> Tuple:
+    """
+    Numeric core of OM-NORM-01; works element-wise on NumPy arrays too.
+
+    Returns (om_2022_23, om_2023_24, om_2024_25, total_allowable).
+    """
+    om_2022_23 = base_year_om * (1 + inflation_2022_23 / 100)
+    om_2023_24 = om_2022_23 * (1 + inflation_2023_24 / 100)
+    om_2024_25 = om_2023_24 * (1 + inflation_2024_25 / 100)
+    return om_2022_23, om_2023_24, om_2024_25, om_2024_25 + new_stations_allowable
+
+
+def _render_om_infl_steps(
+    cpi_old, cpi_new, cpi_increase, wpi_old, wpi_new, wpi_increase, weighted_inflation,
+) -> List[str]:
+    """Render OM-INFL-01 calculation steps for display."""
+    return [
+        f"CPI Previous Year: {cpi_old}",
+        f"CPI Current Year: {cpi_new}",
+        f"CPI Increase: {cpi_increase:.2f}%",
+        f"WPI Previous Year: {wpi_old}",
+        f"WPI Current Year: {wpi_new}",
+        f"WPI Increase: {wpi_increase:.2f}%",
+        f"Formula: (CPI × 70%) + (WPI × 30%)",
+        f"Calculation: ({cpi_increase:.2f}% × 0.70) + ({wpi_increase:.2f}% × 0.30)",
+        f"Weighted Inflation: {weighted_inflation:.2f}%"
+    ]
+
+
+@cached_result(maxsize=128)
 def heuristic_OM_INFL_01(cpi_old: float, cpi_new: float, 
-                          wpi_old: float, wpi_new: float) -> Dict:
+                          wpi_old: float, wpi_new: float) -> HeuristicResult:
     """
     OM-INFL-01: Inflation Calculation
     
@@ -30,64 +168,56 @@ def heuristic_OM_INFL_01(cpi_old: float, cpi_new: float,
     # Weighted average: 70% CPI + 30% WPI
     weighted_inflation = (cpi_increase * 0.70) + (wpi_increase * 0.30)
     
-    # Calculation steps for display
-    calc_steps = [
-        f"CPI Previous Year: {cpi_old}",
-        f"CPI Current Year: {cpi_new}",
-        f"CPI Increase: {cpi_increase:.2f}%",
-        f"WPI Previous Year: {wpi_old}",
-        f"WPI Current Year: {wpi_new}",
-        f"WPI Increase: {wpi_increase:.2f}%",
-        f"Formula: (CPI × 70%) + (WPI × 30%)",
-        f"Calculation: ({cpi_increase:.2f}% × 0.70) + ({wpi_increase:.2f}% × 0.30)",
-        f"Weighted Inflation: {weighted_inflation:.2f}%"
-    ]
+    # Calculation steps for display (rendered on first access)
+    calc_steps = LazySteps(
+        _render_om_infl_steps,
+        cpi_old, cpi_new, cpi_increase, wpi_old, wpi_new, wpi_increase, weighted_inflation,
+    )
     
     return {
-        # Identification
-        'heuristic_id': 'OM-INFL-01',
-        'heuristic_name': 'O&M Inflation Calculation',
-        'line_item': 'O&M Expenses',
-        
+        **_OM_INFL_TEMPLATE,
+
         # Calculation Results (this is a calculation-only heuristic)
-        'claimed_value': None,  # Not applicable
         'allowable_value': weighted_inflation,  # The calculated inflation %
-        'variance_absolute': None,
-        'variance_percentage': None,
-        
-        # Tool's Assessment (always GREEN if calculation succeeds)
-        'flag': 'GREEN',
-        'recommended_amount': None,  # This doesn't determine final amount
-        'recommendation_text': 'Inflation calculated per regulation',
-        'regulatory_basis': 'Annexure-7, Para 1, Tariff Regulations 2021',
-        
+
         # Calculation Details
         'calculation_steps': calc_steps,
-        
-        # Staff Review Section
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        
+
         # Dependencies
         'depends_on': [],  # Independent calculation
-        
+
         # Metadata
-        'is_primary': False,  # Supporting heuristic
-        'output_type': 'calculated_value',  # Returns inflation % for use by others
         'output_value': weighted_inflation
     }
 
 
+def _render_om_norm_steps(
+    base_year_om, inflation_2022_23, om_2022_23, inflation_2023_24, om_2023_24,
+    inflation_2024_25, om_2024_25, new_stations_allowable, total_allowable,
+    claimed_existing, variance_abs, variance_pct,
+) -> List[str]:
+    """Render OM-NORM-01 calculation steps for display."""
+    return [
+        f"Base Year O&M (2021-22): {base_year_om:.2f} Cr",
+        f"Apply inflation 2022-23 ({inflation_2022_23:.2f}%): {om_2022_23:.2f} Cr",
+        f"Apply inflation 2023-24 ({inflation_2023_24:.2f}%): {om_2023_24:.2f} Cr",
+        f"Apply inflation 2024-25 ({inflation_2024_25:.2f}%): {om_2024_25:.2f} Cr",
+        f"Add new stations allowable: {new_stations_allowable:.2f} Cr",
+        f"Total Allowable O&M: {total_allowable:.2f} Cr",
+        "",
+        f"KSEB Claimed (Existing): {claimed_existing:.2f} Cr",
+        f"Variance: {variance_abs:+.2f} Cr ({variance_pct:+.2f}%)",
+        "",
+        "Threshold: ±0% = GREEN, ±10% = YELLOW, >10% = RED"
+    ]
+
+
 def heuristic_OM_NORM_01(base_year_om: float, 
                           inflation_2022_23: float,
                           inflation_2023_24: float,
                           inflation_2024_25: float,
                           claimed_existing: float,
-                          new_stations_allowable: float = 0.0) -> Dict:
+                          new_stations_allowable: float = 0.0) -> HeuristicResult:
     """
     OM-NORM-01: Normative O&M Comparison for Existing Stations
     
@@ -105,79 +235,73 @@ def heuristic_OM_NORM_01(base_year_om: float,
     Returns:
         Heuristic result with allowable O&M and variance analysis
     """
-    # Step-by-step escalation from base year
-    om_2022_23 = base_year_om * (1 + inflation_2022_23 / 100)
-    om_2023_24 = om_2022_23 * (1 + inflation_2023_24 / 100)
-    om_2024_25 = om_2023_24 * (1 + inflation_2024_25 / 100)
-    
-    # Total allowable = existing + new stations
-    total_allowable = om_2024_25 + new_stations_allowable
+    # Step-by-step escalation from base year; total allowable = existing + new stations
+    om_2022_23, om_2023_24, om_2024_25, total_allowable = _om_norm_core(
+        base_year_om, inflation_2022_23, inflation_2023_24, inflation_2024_25,
+        new_stations_allowable
+    )
     
     # Variance calculation
     variance_abs = claimed_existing - om_2024_25
     variance_pct = (variance_abs / om_2024_25) * 100 if om_2024_25 > 0 else 0
     
     # Flag determination
-    if abs(variance_pct) <= 0:
-        flag = 'GREEN'
-        recommendation = 'Approve as claimed - within normative'
-    elif abs(variance_pct) <= 10:
-        flag = 'YELLOW'
-        recommendation = 'Conditional approval - minor variance, justify excess'
-    else:
-        flag = 'RED'
-        recommendation = 'Reject excess - allow only normative amount'
-    
-    # Calculation steps
-    calc_steps = [
-        f"Base Year O&M (2021-22): {base_year_om:.2f} Cr",
-        f"Apply inflation 2022-23 ({inflation_2022_23:.2f}%): {om_2022_23:.2f} Cr",
-        f"Apply inflation 2023-24 ({inflation_2023_24:.2f}%): {om_2023_24:.2f} Cr",
-        f"Apply inflation 2024-25 ({inflation_2024_25:.2f}%): {om_2024_25:.2f} Cr",
-        f"Add new stations allowable: {new_stations_allowable:.2f} Cr",
-        f"Total Allowable O&M: {total_allowable:.2f} Cr",
-        "",
-        f"KSEB Claimed (Existing): {claimed_existing:.2f} Cr",
-        f"Variance: {variance_abs:+.2f} Cr ({variance_pct:+.2f}%)",
-        "",
-        "Threshold: ±0% = GREEN, ±10% = YELLOW, >10% = RED"
-    ]
+    band = flag_band(_OM_NORM_THRESHOLDS, abs(variance_pct))
+    flag = _FLAGS[band]
+    recommendation = _OM_NORM_RECS[band]
+    
+    # Calculation steps (rendered on first access)
+    calc_steps = LazySteps(
+        _render_om_norm_steps,
+        base_year_om, inflation_2022_23, om_2022_23, inflation_2023_24, om_2023_24,
+        inflation_2024_25, om_2024_25, new_stations_allowable, total_allowable,
+        claimed_existing, variance_abs, variance_pct,
+    )
     
     return {
-        'heuristic_id': 'OM-NORM-01',
-        'heuristic_name': 'Normative O&M Comparison (Existing Stations)',
-        'line_item': 'O&M Expenses',
-        
+        **_OM_NORM_TEMPLATE,
+
         'claimed_value': claimed_existing,
         'allowable_value': total_allowable,
         'variance_absolute': variance_abs,
         'variance_percentage': variance_pct,
-        
+
         'flag': flag,
         'recommended_amount': total_allowable,  # This determines final O&M amount
         'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation 45, Annexure-7 Table 3, Tariff Regulations 2021',
-        
+
         'calculation_steps': calc_steps,
-        
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        
+
         'depends_on': ['OM-INFL-01'],  # Needs inflation calculation first
-        
-        'is_primary': True,  # PRIMARY HEURISTIC - determines approved amount
-        'output_type': 'approved_amount'
     }
 
 
+def _render_om_apport_steps(
+    total_om_approved, total_actual, total_var, total_var_pct, component_rows,
+) -> List[str]:
+    """Render OM-APPORT-01 calculation steps for display."""
+    calc_steps = [
+        "Component Apportionment (MYT Order 2022, Para 4.52):",
+        "",
+        f"Total O&M Approved: {total_om_approved:.2f} Cr",
+        f"Total Actual Expenditure: {total_actual:.2f} Cr",
+        f"Overall Variance: {total_var:+.2f} Cr ({total_var_pct:+.2f}%)",
+        "",
+        "Component Breakdown:",
+    ]
+    
+    for component, normative, actual, variance, flag in component_rows:
+        calc_steps.append(
+            f"  {component}: {normative} (norm) vs {actual} (actual) = {variance} [{flag}]"
+        )
+    
+    return calc_steps
+
+
 def heuristic_OM_APPORT_01(total_om_approved: float,
                             actual_employee: float,
                             actual_ag: float,
-                            actual_rm: float) -> Dict:
+                            actual_rm: float) -> OMApportResult:
     """
     OM-APPORT-01: O&M Component Apportionment (Prudence Check)
     
@@ -193,42 +317,21 @@ def heuristic_OM_APPORT_01(total_om_approved: float,
     Returns:
         Heuristic result with prudence check flags for each component
     """
-    # Fixed component ratios (MYT Order 2022, Table 4.23)
-    RATIOS = {
-        'Employee': 0.7703,
-        'A&G': 0.0432,
-        'R&M': 0.1865
-    }
-    
-    # Calculate normative limits
-    normative_employee = total_om_approved * RATIOS['Employee']
-    normative_ag = total_om_approved * RATIOS['A&G']
-    normative_rm = total_om_approved * RATIOS['R&M']
-    
-    # Component analysis
+    # Component analysis against the fixed ratios (MYT Order 2022, Table 4.23)
     components = []
-    overall_flag = 'GREEN'
+    overall_band = 0
     
-    for name, actual, normative, ratio in [
-        ('Employee Cost', actual_employee, normative_employee, RATIOS['Employee']),
-        ('A&G Expenses', actual_ag, normative_ag, RATIOS['A&G']),
-        ('R&M Expenses', actual_rm, normative_rm, RATIOS['R&M'])
-    ]:
+    for name, actual, ratio in zip(
+        _APPORT_COMPONENTS, (actual_employee, actual_ag, actual_rm), _APPORT_RATIOS
+    ):
+        normative = total_om_approved * ratio
         var_abs = actual - normative
         var_pct = (var_abs / normative) * 100 if normative > 0 else 0
         
-        if abs(var_pct) <= 5:
-            comp_flag = 'GREEN'
-            comment = 'Within normative limits'
-        elif abs(var_pct) <= 15:
-            comp_flag = 'YELLOW'
-            comment = 'Minor deviation - monitor'
-            if overall_flag == 'GREEN':
-                overall_flag = 'YELLOW'
-        else:
-            comp_flag = 'RED'
-            comment = 'Exceeds normative - requires justification'
-            overall_flag = 'RED'
+        band = flag_band(_APPORT_THRESHOLDS, abs(var_pct))
+        comp_flag = _FLAGS[band]
+        comment = _APPORT_COMMENTS[band]
+        overall_band = max(overall_band, band)
         
         components.append({
             'component': name,
@@ -245,21 +348,16 @@ def heuristic_OM_APPORT_01(total_om_approved: float,
     total_var = total_actual - total_om_approved
     total_var_pct = (total_var / total_om_approved) * 100 if total_om_approved > 0 else 0
     
-    calc_steps = [
-        "Component Apportionment (MYT Order 2022, Para 4.52):",
-        "",
-        f"Total O&M Approved: {total_om_approved:.2f} Cr",
-        f"Total Actual Expenditure: {total_actual:.2f} Cr",
-        f"Overall Variance: {total_var:+.2f} Cr ({total_var_pct:+.2f}%)",
-        "",
-        "Component Breakdown:",
-    ]
-    
-    for comp in components:
-        calc_steps.append(
-            f"  {comp['component']}: {comp['normative_limit']} (norm) vs "
-            f"{comp['actual_expenditure']} (actual) = {comp['variance']} [{comp['flag']}]"
-        )
+    # Calculation steps (rendered on first access; rows snapshotted so
+    # later edits to component_details do not leak into the display)
+    calc_steps = LazySteps(
+        _render_om_apport_steps,
+        total_om_approved, total_actual, total_var, total_var_pct,
+        tuple(
+            (c['component'], c['normative_limit'], c['actual_expenditure'], c['variance'], c['flag'])
+            for c in components
+        ),
+    )
     
     recommendation = (
         'Prudence check only - does not affect approved amount. '
@@ -267,41 +365,57 @@ def heuristic_OM_APPORT_01(total_om_approved: float,
     )
     
     return {
-        'heuristic_id': 'OM-APPORT-01',
-        'heuristic_name': 'O&M Component Apportionment (Prudence Check)',
-        'line_item': 'O&M Expenses',
-        
+        **_OM_APPORT_TEMPLATE,
+
         'claimed_value': total_actual,
         'allowable_value': total_om_approved,
         'variance_absolute': total_var,
         'variance_percentage': total_var_pct,
-        
-        'flag': overall_flag,
-        'recommended_amount': None,  # Supporting heuristic - no amount impact
+
+        'flag': _FLAGS[overall_band],
         'recommendation_text': recommendation,
-        'regulatory_basis': 'MYT Order 2022, Table 4.23 (Component Ratios)',
-        
+
         'calculation_steps': calc_steps,
         'component_details': components,  # Additional detail for UI
-        
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        
+
         'depends_on': ['OM-NORM-01'],  # Needs approved total first
-        
-        'is_primary': False,  # Supporting heuristic
-        'output_type': 'prudence_check'
     }
 
 
+def _render_emp_payrev_steps(
+    employee_cost_normative, employee_cost_actual, variance_abs, variance_pct,
+    pay_revision_implemented, pay_revision_details,
+) -> List[str]:
+    """Render EMP-PAYREV-01 calculation steps for display."""
+    calc_steps = [
+        f"Normative Employee Cost: {employee_cost_normative:.2f} Cr",
+        f"Actual Employee Cost: {employee_cost_actual:.2f} Cr",
+        f"Variance: {variance_abs:+.2f} Cr ({variance_pct:+.2f}%)",
+        "",
+        f"Pay Revision Implemented: {'Yes' if pay_revision_implemented else 'No'}"
+    ]
+    
+    if pay_revision_implemented and pay_revision_details:
+        calc_steps.extend([
+            f"Pay Revision Date: {pay_revision_details.get('date', 'Not provided')}",
+            f"Government Order: {pay_revision_details.get('govt_order_ref', 'Not provided')}",
+            f"Pay Revision Amount: {pay_revision_details.get('amount', 'Not specified')} Cr"
+        ])
+    
+    calc_steps.extend([
+        "",
+        "Note: This is a prudence check only.",
+        "Does not affect the approved O&M amount.",
+        "Staff should note for monitoring and future reviews."
+    ])
+    
+    return calc_steps
+
+
 def heuristic_EMP_PAYREV_01(employee_cost_normative: float,
                              employee_cost_actual: float,
                              pay_revision_implemented: bool = False,
-                             pay_revision_details: Optional[Dict] = None) -> Dict:
+                             pay_revision_details: Optional[Dict] = None) -> HeuristicResult:
     """
     EMP-PAYREV-01: Pay Revision Component Check
     
@@ -322,15 +436,9 @@ def heuristic_EMP_PAYREV_01(employee_cost_normative: float,
     
     # Flag determination
     if not pay_revision_implemented:
-        if abs(variance_pct) <= 5:
-            flag = 'GREEN'
-            recommendation = 'Employee cost within acceptable limits'
-        elif abs(variance_pct) <= 15:
-            flag = 'YELLOW'
-            recommendation = 'Moderate variance - verify no undisclosed pay revision'
-        else:
-            flag = 'RED'
-            recommendation = 'Significant variance with no pay revision on record - requires investigation'
+        band = flag_band(_EMP_PAYREV_THRESHOLDS, abs(variance_pct))
+        flag = _FLAGS[band]
+        recommendation = _EMP_PAYREV_RECS[band]
     else:
         if pay_revision_details and pay_revision_details.get('govt_order_ref'):
             flag = 'YELLOW'
@@ -339,54 +447,150 @@ def heuristic_EMP_PAYREV_01(employee_cost_normative: float,
             flag = 'RED'
             recommendation = 'Pay revision claimed but government order reference missing'
     
-    calc_steps = [
-        f"Normative Employee Cost: {employee_cost_normative:.2f} Cr",
-        f"Actual Employee Cost: {employee_cost_actual:.2f} Cr",
-        f"Variance: {variance_abs:+.2f} Cr ({variance_pct:+.2f}%)",
-        "",
-        f"Pay Revision Implemented: {'Yes' if pay_revision_implemented else 'No'}"
-    ]
-    
-    if pay_revision_implemented and pay_revision_details:
-        calc_steps.extend([
-            f"Pay Revision Date: {pay_revision_details.get('date', 'Not provided')}",
-            f"Government Order: {pay_revision_details.get('govt_order_ref', 'Not provided')}",
-            f"Pay Revision Amount: {pay_revision_details.get('amount', 'Not specified')} Cr"
-        ])
-    
-    calc_steps.extend([
-        "",
-        "Note: This is a prudence check only.",
-        "Does not affect the approved O&M amount.",
-        "Staff should note for monitoring and future reviews."
-    ])
+    # Calculation steps (rendered on first access; details snapshotted)
+    calc_steps = LazySteps(
+        _render_emp_payrev_steps,
+        employee_cost_normative, employee_cost_actual, variance_abs, variance_pct,
+        pay_revision_implemented, dict(pay_revision_details) if pay_revision_details else None,
+    )
     
     return {
-        'heuristic_id': 'EMP-PAYREV-01',
-        'heuristic_name': 'Pay Revision Component Check',
-        'line_item': 'O&M Expenses',
-        
+        **_EMP_PAYREV_TEMPLATE,
+
         'claimed_value': employee_cost_actual,
         'allowable_value': employee_cost_normative,
         'variance_absolute': variance_abs,
         'variance_percentage': variance_pct,
-        
+
         'flag': flag,
-        'recommended_amount': None,  # Supporting heuristic
         'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation 14(3), Tariff Regulations 2021; APTEL Order 10.11.2014',
-        
+
         'calculation_steps': calc_steps,
-        
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-        
+
         'depends_on': ['OM-APPORT-01'],  # Needs employee component breakdown
-        
-        'is_primary': False,
-        'output_type': 'prudence_check'
+    }
+
+
+# =============================================================================
+# BATCH EVALUATION: many utilities / years / scenarios in one NumPy pass
+# =============================================================================
+
+def heuristic_OM_APPORT_01_batch(
+    total_om_approved,
+    actual_employee,
+    actual_ag,
+    actual_rm,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized OM-APPORT-01 over 1-D arrays (one element per utility / year).
+
+    Component columns are ordered Employee, A&G, R&M; same ±5% / ±15%
+    component thresholds as heuristic_OM_APPORT_01, and the overall flag
+    is the worst component flag. Returns a dict of arrays.
+    """
+    total, employee, ag, rm = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (total_om_approved, actual_employee, actual_ag, actual_rm))
+    )
+
+    actual = np.stack((employee, ag, rm), axis=-1)
+    normative = total[..., None] * np.asarray(_APPORT_RATIOS)
+    component_var_pct = safe_pct_array(actual - normative, normative)
+    band = np.searchsorted(_APPORT_THRESHOLDS, np.abs(component_var_pct), side='left')
+
+    total_actual = employee + ag + rm
+    total_var = total_actual - total
+
+    return {
+        'normative': normative,
+        'component_variance_percentage': component_var_pct,
+        'component_flag': np.take(_FLAGS, band),
+        'total_actual': total_actual,
+        'variance_absolute': total_var,
+        'variance_percentage': safe_pct_array(total_var, total),
+        'flag': np.take(_FLAGS, band.max(axis=-1)),
+    }
+
+
+# Numeric O&M inputs of run_om_pipeline, in unpacking order
+_OM_PIPELINE_COLUMNS = (
+    'cpi_old', 'cpi_new', 'wpi_old', 'wpi_new',
+    'base_year_om', 'inflation_2022_23', 'inflation_2023_24', 'claimed_existing',
+    'actual_employee', 'actual_ag', 'actual_rm',
+)
+
+
+def run_om_pipeline(inputs) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Vectorized OM-INFL-01 → OM-NORM-01 → OM-APPORT-01 → EMP-PAYREV-01 chain
+    over many utilities / years, threading each layer's output into the
+    next exactly as line_items does for a single utility.
+
+    Args:
+        inputs: dict or DataFrame of 1-D columns named as the O&M inputs
+            (see _OM_PIPELINE_COLUMNS), plus optional
+            new_stations_allowable (default 0), pay_revision (default
+            False) and pay_revision_order_ref (default '')
+
+    Returns:
+        Dict of arrays per heuristic, keyed by heuristic ID
+    """
+    (cpi_old, cpi_new, wpi_old, wpi_new,
+     base_year_om, inflation_2022_23, inflation_2023_24, claimed_existing,
+     actual_employee, actual_ag, actual_rm, new_stations_allowable) = np.broadcast_arrays(
+        *(np.asarray(inputs[name], dtype=float) for name in _OM_PIPELINE_COLUMNS),
+        np.asarray(inputs.get('new_stations_allowable', 0.0), dtype=float),
+    )
+
+    # Layer 1: OM-INFL-01 (70% CPI + 30% WPI)
+    cpi_increase = ((cpi_new - cpi_old) / cpi_old) * 100
+    wpi_increase = ((wpi_new - wpi_old) / wpi_old) * 100
+    weighted_inflation = (cpi_increase * 0.70) + (wpi_increase * 0.30)
+
+    # Layer 2: OM-NORM-01 (the OM-INFL-01 output is the 2024-25 inflation)
+    om_2022_23, om_2023_24, om_2024_25, total_allowable = _om_norm_core(
+        base_year_om, inflation_2022_23, inflation_2023_24, weighted_inflation,
+        new_stations_allowable
+    )
+    norm_var = claimed_existing - om_2024_25
+    norm_var_pct = safe_pct_array(norm_var, om_2024_25)
+    norm_band = np.searchsorted(_OM_NORM_THRESHOLDS, np.abs(norm_var_pct), side='left')
+
+    # Layer 3: OM-APPORT-01 (the OM-NORM-01 recommended amount is the approved total)
+    apport = heuristic_OM_APPORT_01_batch(total_allowable, actual_employee, actual_ag, actual_rm)
+
+    # Layer 4: EMP-PAYREV-01 against the normative employee component
+    normative_employee = apport['normative'][..., 0]
+    payrev_var = actual_employee - normative_employee
+    payrev_var_pct = safe_pct_array(payrev_var, normative_employee)
+    pay_revision = np.asarray(inputs.get('pay_revision', False), dtype=bool)
+    order_cited = np.char.str_len(np.asarray(inputs.get('pay_revision_order_ref', ''), dtype=str)) > 0
+    # Pay revision on record: YELLOW if the government order is cited, else RED
+    payrev_band = np.where(
+        pay_revision,
+        np.where(order_cited, 1, 2),
+        np.searchsorted(_EMP_PAYREV_THRESHOLDS, np.abs(payrev_var_pct), side='left'),
+    )
+
+    return {
+        'OM-INFL-01': {
+            'cpi_increase': cpi_increase,
+            'wpi_increase': wpi_increase,
+            'output_value': weighted_inflation,
+        },
+        'OM-NORM-01': {
+            'om_2022_23': om_2022_23,
+            'om_2023_24': om_2023_24,
+            'om_2024_25': om_2024_25,
+            'recommended_amount': total_allowable,
+            'variance_absolute': norm_var,
+            'variance_percentage': norm_var_pct,
+            'flag': np.take(_FLAGS, norm_band),
+        },
+        'OM-APPORT-01': apport,
+        'EMP-PAYREV-01': {
+            'allowable_value': normative_employee,
+            'variance_absolute': payrev_var,
+            'variance_percentage': payrev_var_pct,
+            'flag': np.take(_FLAGS, payrev_band),
+        },
     }
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Result Cache
+============
+Memoization for pure heuristic functions whose results are later edited
+in place by the staff review flow (staff_review_status, reviewed_by, ...).
+
+A plain lru_cache would hand every caller the same dict, so one
+reviewer's edits would show up in the next result. cached_result keeps
+the computed dict in an lru_cache and returns a fresh copy of its
+containers on every call; LazySteps and other immutable values are
+shared, so calculation steps are still rendered at most once.
+
+Usage:
+    @cached_result(maxsize=512)
+    def heuristic_ROE_01(equity: float = ..., rate: float = ...) -> Dict:
+        ...
+
+    heuristic_ROE_01.cache_info()   # hits / misses
+    heuristic_ROE_01.cache_clear()
+"""
+
+from functools import lru_cache, wraps
+from typing import Any, Callable
+
+
+def fresh_copy(value: Any) -> Any:
+    """Copy dicts and lists recursively; return anything else as is."""
+    if isinstance(value, dict):
+        return {k: fresh_copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [fresh_copy(v) for v in value]
+    return value
+
+
+def cached_result(maxsize: int = 512) -> Callable:
+    """
+    Decorator: lru_cache a heuristic on its arguments, returning a fresh
+    copy of the cached result dict on every call.
+
+    Calls with unhashable arguments (lists, dicts) bypass the cache.
+    """
+    def decorator(fn: Callable) -> Callable:
+        # typed: 100 and 100.0 are distinct keys, so callers get back
+        # the numeric types (and rendered steps) they passed in
+        cached_fn = lru_cache(maxsize=maxsize, typed=True)(fn)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                hash((args, tuple(kwargs.values())))
+            except TypeError:
+                # Unhashable argument: compute directly, nothing is cached
+                return fn(*args, **kwargs)
+            return fresh_copy(cached_fn(*args, **kwargs))
+
+        wrapper.cache_info = cached_fn.cache_info
+        wrapper.cache_clear = cached_fn.cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,122 @@
+"""
+Shared Result Fields
+====================
+Constant fields of the standardized heuristic result dict, shared by
+all heuristic modules so each call only builds its computed fields.
+
+Usage:
+    _ROE_TEMPLATE = {
+        'heuristic_id': 'ROE-01',
+        ...
+        **STAFF_REVIEW_DEFAULTS,
+    }
+
+    def heuristic_ROE_01(...) -> HeuristicResult:
+        return {**_ROE_TEMPLATE, 'claimed_value': claimed_roe, ...}
+"""
+
+import time
+from bisect import bisect_left
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import List, Optional, Tuple, TypedDict
+
+
+# Staff Review Section: every heuristic returns these until a reviewer
+# accepts or overrides the result in the app. Read-only so a template
+# can never leak one reviewer's edits into another result.
+STAFF_REVIEW_DEFAULTS = MappingProxyType({
+    'staff_override_flag': None,
+    'staff_approved_amount': None,
+    'staff_justification': '',
+    'staff_review_status': 'Pending',
+    'reviewed_by': None,
+    'reviewed_at': None,
+})
+
+
+# (epoch second, formatted reviewed_at) of the last staff-review stamp.
+# Replaced as a whole tuple, so concurrent readers never see a torn pair.
+_review_ts = (None, "")
+
+
+def now_str() -> str:
+    """Current time as "%Y-%m-%d %H:%M:%S", formatted at most once per second."""
+    global _review_ts
+    second = int(time.time())
+    if _review_ts[0] != second:
+        _review_ts = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _review_ts[1]
+
+
+def apply_staff_review(
+    allowable: float, staff_amount: Optional[float], staff_name: Optional[str], tolerance: float = 0.01,
+) -> Tuple:
+    """
+    Staff review fields for a heuristic that takes the reviewer's amount.
+
+    Returns (staff_review_status, staff_override_flag, reviewed_by,
+    reviewed_at, final_approved_amount); a staff amount within tolerance
+    (₹ Cr) of the allowable value counts as Accepted.
+    """
+    if staff_amount is None:
+        return ("Pending", None, None, None, allowable)
+    matched = abs(staff_amount - allowable) < tolerance
+    return (
+        "Accepted" if matched else "Overridden",
+        None if matched else "STAFF_OVERRIDE",
+        staff_name or None,
+        now_str(),
+        staff_amount,
+    )
+
+
+def flag_band(thresholds, value: float) -> int:
+    """
+    bisect_left(thresholds, value): the band index into a module's _FLAGS
+    table. NaN falls in the last band (RED), as it does under the batch
+    variants' np.searchsorted and a failed `x <= t` comparison chain.
+    """
+    if value != value:
+        return len(thresholds)
+    return bisect_left(thresholds, value)
+
+
+class HeuristicResult(TypedDict, total=False):
+    """Shape of the standardized heuristic result dict (for annotations)."""
+
+    # Identification
+    heuristic_id: str
+    heuristic_name: str
+    line_item: str
+    regulatory_basis: str
+
+    # Calculation Results
+    claimed_value: Optional[float]
+    allowable_value: Optional[float]
+    variance_absolute: Optional[float]
+    variance_percentage: Optional[float]
+
+    # Tool's Assessment
+    flag: str
+    recommended_amount: Optional[float]
+    recommendation_text: str
+
+    # Calculation Details (list of str or LazySteps)
+    calculation_steps: Sequence[str]
+
+    # Staff Review Section (see STAFF_REVIEW_DEFAULTS)
+    staff_override_flag: Optional[str]
+    staff_approved_amount: Optional[float]
+    staff_justification: str
+    staff_review_status: str
+    reviewed_by: Optional[str]
+    reviewed_at: Optional[str]
+
+    # Dependencies and metadata
+    depends_on: List[str]
+    is_primary: bool
+    output_type: str
+    output_value: float
+    note: str
+
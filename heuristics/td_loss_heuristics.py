@@ -14,12 +14,88 @@ OUTPUT SCHEMA: Standardized dict (same as all SBU-G heuristics).
 
 from typing import Dict, Optional, List
 from datetime import datetime
+from functools import partial
+from types import MappingProxyType
+
+import numpy as np
+
+from heuristics.batch_math import safe_pct_array
+from heuristics.lazy_steps import LazySteps
+from heuristics.result_fields import STAFF_REVIEW_DEFAULTS, flag_band
+
+
+# Loss-variance flag bands (percentage points over target):
+#   variance <= 0 → GREEN, <= 0.5 → YELLOW, else RED
+# flag_band(_TD_THRESHOLDS, variance_pp) gives the index into _TD_FLAGS
+# and into each heuristic's recommendation templates.
+_TD_THRESHOLDS = (0.0, 0.5)
+_TD_FLAGS = ('GREEN', 'YELLOW', 'RED')
 
 
 # =============================================================================
 # HEURISTIC 1: TRANS-LOSS-01 - Transmission Loss Assessment
 # =============================================================================
 
+# Constant result fields; each call merges in only the computed ones.
+_TRANS_LOSS_TEMPLATE = {
+    # Identification
+    'heuristic_id': 'TRANS-LOSS-01',
+    'heuristic_name': 'Transmission Loss Assessment',
+    'line_item': 'T&D Losses (Transmission)',
+    'regulatory_basis': 'Chapter 4, Truing-Up Order; Load flow methodology per CEA/FOR',
+
+    # Metadata
+    'is_primary': False,  # Informational - feeds into TD-LOSS-COMBINED-01
+    'output_type': 'assessment',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_TRANS_LOSS_RECS = (
+    "Transmission loss {actual:.2f}% is within/below approved {target:.2f}%. "
+    "Loss of {loss_mu:.2f} MU on input of {input_mu:.2f} MU.",
+    "Transmission loss {actual:.2f}% marginally exceeds approved {target:.2f}% "
+    "by {variance:.2f}pp. Review load flow study methodology.",
+    "Transmission loss {actual:.2f}% significantly exceeds approved {target:.2f}% "
+    "by {variance:.2f}pp. Investigate causes.",
+)
+
+
+def _render_trans_loss_steps(
+    methodology, peak_demand_mw, total_energy_input, transmission_loss_mu,
+    actual_trans_loss_pct, myt_approved_trans_loss_pct, variance_pp,
+    loss_400kv_mu, loss_220kv_mu, loss_110kv_mu, loss_66kv_mu, flag,
+) -> List[str]:
+    """Render TRANS-LOSS-01 calculation steps."""
+    calc_steps = [
+        "═══ TRANSMISSION LOSS ASSESSMENT ═══",
+        "",
+        f"Methodology: {methodology}",
+        f"Peak Demand: {peak_demand_mw:.0f} MW",
+        "",
+        "Calculation:",
+        f"  Total Energy Input: {total_energy_input:,.2f} MU",
+        f"  Transmission Loss: {transmission_loss_mu:,.2f} MU",
+        f"  Actual Loss %: {actual_trans_loss_pct:.2f}%",
+        f"  MYT Approved: {myt_approved_trans_loss_pct:.2f}%",
+        f"  Variance: {variance_pp:+.2f} percentage points",
+    ]
+
+    # Voltage-level breakdown if available
+    if any([loss_400kv_mu, loss_220kv_mu, loss_110kv_mu, loss_66kv_mu]):
+        calc_steps.extend([
+            "",
+            "Voltage-Level Breakdown:",
+            f"  400kV: {loss_400kv_mu:.2f} MU",
+            f"  220kV: {loss_220kv_mu:.2f} MU",
+            f"  110kV: {loss_110kv_mu:.2f} MU",
+            f"  66kV:  {loss_66kv_mu:.2f} MU",
+        ])
+
+    calc_steps.extend(["", f"Flag: {flag}"])
+    return calc_steps
+
+
 def heuristic_TRANS_LOSS_01(
     total_energy_input: float = 0.0,        # Total energy input to transmission system (MU)
     transmission_loss_mu: float = 0.0,      # Actual transmission loss (MU)
@@ -44,17 +120,6 @@ def heuristic_TRANS_LOSS_01(
         Standardized heuristic result dict
     """
 
-    calc_steps = [
-        "═══ TRANSMISSION LOSS ASSESSMENT ═══",
-        "",
-        f"Methodology: {methodology}",
-        f"Peak Demand: {peak_demand_mw:.0f} MW",
-        "",
-        "Calculation:",
-        f"  Total Energy Input: {total_energy_input:,.2f} MU",
-        f"  Transmission Loss: {transmission_loss_mu:,.2f} MU",
-    ]
-
     # Compute actual transmission loss %
     if total_energy_input > 0:
         actual_trans_loss_pct = (transmission_loss_mu / total_energy_input) * 100
@@ -63,92 +128,51 @@ def heuristic_TRANS_LOSS_01(
 
     variance_pp = actual_trans_loss_pct - myt_approved_trans_loss_pct
 
-    calc_steps.extend([
-        f"  Actual Loss %: {actual_trans_loss_pct:.2f}%",
-        f"  MYT Approved: {myt_approved_trans_loss_pct:.2f}%",
-        f"  Variance: {variance_pp:+.2f} percentage points",
-    ])
-
-    # Voltage-level breakdown if available
-    if any([loss_400kv_mu, loss_220kv_mu, loss_110kv_mu, loss_66kv_mu]):
-        calc_steps.extend([
-            "",
-            "Voltage-Level Breakdown:",
-            f"  400kV: {loss_400kv_mu:.2f} MU",
-            f"  220kV: {loss_220kv_mu:.2f} MU",
-            f"  110kV: {loss_110kv_mu:.2f} MU",
-            f"  66kV:  {loss_66kv_mu:.2f} MU",
-        ])
-
     # Flag determination
-    if variance_pp <= 0:
-        flag = 'GREEN'
-        recommendation = (
-            f"Transmission loss {actual_trans_loss_pct:.2f}% is within/below "
-            f"approved {myt_approved_trans_loss_pct:.2f}%. "
-            f"Loss of {transmission_loss_mu:.2f} MU on input of "
-            f"{total_energy_input:.2f} MU."
-        )
-    elif variance_pp <= 0.5:
-        flag = 'YELLOW'
-        recommendation = (
-            f"Transmission loss {actual_trans_loss_pct:.2f}% marginally exceeds "
-            f"approved {myt_approved_trans_loss_pct:.2f}% by {variance_pp:.2f}pp. "
-            f"Review load flow study methodology."
-        )
-    else:
-        flag = 'RED'
-        recommendation = (
-            f"Transmission loss {actual_trans_loss_pct:.2f}% significantly exceeds "
-            f"approved {myt_approved_trans_loss_pct:.2f}% by {variance_pp:.2f}pp. "
-            f"Investigate causes."
-        )
-
-    calc_steps.extend(["", f"Flag: {flag}"])
+    band = flag_band(_TD_THRESHOLDS, variance_pp)
+    flag = _TD_FLAGS[band]
+    recommendation = _TRANS_LOSS_RECS[band].format(
+        actual=actual_trans_loss_pct, target=myt_approved_trans_loss_pct,
+        variance=variance_pp, loss_mu=transmission_loss_mu, input_mu=total_energy_input,
+    )
+
+    calc_steps = LazySteps(
+        _render_trans_loss_steps,
+        methodology, peak_demand_mw, total_energy_input, transmission_loss_mu,
+        actual_trans_loss_pct, myt_approved_trans_loss_pct, variance_pp,
+        loss_400kv_mu, loss_220kv_mu, loss_110kv_mu, loss_66kv_mu, flag,
+    )
+
+    r_actual_pct = round(actual_trans_loss_pct, 2)
+    r_variance_pp = round(variance_pp, 2)
 
     return {
-        # Identification
-        'heuristic_id': 'TRANS-LOSS-01',
-        'heuristic_name': 'Transmission Loss Assessment',
-        'line_item': 'T&D Losses (Transmission)',
+        **_TRANS_LOSS_TEMPLATE,
 
         # Calculation Results
-        'claimed_value': round(actual_trans_loss_pct, 2),  # Actual loss % as "claimed"
-        'allowable_value': myt_approved_trans_loss_pct,     # Target as "allowable"
-        'variance_absolute': round(variance_pp, 2),
+        'claimed_value': r_actual_pct,  # Actual loss % as "claimed"
+        'allowable_value': myt_approved_trans_loss_pct,  # Target as "allowable"
+        'variance_absolute': r_variance_pp,
         'variance_percentage': None,  # Not applicable for % vs % comparison
 
         # Tool's Assessment
         'flag': flag,
         'recommended_amount': None,  # Not an amount-based heuristic
         'recommendation_text': recommendation,
-        'regulatory_basis': 'Chapter 4, Truing-Up Order; Load flow methodology per CEA/FOR',
 
         # Calculation Details
         'calculation_steps': calc_steps,
 
-        # Staff Review Section
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-
         # Dependencies
         'depends_on': [],  # Independent
 
-        # Metadata
-        'is_primary': False,  # Informational - feeds into TD-LOSS-COMBINED-01
-        'output_type': 'assessment',
-
         # Additional context
         'loss_details': {
             'total_energy_input_mu': total_energy_input,
             'transmission_loss_mu': transmission_loss_mu,
-            'actual_loss_pct': round(actual_trans_loss_pct, 2),
+            'actual_loss_pct': r_actual_pct,
             'target_loss_pct': myt_approved_trans_loss_pct,
-            'variance_pp': round(variance_pp, 2),
+            'variance_pp': r_variance_pp,
             'peak_demand_mw': peak_demand_mw,
             'methodology': methodology,
             'loss_400kv_mu': loss_400kv_mu,
@@ -163,6 +187,56 @@ def heuristic_TRANS_LOSS_01(
 # HEURISTIC 2: DIST-LOSS-01 - Distribution Loss Assessment
 # =============================================================================
 
+_DIST_LOSS_TEMPLATE = {
+    # Identification
+    'heuristic_id': 'DIST-LOSS-01',
+    'heuristic_name': 'Distribution Loss Assessment',
+    'line_item': 'T&D Losses (Distribution)',
+    'regulatory_basis': 'Regulation on T&D Loss targets, Tariff Regulations 2021',
+
+    # Metadata
+    'is_primary': False,
+    'output_type': 'assessment',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_DIST_LOSS_RECS = (
+    "Distribution loss {actual:.2f}% is within/below approved {target:.2f}%.",
+    "Distribution loss {actual:.2f}% marginally exceeds target by {variance:.2f}pp.",
+    "Distribution loss {actual:.2f}% exceeds target {target:.2f}% by {variance:.2f}pp.",
+)
+
+
+def _render_dist_loss_steps(
+    energy_input_to_dist_mu, energy_sold_mu, distribution_loss_mu,
+    actual_dist_loss_pct, myt_approved_dist_loss_pct, variance_pp,
+    ht_loss_mu, lt_loss_mu, flag,
+) -> List[str]:
+    """Render DIST-LOSS-01 calculation steps."""
+    calc_steps = [
+        "═══ DISTRIBUTION LOSS ASSESSMENT ═══",
+        "",
+        f"Energy Input to Distribution: {energy_input_to_dist_mu:,.2f} MU",
+        f"Energy Sold: {energy_sold_mu:,.2f} MU",
+        f"Distribution Loss: {distribution_loss_mu:,.2f} MU",
+        f"  Actual Loss %: {actual_dist_loss_pct:.2f}%",
+        f"  MYT Approved: {myt_approved_dist_loss_pct:.2f}%",
+        f"  Variance: {variance_pp:+.2f} percentage points",
+    ]
+
+    if ht_loss_mu > 0 or lt_loss_mu > 0:
+        calc_steps.extend([
+            "",
+            "Network Breakdown:",
+            f"  HT Loss: {ht_loss_mu:.2f} MU",
+            f"  LT Loss: {lt_loss_mu:.2f} MU",
+        ])
+
+    calc_steps.extend(["", f"Flag: {flag}"])
+    return calc_steps
+
+
 def heuristic_DIST_LOSS_01(
     energy_input_to_dist_mu: float = 0.0,
     energy_sold_mu: float = 0.0,
@@ -181,14 +255,6 @@ def heuristic_DIST_LOSS_01(
         Standardized heuristic result dict
     """
 
-    calc_steps = [
-        "═══ DISTRIBUTION LOSS ASSESSMENT ═══",
-        "",
-        f"Energy Input to Distribution: {energy_input_to_dist_mu:,.2f} MU",
-        f"Energy Sold: {energy_sold_mu:,.2f} MU",
-        f"Distribution Loss: {distribution_loss_mu:,.2f} MU",
-    ]
-
     if energy_input_to_dist_mu > 0:
         actual_dist_loss_pct = (distribution_loss_mu / energy_input_to_dist_mu) * 100
     else:
@@ -196,86 +262,51 @@ def heuristic_DIST_LOSS_01(
 
     variance_pp = actual_dist_loss_pct - myt_approved_dist_loss_pct
 
-    calc_steps.extend([
-        f"  Actual Loss %: {actual_dist_loss_pct:.2f}%",
-        f"  MYT Approved: {myt_approved_dist_loss_pct:.2f}%",
-        f"  Variance: {variance_pp:+.2f} percentage points",
-    ])
-
-    if ht_loss_mu > 0 or lt_loss_mu > 0:
-        calc_steps.extend([
-            "",
-            "Network Breakdown:",
-            f"  HT Loss: {ht_loss_mu:.2f} MU",
-            f"  LT Loss: {lt_loss_mu:.2f} MU",
-        ])
-
     # Flag determination
-    if variance_pp <= 0:
-        flag = 'GREEN'
-        recommendation = (
-            f"Distribution loss {actual_dist_loss_pct:.2f}% is within/below "
-            f"approved {myt_approved_dist_loss_pct:.2f}%."
-        )
-    elif variance_pp <= 0.5:
-        flag = 'YELLOW'
-        recommendation = (
-            f"Distribution loss {actual_dist_loss_pct:.2f}% marginally exceeds "
-            f"target by {variance_pp:.2f}pp."
-        )
-    else:
-        flag = 'RED'
-        recommendation = (
-            f"Distribution loss {actual_dist_loss_pct:.2f}% exceeds "
-            f"target {myt_approved_dist_loss_pct:.2f}% by {variance_pp:.2f}pp."
-        )
-
-    calc_steps.extend(["", f"Flag: {flag}"])
+    band = flag_band(_TD_THRESHOLDS, variance_pp)
+    flag = _TD_FLAGS[band]
+    recommendation = _DIST_LOSS_RECS[band].format(
+        actual=actual_dist_loss_pct, target=myt_approved_dist_loss_pct, variance=variance_pp,
+    )
+
+    calc_steps = LazySteps(
+        _render_dist_loss_steps,
+        energy_input_to_dist_mu, energy_sold_mu, distribution_loss_mu,
+        actual_dist_loss_pct, myt_approved_dist_loss_pct, variance_pp,
+        ht_loss_mu, lt_loss_mu, flag,
+    )
+
+    r_actual_pct = round(actual_dist_loss_pct, 2)
+    r_variance_pp = round(variance_pp, 2)
 
     return {
-        # Identification
-        'heuristic_id': 'DIST-LOSS-01',
-        'heuristic_name': 'Distribution Loss Assessment',
-        'line_item': 'T&D Losses (Distribution)',
+        **_DIST_LOSS_TEMPLATE,
 
         # Calculation Results
-        'claimed_value': round(actual_dist_loss_pct, 2),
+        'claimed_value': r_actual_pct,
         'allowable_value': myt_approved_dist_loss_pct,
-        'variance_absolute': round(variance_pp, 2),
+        'variance_absolute': r_variance_pp,
         'variance_percentage': None,
 
         # Tool's Assessment
         'flag': flag,
         'recommended_amount': None,
         'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation on T&D Loss targets, Tariff Regulations 2021',
 
         # Calculation Details
         'calculation_steps': calc_steps,
 
-        # Staff Review Section
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-
         # Dependencies
         'depends_on': [],
 
-        # Metadata
-        'is_primary': False,
-        'output_type': 'assessment',
-
         # Additional context
         'loss_details': {
             'energy_input_to_dist_mu': energy_input_to_dist_mu,
             'energy_sold_mu': energy_sold_mu,
             'distribution_loss_mu': distribution_loss_mu,
-            'actual_loss_pct': round(actual_dist_loss_pct, 2),
+            'actual_loss_pct': r_actual_pct,
             'target_loss_pct': myt_approved_dist_loss_pct,
-            'variance_pp': round(variance_pp, 2),
+            'variance_pp': r_variance_pp,
             'ht_loss_mu': ht_loss_mu,
             'lt_loss_mu': lt_loss_mu,
         }
@@ -286,6 +317,73 @@ def heuristic_DIST_LOSS_01(
 # HEURISTIC 3: TD-LOSS-COMBINED-01 - Combined T&D Loss
 # =============================================================================
 
+_TD_COMBINED_TEMPLATE = {
+    # Identification
+    'heuristic_id': 'TD-LOSS-COMBINED-01',
+    'heuristic_name': 'Combined T&D Loss Assessment',
+    'line_item': 'T&D Losses (Combined)',
+    'regulatory_basis': 'Regulation on T&D Loss targets, Tariff Regulations 2021',
+
+    # Metadata
+    'is_primary': True,  # Primary combined assessment
+    'output_type': 'assessment',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+_TD_COMBINED_RECS = (
+    "Combined T&D loss {actual:.2f}% is at or below approved target of {target:.2f}%. "
+    "KSEB Ltd may be eligible for loss reduction reward.",
+    "Combined T&D loss {actual:.2f}% marginally exceeds target {target:.2f}% "
+    "by {variance:.2f}pp.",
+    "Combined T&D loss {actual:.2f}% exceeds target by {variance:.2f}pp. "
+    "Penalty provisions may apply.",
+)
+
+
+# Whole step block as one format string: one .format() call per render
+# instead of a dozen f-strings, split into lines for the list interface.
+_TD_COMBINED_STEPS_TEMPLATE = "\n".join((
+    "═══ COMBINED T&D LOSS ASSESSMENT ═══",
+    "",
+    "Total Energy Input: {input_mu:,.2f} MU",
+    "Total Energy Sold: {sold_mu:,.2f} MU",
+    "Total Loss: {loss_mu:,.2f} MU",
+    "  (Transmission: {trans_mu:.2f} MU + Distribution: {dist_mu:.2f} MU)",
+    "",
+    "Combined T&D Loss: {actual:.2f}%",
+    "MYT Approved Target: {target:.2f}%",
+    "Variance: {variance:+.2f} percentage points",
+    "",
+    "Flag: {flag}",
+))
+
+
+def _td_loss_pct_from_input(total_energy_input_mu, total_energy_sold_mu):
+    """
+    Combined T&D loss % for rows with positive energy input.
+
+    Branch-free and array-safe; callers choose between this and the
+    pre-computed loss % before calling, so the common path never tests
+    for zero input.
+    """
+    return (total_energy_input_mu - total_energy_sold_mu) / total_energy_input_mu * 100
+
+
+def _render_td_combined_steps(
+    total_energy_input_mu, total_energy_sold_mu, total_loss_mu,
+    transmission_loss_mu, distribution_loss_mu, computed_td_loss_pct,
+    myt_approved_td_loss_pct, variance_pp, flag,
+) -> List[str]:
+    """Render TD-LOSS-COMBINED-01 calculation steps."""
+    return _TD_COMBINED_STEPS_TEMPLATE.format(
+        input_mu=total_energy_input_mu, sold_mu=total_energy_sold_mu,
+        loss_mu=total_loss_mu, trans_mu=transmission_loss_mu,
+        dist_mu=distribution_loss_mu, actual=computed_td_loss_pct,
+        target=myt_approved_td_loss_pct, variance=variance_pp, flag=flag,
+    ).split("\n")
+
+
 def heuristic_TD_LOSS_COMBINED_01(
     total_energy_input_mu: float = 0.0,
     total_energy_sold_mu: float = 0.0,
@@ -307,85 +405,49 @@ def heuristic_TD_LOSS_COMBINED_01(
     total_loss_mu = transmission_loss_mu + distribution_loss_mu
 
     if total_energy_input_mu > 0:
-        computed_td_loss_pct = ((total_energy_input_mu - total_energy_sold_mu)
-                                / total_energy_input_mu * 100)
+        computed_td_loss_pct = _td_loss_pct_from_input(total_energy_input_mu, total_energy_sold_mu)
     else:
         computed_td_loss_pct = actual_td_loss_pct
 
     variance_pp = computed_td_loss_pct - myt_approved_td_loss_pct
 
-    calc_steps = [
-        "═══ COMBINED T&D LOSS ASSESSMENT ═══",
-        "",
-        f"Total Energy Input: {total_energy_input_mu:,.2f} MU",
-        f"Total Energy Sold: {total_energy_sold_mu:,.2f} MU",
-        f"Total Loss: {total_loss_mu:,.2f} MU",
-        f"  (Transmission: {transmission_loss_mu:.2f} MU + Distribution: {distribution_loss_mu:.2f} MU)",
-        "",
-        f"Combined T&D Loss: {computed_td_loss_pct:.2f}%",
-        f"MYT Approved Target: {myt_approved_td_loss_pct:.2f}%",
-        f"Variance: {variance_pp:+.2f} percentage points",
-    ]
-
     # Flag determination
-    if variance_pp <= 0:
-        flag = 'GREEN'
-        recommendation = (
-            f"Combined T&D loss {computed_td_loss_pct:.2f}% is at or below "
-            f"approved target of {myt_approved_td_loss_pct:.2f}%. "
-            f"KSEB Ltd may be eligible for loss reduction reward."
-        )
-    elif variance_pp <= 0.5:
-        flag = 'YELLOW'
-        recommendation = (
-            f"Combined T&D loss {computed_td_loss_pct:.2f}% marginally exceeds "
-            f"target {myt_approved_td_loss_pct:.2f}% by {variance_pp:.2f}pp."
-        )
-    else:
-        flag = 'RED'
-        recommendation = (
-            f"Combined T&D loss {computed_td_loss_pct:.2f}% exceeds "
-            f"target by {variance_pp:.2f}pp. Penalty provisions may apply."
-        )
-
-    calc_steps.extend(["", f"Flag: {flag}"])
+    band = flag_band(_TD_THRESHOLDS, variance_pp)
+    flag = _TD_FLAGS[band]
+    recommendation = _TD_COMBINED_RECS[band].format(
+        actual=computed_td_loss_pct, target=myt_approved_td_loss_pct, variance=variance_pp,
+    )
+
+    calc_steps = LazySteps(
+        _render_td_combined_steps,
+        total_energy_input_mu, total_energy_sold_mu, total_loss_mu,
+        transmission_loss_mu, distribution_loss_mu, computed_td_loss_pct,
+        myt_approved_td_loss_pct, variance_pp, flag,
+    )
+
+    r_computed_pct = round(computed_td_loss_pct, 2)
+    r_variance_pp = round(variance_pp, 2)
 
     return {
-        # Identification
-        'heuristic_id': 'TD-LOSS-COMBINED-01',
-        'heuristic_name': 'Combined T&D Loss Assessment',
-        'line_item': 'T&D Losses (Combined)',
+        **_TD_COMBINED_TEMPLATE,
 
         # Calculation Results
-        'claimed_value': round(computed_td_loss_pct, 2),
+        'claimed_value': r_computed_pct,
         'allowable_value': myt_approved_td_loss_pct,
-        'variance_absolute': round(variance_pp, 2),
+        'variance_absolute': r_variance_pp,
         'variance_percentage': None,
 
         # Tool's Assessment
         'flag': flag,
         'recommended_amount': None,
         'recommendation_text': recommendation,
-        'regulatory_basis': 'Regulation on T&D Loss targets, Tariff Regulations 2021',
 
         # Calculation Details
         'calculation_steps': calc_steps,
 
-        # Staff Review Section
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-
         # Dependencies
         'depends_on': ['TRANS-LOSS-01', 'DIST-LOSS-01'],
 
-        # Metadata
-        'is_primary': True,  # Primary combined assessment
-        'output_type': 'assessment',
-
         # Additional context
         'loss_details': {
             'total_energy_input_mu': total_energy_input_mu,
@@ -393,9 +455,9 @@ def heuristic_TD_LOSS_COMBINED_01(
             'transmission_loss_mu': transmission_loss_mu,
             'distribution_loss_mu': distribution_loss_mu,
             'total_loss_mu': round(total_loss_mu, 2),
-            'computed_td_loss_pct': round(computed_td_loss_pct, 2),
+            'computed_td_loss_pct': r_computed_pct,
             'target_td_loss_pct': myt_approved_td_loss_pct,
-            'variance_pp': round(variance_pp, 2),
+            'variance_pp': r_variance_pp,
         }
     }
 
@@ -404,6 +466,75 @@ def heuristic_TD_LOSS_COMBINED_01(
 # HEURISTIC 4: TD-REWARD-01 - T&D Loss Reduction Reward/Penalty
 # =============================================================================
 
+_TD_REWARD_TEMPLATE = {
+    # Identification
+    'heuristic_id': 'TD-REWARD-01',
+    'heuristic_name': 'T&D Loss Reduction Reward/Penalty',
+    'line_item': 'T&D Loss Reward',
+    'regulatory_basis': 'T&D Loss reduction incentive provisions, Tariff Regulations 2021',
+
+    # Metadata
+    'is_primary': True,
+    'output_type': 'approved_amount',
+    'note': 'Reward only if actual loss < target loss',
+
+    **STAFF_REVIEW_DEFAULTS,
+}
+
+
+def _render_td_reward_steps(
+    approved_td_loss_pct, actual_td_loss_pct, loss_reduction_pp,
+    total_energy_input_mu, avg_power_purchase_cost_per_unit,
+    utility_share_pct, consumer_share_pct,
+    energy_delta_mu, monetary_delta_cr, utility_share_cr,
+    claimed_reward, allowable_reward, flag,
+) -> List[str]:
+    """
+    Render TD-REWARD-01 calculation steps.
+
+    energy_delta_mu / monetary_delta_cr are the energy saved and total
+    savings in the reward zone, or energy wasted and monetary impact in
+    the penalty zone.
+    """
+    calc_steps = [
+        "═══ T&D LOSS REDUCTION REWARD/PENALTY ═══",
+        "",
+        f"Approved T&D Loss: {approved_td_loss_pct:.2f}%",
+        f"Actual T&D Loss: {actual_td_loss_pct:.2f}%",
+        f"Loss Reduction: {loss_reduction_pp:+.2f} percentage points",
+        f"Energy Input: {total_energy_input_mu:,.2f} MU",
+        f"Avg Power Purchase Cost: ₹{avg_power_purchase_cost_per_unit:.2f}/unit",
+        f"Sharing Ratio: Utility {utility_share_pct:.0f}% : Consumer {consumer_share_pct:.0f}%",
+        "",
+    ]
+
+    if loss_reduction_pp > 0:
+        calc_steps.extend([
+            "✓ REWARD CALCULATION:",
+            f"  Energy Saved: ({loss_reduction_pp:.2f}/100) × {total_energy_input_mu:,.2f} = {energy_delta_mu:,.2f} MU",
+            f"  Total Savings: {energy_delta_mu:,.2f} × ₹{avg_power_purchase_cost_per_unit:.2f} / 100 = ₹{monetary_delta_cr:.2f} Cr",
+            f"  Utility Share ({utility_share_pct:.0f}%): ₹{utility_share_cr:.2f} Cr",
+            f"  Consumer Share ({consumer_share_pct:.0f}%): ₹{monetary_delta_cr - utility_share_cr:.2f} Cr",
+        ])
+    elif loss_reduction_pp == 0:
+        calc_steps.append("Result: T&D loss exactly at target. No reward or penalty.")
+    else:
+        calc_steps.extend([
+            "✗ PENALTY ZONE:",
+            f"  Excess Loss: {abs(loss_reduction_pp):.2f}pp above target",
+            f"  Energy Wasted: {energy_delta_mu:,.2f} MU",
+            f"  Monetary Impact: ₹{monetary_delta_cr:.2f} Cr",
+        ])
+
+    calc_steps.extend([
+        "",
+        f"Claimed Reward: ₹{claimed_reward:.2f} Cr",
+        f"Allowable Reward: ₹{allowable_reward:.2f} Cr",
+        f"Flag: {flag}",
+    ])
+    return calc_steps
+
+
 def heuristic_TD_REWARD_01(
     approved_td_loss_pct: float = 0.0,
     actual_td_loss_pct: float = 0.0,
@@ -431,18 +562,6 @@ def heuristic_TD_REWARD_01(
 
     loss_reduction_pp = approved_td_loss_pct - actual_td_loss_pct
 
-    calc_steps = [
-        "═══ T&D LOSS REDUCTION REWARD/PENALTY ═══",
-        "",
-        f"Approved T&D Loss: {approved_td_loss_pct:.2f}%",
-        f"Actual T&D Loss: {actual_td_loss_pct:.2f}%",
-        f"Loss Reduction: {loss_reduction_pp:+.2f} percentage points",
-        f"Energy Input: {total_energy_input_mu:,.2f} MU",
-        f"Avg Power Purchase Cost: ₹{avg_power_purchase_cost_per_unit:.2f}/unit",
-        f"Sharing Ratio: Utility {utility_share_pct:.0f}% : Consumer {consumer_share_pct:.0f}%",
-        "",
-    ]
-
     if loss_reduction_pp > 0:
         # Gain scenario - loss reduction achieved
         energy_saved_mu = (loss_reduction_pp / 100) * total_energy_input_mu
@@ -459,13 +578,7 @@ def heuristic_TD_REWARD_01(
             f"({utility_share_pct:.0f}% sharing)."
         )
 
-        calc_steps.extend([
-            "✓ REWARD CALCULATION:",
-            f"  Energy Saved: ({loss_reduction_pp:.2f}/100) × {total_energy_input_mu:,.2f} = {energy_saved_mu:,.2f} MU",
-            f"  Total Savings: {energy_saved_mu:,.2f} × ₹{avg_power_purchase_cost_per_unit:.2f} / 100 = ₹{monetary_gain_cr:.2f} Cr",
-            f"  Utility Share ({utility_share_pct:.0f}%): ₹{utility_share_cr:.2f} Cr",
-            f"  Consumer Share ({consumer_share_pct:.0f}%): ₹{monetary_gain_cr - utility_share_cr:.2f} Cr",
-        ])
+        energy_delta_mu, monetary_delta_cr = energy_saved_mu, monetary_gain_cr
 
     elif loss_reduction_pp == 0:
         energy_saved_mu = 0
@@ -476,7 +589,7 @@ def heuristic_TD_REWARD_01(
         flag = 'YELLOW'
         recommendation = f"T&D loss exactly at target. No reward or penalty."
 
-        calc_steps.append("Result: T&D loss exactly at target. No reward or penalty.")
+        energy_delta_mu, monetary_delta_cr = 0, 0
 
     else:
         # Penalty scenario - loss exceeds target
@@ -493,61 +606,43 @@ def heuristic_TD_REWARD_01(
             f"Potential penalty exposure: ₹{monetary_loss_cr:.2f} Cr."
         )
 
-        calc_steps.extend([
-            "✗ PENALTY ZONE:",
-            f"  Excess Loss: {excess_loss_pp:.2f}pp above target",
-            f"  Energy Wasted: {energy_wasted_mu:,.2f} MU",
-            f"  Monetary Impact: ₹{monetary_loss_cr:.2f} Cr",
-        ])
+        energy_delta_mu, monetary_delta_cr = energy_wasted_mu, monetary_loss_cr
 
     # Variance between claimed and allowable
     variance_abs = claimed_reward - allowable_reward if claimed_reward > 0 else 0
     variance_pct = (variance_abs / claimed_reward * 100) if claimed_reward > 0 else 0.0
 
-    calc_steps.extend([
-        "",
-        f"Claimed Reward: ₹{claimed_reward:.2f} Cr",
-        f"Allowable Reward: ₹{allowable_reward:.2f} Cr",
-        f"Flag: {flag}",
-    ])
+    calc_steps = LazySteps(
+        _render_td_reward_steps,
+        approved_td_loss_pct, actual_td_loss_pct, loss_reduction_pp,
+        total_energy_input_mu, avg_power_purchase_cost_per_unit,
+        utility_share_pct, consumer_share_pct,
+        energy_delta_mu, monetary_delta_cr, utility_share_cr,
+        claimed_reward, allowable_reward, flag,
+    )
+
+    r_allowable = round(allowable_reward, 2)
 
     return {
-        # Identification
-        'heuristic_id': 'TD-REWARD-01',
-        'heuristic_name': 'T&D Loss Reduction Reward/Penalty',
-        'line_item': 'T&D Loss Reward',
+        **_TD_REWARD_TEMPLATE,
 
         # Calculation Results
         'claimed_value': claimed_reward,
-        'allowable_value': round(allowable_reward, 2),
+        'allowable_value': r_allowable,
         'variance_absolute': round(variance_abs, 2),
         'variance_percentage': round(variance_pct, 2) if variance_pct else None,
 
         # Tool's Assessment
         'flag': flag,
-        'recommended_amount': round(allowable_reward, 2),
+        'recommended_amount': r_allowable,
         'recommendation_text': recommendation,
-        'regulatory_basis': 'T&D Loss reduction incentive provisions, Tariff Regulations 2021',
 
         # Calculation Details
         'calculation_steps': calc_steps,
 
-        # Staff Review Section
-        'staff_override_flag': None,
-        'staff_approved_amount': None,
-        'staff_justification': '',
-        'staff_review_status': 'Pending',
-        'reviewed_by': None,
-        'reviewed_at': None,
-
         # Dependencies
         'depends_on': ['TD-LOSS-COMBINED-01'],
 
-        # Metadata
-        'is_primary': True,
-        'output_type': 'approved_amount',
-        'note': 'Reward only if actual loss < target loss',
-
         # Additional context
         'reward_details': {
             'approved_td_loss_pct': approved_td_loss_pct,
@@ -561,24 +656,128 @@ def heuristic_TD_REWARD_01(
     }
 
 
+# =============================================================================
+# BATCH EVALUATION: many DISCOMs / years in one NumPy pass
+# =============================================================================
+
+def heuristic_TD_LOSS_COMBINED_01_batch(
+    total_energy_input_mu,
+    total_energy_sold_mu,
+    myt_approved_td_loss_pct,
+    transmission_loss_mu=0.0,
+    distribution_loss_mu=0.0,
+    actual_td_loss_pct=0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized TD-LOSS-COMBINED-01 over 1-D arrays (one element per filing).
+
+    Same arithmetic and flag thresholds as heuristic_TD_LOSS_COMBINED_01.
+    Scalars broadcast against arrays. Returns a dict of arrays (no
+    calculation steps or recommendation text); call the scalar heuristic
+    for rows that need the full result dict.
+    """
+    (input_mu, sold_mu, approved_pct,
+     trans_mu, dist_mu, actual_pct) = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            total_energy_input_mu, total_energy_sold_mu, myt_approved_td_loss_pct,
+            transmission_loss_mu, distribution_loss_mu, actual_td_loss_pct))
+    )
+
+    # Rows without energy input keep their pre-computed loss %; only the
+    # rows with input go through the division, so no guard value is needed.
+    has_input = input_mu > 0
+    computed_td_loss_pct = actual_pct.copy()
+    computed_td_loss_pct[has_input] = _td_loss_pct_from_input(
+        input_mu[has_input], sold_mu[has_input]
+    )
+    variance_pp = computed_td_loss_pct - approved_pct
+
+    flag = np.take(_TD_FLAGS, np.searchsorted(_TD_THRESHOLDS, variance_pp, side='left'))
+
+    return {
+        'total_loss_mu': trans_mu + dist_mu,
+        'computed_td_loss_pct': computed_td_loss_pct,
+        'variance_pp': variance_pp,
+        'flag': flag,
+    }
+
+
+def heuristic_TD_REWARD_01_batch(
+    approved_td_loss_pct,
+    actual_td_loss_pct,
+    total_energy_input_mu,
+    avg_power_purchase_cost_per_unit,
+    utility_share_pct=50.0,
+    claimed_reward=0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized TD-REWARD-01 over 1-D arrays (one element per filing).
+
+    Same reward/penalty arithmetic and flags as heuristic_TD_REWARD_01.
+    Gain columns are zero for rows in the penalty zone and vice versa.
+    """
+    (approved_pct, actual_pct, input_mu, ppc,
+     share_pct, claimed) = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (
+            approved_td_loss_pct, actual_td_loss_pct, total_energy_input_mu,
+            avg_power_purchase_cost_per_unit, utility_share_pct, claimed_reward))
+    )
+
+    loss_reduction_pp = approved_pct - actual_pct
+    gain = loss_reduction_pp > 0
+
+    # Energy moved by the loss change (saved if gain, wasted if penalty)
+    energy_delta_mu = (np.abs(loss_reduction_pp) / 100) * input_mu
+    monetary_delta_cr = (energy_delta_mu * ppc) / 100  # MU × Rs/unit / 100 = Cr
+
+    energy_saved_mu = np.where(gain, energy_delta_mu, 0.0)
+    monetary_gain_cr = np.where(gain, monetary_delta_cr, 0.0)
+    utility_share_cr = monetary_gain_cr * share_pct / 100
+    allowable_reward = utility_share_cr
+    monetary_loss_cr = np.where(loss_reduction_pp < 0, monetary_delta_cr, 0.0)
+
+    flag = np.select([gain, loss_reduction_pp == 0], ['GREEN', 'YELLOW'], default='RED')
+
+    has_claim = claimed > 0
+    variance_abs = np.where(has_claim, claimed - allowable_reward, 0.0)
+    variance_pct = safe_pct_array(variance_abs, claimed)
+
+    return {
+        'loss_reduction_pp': loss_reduction_pp,
+        'energy_saved_mu': energy_saved_mu,
+        'monetary_gain_cr': monetary_gain_cr,
+        'utility_share_cr': utility_share_cr,
+        'monetary_loss_cr': monetary_loss_cr,
+        'allowable_reward': allowable_reward,
+        'variance_absolute': variance_abs,
+        'variance_percentage': variance_pct,
+        'flag': flag,
+    }
+
+
 # =============================================================================
 # FY 2023-24 DEFAULT PARAMETERS
 # =============================================================================
 
-FY_2023_24_TRANS_LOSS_DEFAULTS = {
+# Read-only views; copy with dict(...) before overriding individual values.
+FY_2023_24_TRANS_LOSS_DEFAULTS = MappingProxyType({
     'total_energy_input': 31406.32,
     'transmission_loss_mu': 819.23,
     'myt_approved_trans_loss_pct': 2.75,
     'peak_demand_mw': 5301,
-}
+})
 
-FY_2023_24_TD_REWARD_DEFAULTS = {
+FY_2023_24_TD_REWARD_DEFAULTS = MappingProxyType({
     'approved_td_loss_pct': 13.83,
     'actual_td_loss_pct': 12.10,
     'total_energy_input_mu': 31406.32,
     'avg_power_purchase_cost_per_unit': 4.50,
     'claimed_reward': 131.59,
-}
+})
+
+# Default-path calls with the FY 2023-24 kwargs bound once at import
+_TRANS_LOSS_FY_2023_24 = partial(heuristic_TRANS_LOSS_01, **FY_2023_24_TRANS_LOSS_DEFAULTS)
+_TD_REWARD_FY_2023_24 = partial(heuristic_TD_REWARD_01, **FY_2023_24_TD_REWARD_DEFAULTS)
 
 
 # =============================================================================
@@ -589,17 +788,27 @@ def run_all_td_loss_heuristics(
     trans_loss_params: Optional[Dict] = None,
     td_reward_params: Optional[Dict] = None,
 ) -> List[Dict]:
-    """Run all T&D loss heuristics and return results."""
+    """
+    Run all T&D loss heuristics and return results.
+
+    Evaluates one petition, so it calls the scalar heuristics and returns
+    full result dicts. heuristic_TD_REWARD_01_batch is for scenario
+    sweeps over many parameter sets and is called directly.
+    """
 
     results = []
 
     # 1. Transmission Loss
-    tp = trans_loss_params or FY_2023_24_TRANS_LOSS_DEFAULTS
-    results.append(heuristic_TRANS_LOSS_01(**tp))
+    if trans_loss_params:
+        results.append(heuristic_TRANS_LOSS_01(**trans_loss_params))
+    else:
+        results.append(_TRANS_LOSS_FY_2023_24())
 
     # 2. T&D Reward
-    rp = td_reward_params or FY_2023_24_TD_REWARD_DEFAULTS
-    results.append(heuristic_TD_REWARD_01(**rp))
+    if td_reward_params:
+        results.append(heuristic_TD_REWARD_01(**td_reward_params))
+    else:
+        results.append(_TD_REWARD_FY_2023_24())
 
     return results
 
@@ -609,9 +818,12 @@ if __name__ == "__main__":
     print("T&D LOSS HEURISTICS - FY 2023-24 Evaluation")
     print("=" * 80)
 
+    flag_idx = {flag: i for i, flag in enumerate(_TD_FLAGS)}
+    flag_emojis = ('🟢', '🟡', '🔴')
+
     results = run_all_td_loss_heuristics()
     for r in results:
-        flag_emoji = {'GREEN': '🟢', 'YELLOW': '🟡', 'RED': '🔴'}[r['flag']]
+        flag_emoji = flag_emojis[flag_idx[r['flag']]]
         print(f"\n{flag_emoji} {r['heuristic_id']}: {r['heuristic_name']}")
         print(f"   Claimed: {r['claimed_value']} | Allowable: {r['allowable_value']}")
         print(f"   Flag: {r['flag']} | Primary: {r['is_primary']}")